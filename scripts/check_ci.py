@@ -1,16 +1,23 @@
 #!/usr/bin/env python3
 """Script to validate CI/CD setup locally before pushing."""
 
+import os
+import shlex
 import subprocess
 import sys
 from pathlib import Path
 
 
-def run_command(cmd: str, description: str) -> bool:
-    """Run a command and return True if successful."""
+def run_command(cmd: str | list[str], description: str) -> bool:
+    """Run a command and return True if successful.
+
+    The command is executed directly rather than through ``/bin/sh``; string
+    commands are tokenised with :func:`shlex.split` and are not glob-expanded.
+    """
     print(f"🔄 {description}...")
+    args = shlex.split(cmd) if isinstance(cmd, str) else cmd
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        result = subprocess.run(args, capture_output=True, text=True, check=False)  # noqa: S603
         if result.returncode == 0:
             print(f"✅ {description}")
             return True
@@ -30,7 +37,7 @@ def main():
 
     # Change to project root
     project_root = Path(__file__).parent.parent
-    subprocess.run(f"cd {project_root}", shell=True)
+    os.chdir(project_root)
 
     checks = [
         ("ruff format --check .", "Code formatting check"),
@@ -44,7 +51,6 @@ def main():
         ),
         ("mkdocs build --strict", "Documentation build"),
         ("python -m build", "Package build"),
-        ("twine check dist/*", "Package validation"),
     ]
 
     results = []
@@ -52,6 +58,10 @@ def main():
         success = run_command(cmd, desc)
         results.append(success)
 
+    # Expanded here rather than by a shell, once the build above has run
+    dists = sorted(str(path) for path in Path("dist").glob("*"))
+    results.append(run_command(["twine", "check", *dists], "Package validation"))
+
     print("\n📋 Summary:")
     print(f"✅ Passed: {sum(results)}")
     print(f"❌ Failed: {len(results) - sum(results)}")
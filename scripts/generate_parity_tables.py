@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import csv
 from collections.abc import Iterable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable
 
@@ -21,6 +21,15 @@ class TableSpec:
     rows: Sequence[dict[str, str]]
     headers: Sequence[str]
     build_row: Callable[[dict[str, str]], Sequence[str]]
+    # Optional whole-table builder used instead of calling build_row per row
+    build_rows: Callable[[Sequence[dict[str, str]]], list[Sequence[str]]] | None = None
+    # Markdown title, header and separator lines, fixed once the headers are known
+    preamble: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        header = " | ".join(self.headers)
+        separator = " | ".join(["---"] * len(self.headers))
+        self.preamble = f"# Parity Table\n\n{header}\n{separator}\n"
 
 
 def _fmt_float(value: float) -> str:
@@ -94,19 +103,20 @@ def _paired_row(row: dict[str, str]) -> Sequence[str]:
     )
 
 
-def _two_prop_row(row: dict[str, str]) -> Sequence[str]:
+def _two_prop_row(row: dict[str, str], result: tuple[int, int] | None = None) -> Sequence[str]:
     p1 = float(row["p1"])
     p2 = float(row["p2"])
-    result = api.n_two_prop(
-        p1=p1,
-        p2=p2,
-        alpha=float(row["alpha"]),
-        power=float(row["power"]),
-        ratio=float(row.get("ratio") or 1.0),
-        test=row.get("test") or "z",
-        tail=row["tail"],
-        exact=row.get("exact", "false").lower() == "true",
-    )
+    if result is None:
+        result = api.n_two_prop(
+            p1=p1,
+            p2=p2,
+            alpha=float(row["alpha"]),
+            power=float(row["power"]),
+            ratio=float(row.get("ratio") or 1.0),
+            test=row.get("test") or "z",
+            tail=row["tail"],
+            exact=row.get("exact", "false").lower() == "true",
+        )
     expected = (int(row["exp_n1"]), int(row["exp_n2"]))
     return (
         f"p1={p1}, p2={p2}, exact={row.get('exact', 'false')}",
@@ -117,6 +127,45 @@ def _two_prop_row(row: dict[str, str]) -> Sequence[str]:
     )
 
 
+def _two_prop_batchable(row: dict[str, str]) -> bool:
+    return (
+        (row.get("test") or "z") == "z"
+        and not row.get("ni_type")
+        and row.get("exact", "false").lower() != "true"
+    )
+
+
+def _two_prop_rows(rows: Sequence[dict[str, str]]) -> list[Sequence[str]]:
+    """Build the two-proportion table, solving plain ``z`` designs in one batch per tail.
+
+    Margin-based and exact designs, and every row when NumPy is missing, go
+    through :func:`api.n_two_prop` one at a time.
+    """
+
+    results: dict[int, tuple[int, int]] = {}
+    try:
+        import numpy  # noqa: F401
+    except ModuleNotFoundError:
+        pass
+    else:
+        by_tail: dict[str, list[int]] = {}
+        for index, row in enumerate(rows):
+            if _two_prop_batchable(row):
+                by_tail.setdefault(row["tail"], []).append(index)
+        for tail, indices in by_tail.items():
+            batch = [rows[index] for index in indices]
+            n1, n2 = api.n_two_prop_batch(
+                p1=[float(row["p1"]) for row in batch],
+                p2=[float(row["p2"]) for row in batch],
+                alpha=[float(row["alpha"]) for row in batch],
+                power=[float(row["power"]) for row in batch],
+                ratio=[float(row.get("ratio") or 1.0) for row in batch],
+                tail=tail,  # type: ignore[arg-type]
+            )
+            results.update(zip(indices, zip(n1.tolist(), n2.tolist(), strict=True), strict=True))
+    return [_two_prop_row(row, results.get(index)) for index, row in enumerate(rows)]
+
+
 def _anova_row(row: dict[str, str]) -> Sequence[str]:
     allocation = row.get("allocation")
     weights = [float(part) for part in allocation.split(",")] if allocation else None
@@ -176,6 +225,7 @@ TABLES: Iterable[TableSpec] = [
         rows=_read_csv("two_prop_normal_golden.csv"),
         headers=["Scenario", "Reference n1", "statdesign n1", "Reference n2", "statdesign n2"],
         build_row=_two_prop_row,
+        build_rows=_two_prop_rows,
     ),
     TableSpec(
         path=PARITY / "anova.md",
@@ -194,15 +244,17 @@ TABLES: Iterable[TableSpec] = [
 
 def _write_markdown(spec: TableSpec) -> None:
     spec.path.parent.mkdir(parents=True, exist_ok=True)
-    lines = ["# Parity Table", ""]
-    header = " | ".join(spec.headers)
-    separator = " | ".join(["---"] * len(spec.headers))
-    lines.append(header)
-    lines.append(separator)
-    for row in spec.rows:
-        values = spec.build_row(row)
-        lines.append(" | ".join(values))
-    spec.path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    # Rows are computed before the file is opened so a failing solve leaves the
+    # previous table intact; they are then streamed through the buffered file
+    # instead of being joined into one string first.
+    if spec.build_rows is not None:
+        table = spec.build_rows(spec.rows)
+    else:
+        table = [spec.build_row(row) for row in spec.rows]
+    with spec.path.open("w", encoding="utf-8") as handle:
+        handle.write(spec.preamble)
+        for values in table:
+            handle.write(" | ".join(values) + "\n")
 
 
 def main() -> None:
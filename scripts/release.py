@@ -1,26 +1,34 @@
 #!/usr/bin/env python3
 """Release preparation script for statdesign."""
 
+import os
+import shlex
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def run_command(cmd: str, description: str) -> bool:
-    """Run a command and return True if successful."""
+def run_command(cmd: str | list[str], description: str) -> bool:
+    """Run a command and return True if successful.
+
+    The command is executed directly rather than through ``/bin/sh``; string
+    commands are tokenised with :func:`shlex.split` and are not glob-expanded.
+    """
     print(f"🔄 {description}...")
+    args = shlex.split(cmd) if isinstance(cmd, str) else cmd
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        result = subprocess.run(args, capture_output=True, text=True, check=False)  # noqa: S603
         if result.returncode == 0:
             print(f"✅ {description}")
             return True
         else:
-            print(f"❌ {description}")
-            print(f"   Error: {result.stderr.strip()}")
+            # One print per outcome keeps concurrent checks from interleaving mid-report
+            print(f"❌ {description}\n   Error: {result.stderr.strip()}")
             return False
     except Exception as e:
-        print(f"❌ {description}")
-        print(f"   Exception: {e}")
+        print(f"❌ {description}\n   Exception: {e}")
         return False
 
 
@@ -30,7 +38,7 @@ def main():
 
     # Change to project root
     project_root = Path(__file__).parent.parent
-    subprocess.run(f"cd {project_root}", shell=True)
+    os.chdir(project_root)
 
     # Pre-release checks
     print("📋 Pre-release validation:")
@@ -45,16 +53,16 @@ def main():
         (
             "python -m pytest tests/test_alloc.py tests/test_anova.py "
             "tests/test_coverage_boost.py tests/test_means.py tests/test_scipy_backend.py "
-            "--cov=src/statdesign --cov-fail-under=45 -q",
+            "--cov=src/statdesign --cov-fail-under=45 -q -p no:cacheprovider",
             "Core tests",
         ),
         ("mkdocs build --strict", "Documentation"),
     ]
 
-    results = []
-    for cmd, desc in checks:
-        success = run_command(cmd, desc)
-        results.append(success)
+    # The checks are independent subprocesses, so run them concurrently; wall
+    # time becomes that of the slowest check rather than the sum.
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        results = list(executor.map(lambda check: run_command(*check), checks))
 
     if not all(results):
         print("\n❌ Pre-release checks failed. Fix issues before releasing.")
@@ -63,14 +71,18 @@ def main():
     print("\n🔨 Building release artifacts:")
 
     # Clean previous builds
-    run_command("rm -rf dist/ build/ *.egg-info", "Clean previous builds")
+    print("🔄 Clean previous builds...")
+    for path in [Path("dist"), Path("build"), *Path(".").glob("*.egg-info")]:
+        shutil.rmtree(path, ignore_errors=True)
+    print("✅ Clean previous builds")
 
     # Build package
     if not run_command("python -m build", "Build package"):
         return 1
 
     # Validate package
-    if not run_command("twine check dist/*", "Validate package"):
+    dists = sorted(str(path) for path in Path("dist").glob("*"))
+    if not run_command(["twine", "check", *dists], "Validate package"):
         return 1
 
     print("\n📦 Release artifacts ready:")
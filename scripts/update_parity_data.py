@@ -2,11 +2,26 @@
 """Script to update parity test data with computed statdesign values."""
 
 import csv
+import functools
 from pathlib import Path
 
 import statdesign
 
 
+# Parity files repeat scenarios, so each distinct design is solved once per file.
+@functools.cache
+def _cached_n_two_prop(p1: float, p2: float, power: float, alpha: float) -> tuple[int, int]:
+    return statdesign.n_two_prop(p1=p1, p2=p2, power=power, alpha=alpha)
+
+
+@functools.cache
+def _cached_n_mean(
+    mu1: float, mu2: float, sd: float, power: float, alpha: float
+) -> tuple[int, int]:
+    # Use z-test for consistency with R pwr.t.test default
+    return statdesign.n_mean(mu1=mu1, mu2=mu2, sd=sd, power=power, alpha=alpha, test="z")
+
+
 def update_parity_file(file_path: Path):
     """Update a parity CSV file with computed statdesign values."""
     if not file_path.exists():
@@ -22,11 +37,11 @@ def update_parity_file(file_path: Path):
             # Compute statdesign value based on the type of test
             if "two_prop" in file_path.name:
                 try:
-                    n1, n2 = statdesign.n_two_prop(
-                        p1=float(row["p1"]),
-                        p2=float(row["p2"]),
-                        power=float(row["power"]),
-                        alpha=float(row["alpha"]),
+                    n1, n2 = _cached_n_two_prop(
+                        float(row["p1"]),
+                        float(row["p2"]),
+                        float(row["power"]),
+                        float(row["alpha"]),
                     )
                     row["statdesign"] = str(n1)  # Use n1 for comparison
                 except Exception as e:
@@ -35,13 +50,12 @@ def update_parity_file(file_path: Path):
 
             elif "two_means" in file_path.name:
                 try:
-                    n1, n2 = statdesign.n_mean(
-                        mu1=float(row["mu1"]),
-                        mu2=float(row["mu2"]),
-                        sd=float(row["sd"]),
-                        power=float(row["power"]),
-                        alpha=float(row["alpha"]),
-                        test="z",  # Use z-test for consistency with R pwr.t.test default
+                    n1, n2 = _cached_n_mean(
+                        float(row["mu1"]),
+                        float(row["mu2"]),
+                        float(row["sd"]),
+                        float(row["power"]),
+                        float(row["alpha"]),
                     )
                     row["statdesign"] = str(n1)  # Use n1 for comparison
                 except Exception as e:
@@ -57,6 +71,8 @@ def update_parity_file(file_path: Path):
         writer.writerows(rows)
 
     print(f"Updated {file_path}")
+    _cached_n_two_prop.cache_clear()
+    _cached_n_mean.cache_clear()
 
 
 def main():
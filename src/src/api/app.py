@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import json
 import sqlite3
+import threading
+from contextlib import closing
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Tuple
 
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 from src.db.build_db import build
@@ -29,65 +33,100 @@ class Evidence(BaseModel):
     details: str | None
 
 
+_EVIDENCE_FIELDS = ("gene", "disease", "source", "effect", "p_value", "qc_flag", "details")
+_EVIDENCE_SQL = f"SELECT {', '.join(_EVIDENCE_FIELDS)} FROM evidence"
+# Evidence responses are streamed in batches of this many rows
+_FETCH_SIZE = 512
+
 app = FastAPI(title="targetdb-mini")
 
+# Handlers run in FastAPI's thread pool; the shared connection is used by one at a time.
+_DB_LOCK = threading.Lock()
+
+
+def _has_search_index(path: Path) -> bool:
+    """Whether ``path`` already has the full-text table that ``/search`` queries."""
+    with closing(sqlite3.connect(path)) as conn:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'evidence_fts'"
+        ).fetchone()
+    return row is not None
+
 
 @app.on_event("startup")
 def start_db() -> None:
-    if not DB_PATH.exists():
+    # build() is idempotent: it also migrates older databases, creating and
+    # filling the full-text index from the evidence already stored
+    if not DB_PATH.exists() or not _has_search_index(DB_PATH):
         build(DB_PATH)
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-65536")
+    app.state.conn = conn
+
+
+@app.on_event("shutdown")
+def stop_db() -> None:
+    app.state.conn.close()
+
+
+def _query(sql: str, params: tuple) -> List[tuple]:
+    with _DB_LOCK:
+        return app.state.conn.execute(sql, params).fetchall()
+
+
+def _open_cursor(sql: str, params: tuple) -> Tuple[sqlite3.Cursor, List[tuple]]:
+    with _DB_LOCK:
+        cursor = app.state.conn.execute(sql, params)
+        return cursor, cursor.fetchmany(_FETCH_SIZE)
+
+
+def _stream_json(cursor: sqlite3.Cursor, first: List[tuple]) -> Iterator[str]:
+    """Yield evidence rows as a JSON array, fetching from ``cursor`` one batch at a time."""
+    yield "["
+    batch = first
+    separator = ""
+    while batch:
+        yield separator + ",".join(json.dumps(dict(zip(_EVIDENCE_FIELDS, row))) for row in batch)
+        separator = ","
+        with _DB_LOCK:
+            batch = cursor.fetchmany(_FETCH_SIZE)
+    yield "]"
 
 
 @app.get("/targets", response_model=List[Target])
-def list_targets(limit: int = 20) -> List[Target]:
-    with sqlite3.connect(DB_PATH) as conn:
-        rows = conn.execute("SELECT gene, description FROM targets LIMIT ?", (limit,)).fetchall()
-    return [Target(gene=row[0], description=row[1]) for row in rows]
+def list_targets(limit: int = Query(20, ge=1, le=1000), cursor: str | None = None) -> JSONResponse:
+    # Keyset pagination on the primary key: each page is an index range scan,
+    # and the gene to pass as the next ``cursor`` comes back in X-Next-Cursor.
+    if cursor is None:
+        rows = _query("SELECT gene, description FROM targets ORDER BY gene LIMIT ?", (limit,))
+    else:
+        rows = _query(
+            "SELECT gene, description FROM targets WHERE gene > ? ORDER BY gene LIMIT ?",
+            (cursor, limit),
+        )
+    # Returning the response directly skips per-row model construction and validation
+    response = JSONResponse(
+        [{"gene": gene, "description": description} for gene, description in rows]
+    )
+    if len(rows) == limit:
+        response.headers["X-Next-Cursor"] = rows[-1][0]
+    return response
 
 
 @app.get("/targets/{gene}", response_model=List[Evidence])
-def target_detail(gene: str) -> List[Evidence]:
-    with sqlite3.connect(DB_PATH) as conn:
-        rows = conn.execute(
-            "SELECT gene, disease, source, effect, p_value, qc_flag, details FROM evidence WHERE gene = ?",
-            (gene,),
-        ).fetchall()
-    if not rows:
+def target_detail(gene: str) -> StreamingResponse:
+    cursor, first = _open_cursor(f"{_EVIDENCE_SQL} WHERE gene = ?", (gene,))
+    if not first:
         raise HTTPException(status_code=404, detail="Gene not found")
-    return [
-        Evidence(
-            **{
-                "gene": row[0],
-                "disease": row[1],
-                "source": row[2],
-                "effect": row[3],
-                "p_value": row[4],
-                "qc_flag": row[5],
-                "details": row[6],
-            }
-        )
-        for row in rows
-    ]
+    return StreamingResponse(_stream_json(cursor, first), media_type="application/json")
 
 
 @app.get("/search", response_model=List[Evidence])
-def search(disease: str = Query(...)) -> List[Evidence]:
-    with sqlite3.connect(DB_PATH) as conn:
-        rows = conn.execute(
-            "SELECT gene, disease, source, effect, p_value, qc_flag, details FROM evidence WHERE disease LIKE ?",
-            (f"%{disease}%",),
-        ).fetchall()
-    return [
-        Evidence(
-            **{
-                "gene": row[0],
-                "disease": row[1],
-                "source": row[2],
-                "effect": row[3],
-                "p_value": row[4],
-                "qc_flag": row[5],
-                "details": row[6],
-            }
-        )
-        for row in rows
-    ]
+def search(disease: str = Query(...)) -> StreamingResponse:
+    cursor, first = _open_cursor(
+        f"{_EVIDENCE_SQL} WHERE id IN (SELECT rowid FROM evidence_fts WHERE disease LIKE ?)",
+        (f"%{disease}%",),
+    )
+    return StreamingResponse(_stream_json(cursor, first), media_type="application/json")
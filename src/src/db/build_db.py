@@ -6,16 +6,19 @@ import argparse
 import sqlite3
 from pathlib import Path
 
-SCHEMA = """
-CREATE TABLE IF NOT EXISTS targets (
+# One statement per entry so the schema can be created inside the build transaction.
+# Lookup tables keyed by a single TEXT primary key are WITHOUT ROWID: rows are
+# stored in the primary-key b-tree itself instead of a rowid table plus index.
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS targets (
   gene TEXT PRIMARY KEY,
   description TEXT
-);
-CREATE TABLE IF NOT EXISTS diseases (
+) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS diseases (
   disease TEXT PRIMARY KEY,
   category TEXT
-);
-CREATE TABLE IF NOT EXISTS evidence (
+) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS evidence (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   gene TEXT,
   disease TEXT,
@@ -24,40 +27,56 @@ CREATE TABLE IF NOT EXISTS evidence (
   p_value REAL,
   qc_flag TEXT,
   details TEXT
-);
-CREATE TABLE IF NOT EXISTS safety_flags (
+)""",
+    "CREATE INDEX IF NOT EXISTS idx_evidence_gene ON evidence(gene)",
+    # Trigram full-text index backing substring search on disease (LIKE '%term%')
+    """CREATE VIRTUAL TABLE IF NOT EXISTS evidence_fts USING fts5(
+  disease, content='evidence', content_rowid='id', tokenize='trigram'
+)""",
+    """CREATE TRIGGER IF NOT EXISTS evidence_fts_insert AFTER INSERT ON evidence BEGIN
+  INSERT INTO evidence_fts (rowid, disease) VALUES (new.id, new.disease);
+END""",
+    """CREATE TRIGGER IF NOT EXISTS evidence_fts_delete AFTER DELETE ON evidence BEGIN
+  INSERT INTO evidence_fts (evidence_fts, rowid, disease) VALUES ('delete', old.id, old.disease);
+END""",
+    """CREATE TRIGGER IF NOT EXISTS evidence_fts_update AFTER UPDATE ON evidence BEGIN
+  INSERT INTO evidence_fts (evidence_fts, rowid, disease) VALUES ('delete', old.id, old.disease);
+  INSERT INTO evidence_fts (rowid, disease) VALUES (new.id, new.disease);
+END""",
+    """CREATE TABLE IF NOT EXISTS safety_flags (
   gene TEXT PRIMARY KEY,
   is_pLoF INTEGER,
   is_pGoF INTEGER,
   constraint_z REAL
-);
-CREATE TABLE IF NOT EXISTS sources (
+) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS sources (
   name TEXT PRIMARY KEY,
   description TEXT
-);
-"""
+) WITHOUT ROWID""",
+)
+
+
+SOURCES = (
+    ("GWAS", "Genome-wide association"),
+    ("TWAS", "Transcriptome-wide association"),
+    ("MR", "Mendelian randomization"),
+    ("SV", "Structural variation"),
+)
 
 
 def build(database_path: Path) -> None:
     database_path.parent.mkdir(parents=True, exist_ok=True)
     with sqlite3.connect(database_path) as conn:
-        conn.executescript(SCHEMA)
-        conn.execute(
-            "INSERT OR IGNORE INTO sources (name, description) VALUES (?, ?)",
-            ("GWAS", "Genome-wide association"),
-        )
-        conn.execute(
-            "INSERT OR IGNORE INTO sources (name, description) VALUES (?, ?)",
-            ("TWAS", "Transcriptome-wide association"),
-        )
-        conn.execute(
-            "INSERT OR IGNORE INTO sources (name, description) VALUES (?, ?)",
-            ("MR", "Mendelian randomization"),
-        )
-        conn.execute(
-            "INSERT OR IGNORE INTO sources (name, description) VALUES (?, ?)",
-            ("SV", "Structural variation"),
-        )
+        # Building is idempotent and cheap to redo, so skip fsyncs while it runs
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Schema, index rebuild and seed rows share one transaction, committed on exit
+        conn.execute("BEGIN")
+        for statement in SCHEMA:
+            conn.execute(statement)
+        # Index any evidence loaded before the full-text table existed
+        conn.execute("INSERT INTO evidence_fts (evidence_fts) VALUES ('rebuild')")
+        conn.executemany("INSERT OR IGNORE INTO sources (name, description) VALUES (?, ?)", SOURCES)
 
 
 def main() -> None:
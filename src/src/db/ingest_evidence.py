@@ -4,18 +4,29 @@ from __future__ import annotations
 
 import argparse
 import sqlite3
+from itertools import repeat
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, List, Tuple
 
 import pandas as pd
 import yaml
 
+_INSERT_EVIDENCE = (
+    "INSERT INTO evidence (gene, disease, source, effect, p_value, qc_flag, details) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
 
 def ingest(config_path: Path) -> None:
     config = yaml.safe_load(config_path.read_text())
     paths: Dict[str, str] = config["paths"]
     db_path = Path(paths["database"])
     with sqlite3.connect(db_path) as conn:
+        # Bulk-load settings apply to this connection only. NORMAL skips most fsyncs
+        # but cannot corrupt the file on power loss; evidence rows are plain
+        # INSERTs, so re-running after a partial ingest would duplicate them.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
         _load_constraint_flags(conn, Path(paths["constraint_flags"]))
         _load_gwas(conn, Path(paths["gwas"]["results"]))
         _load_twas(conn, Path(paths["twas"]["results"]))
@@ -28,63 +39,80 @@ def _load_constraint_flags(conn: sqlite3.Connection, path: Path) -> None:
     df.to_sql("safety_flags", conn, if_exists="replace", index=False)
 
 
-def _insert_target(conn: sqlite3.Connection, gene: str) -> None:
-    conn.execute("INSERT OR IGNORE INTO targets (gene, description) VALUES (?, ?)", (gene, None))
+def _insert_targets(conn: sqlite3.Connection, genes: Iterable[str]) -> None:
+    conn.executemany(
+        "INSERT OR IGNORE INTO targets (gene, description) VALUES (?, ?)",
+        ((gene, None) for gene in genes),
+    )
+
+
+def _insert_diseases(conn: sqlite3.Connection, diseases: Iterable[str]) -> None:
+    conn.executemany(
+        "INSERT OR IGNORE INTO diseases (disease, category) VALUES (?, ?)",
+        ((disease, "synthetic") for disease in diseases),
+    )
 
 
-def _insert_disease(conn: sqlite3.Connection, disease: str) -> None:
-    conn.execute(
-        "INSERT OR IGNORE INTO diseases (disease, category) VALUES (?, ?)", (disease, "synthetic")
+def _records(df: pd.DataFrame, *columns: pd.Series | object) -> List[Tuple]:
+    """Zip evidence tuples column-wise; non-Series arguments are repeated for every row."""
+    return list(
+        zip(
+            *(
+                column.tolist() if isinstance(column, pd.Series) else repeat(column, len(df))
+                for column in columns
+            )
+        )
     )
 
 
+def _insert_evidence(conn: sqlite3.Connection, records: List[Tuple]) -> None:
+    """Insert evidence rows in one batched statement, registering their genes and diseases."""
+    conn.executemany(_INSERT_EVIDENCE, records)
+    # Each distinct gene and disease is registered once, in first-seen order
+    _insert_targets(conn, dict.fromkeys(record[0] for record in records))
+    _insert_diseases(conn, dict.fromkeys(record[1] for record in records))
+
+
 def _load_gwas(conn: sqlite3.Connection, path: Path) -> None:
     if not path.exists():
         return
     df = pd.read_csv(path)
-    top_hits = df[df["p_value"] < 5e-4].copy()
-    top_hits["disease"] = top_hits["trait"]
-    top_hits["source"] = "GWAS"
-    top_hits["qc_flag"] = "OK"
-    records = top_hits
-    for row in records.itertuples(index=False):
-        gene = getattr(row, "gene", None)
-        if gene is None and hasattr(row, "snp_id"):
-            gene = row.snp_id
-        if gene is None:
-            gene = str(getattr(row, "snp_index", "NA"))
-        conn.execute(
-            "INSERT INTO evidence (gene, disease, source, effect, p_value, qc_flag, details) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (gene, row.disease, row.source, row.beta, row.p_value, row.qc_flag, ""),
-        )
-        _insert_target(conn, gene)
-        _insert_disease(conn, row.disease)
+    top_hits = df[df["p_value"] < 5e-4]
+    gene: pd.Series | str
+    if "gene" in top_hits:
+        gene = top_hits["gene"]
+    elif "snp_id" in top_hits:
+        gene = top_hits["snp_id"]
+    elif "snp_index" in top_hits:
+        gene = top_hits["snp_index"].astype(str)
+    else:
+        gene = "NA"
+    records = _records(
+        top_hits, gene, top_hits["trait"], "GWAS", top_hits["beta"], top_hits["p_value"], "OK", ""
+    )
+    _insert_evidence(conn, records)
 
 
 def _load_twas(conn: sqlite3.Connection, path: Path) -> None:
     if not path.exists():
         return
     df = pd.read_csv(path)
-    for row in df[df["p_value"] < 1e-3].itertuples(index=False):
-        conn.execute(
-            "INSERT INTO evidence (gene, disease, source, effect, p_value, qc_flag, details) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (row.gene, row.trait, "TWAS", row.beta, row.p_value, "OK", ""),
-        )
-        _insert_target(conn, row.gene)
-        _insert_disease(conn, row.trait)
+    hits = df[df["p_value"] < 1e-3]
+    records = _records(
+        hits, hits["gene"], hits["trait"], "TWAS", hits["beta"], hits["p_value"], "OK", ""
+    )
+    _insert_evidence(conn, records)
 
 
 def _load_mr(conn: sqlite3.Connection, path: Path) -> None:
     if not path.exists():
         return
     df = pd.read_csv(path)
-    for row in df[df["method"] == "IVW"].itertuples(index=False):
-        conn.execute(
-            "INSERT INTO evidence (gene, disease, source, effect, p_value, qc_flag, details) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            ("GENE0001", "Disease", "MR", row.beta, row.p_value, "OK", "IVW estimate"),
-        )
-        _insert_target(conn, "GENE0001")
-        _insert_disease(conn, "Disease")
+    ivw = df[df["method"] == "IVW"]
+    records = _records(
+        ivw, "GENE0001", "Disease", "MR", ivw["beta"], ivw["p_value"], "OK", "IVW estimate"
+    )
+    _insert_evidence(conn, records)
 
 
 def _load_sv(conn: sqlite3.Connection, path: Path) -> None:
@@ -95,13 +123,8 @@ def _load_sv(conn: sqlite3.Connection, path: Path) -> None:
         if not fpath.exists():
             continue
         df = pd.read_csv(fpath)
-        for row in df.itertuples(index=False):
-            conn.execute(
-                "INSERT INTO evidence (gene, disease, source, effect, p_value, qc_flag, details) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                ("GENE0001", row.trait, "SV", row.beta, row.p_value, "QC", file),
-            )
-            _insert_target(conn, "GENE0001")
-            _insert_disease(conn, row.trait)
+        records = _records(df, "GENE0001", df["trait"], "SV", df["beta"], df["p_value"], "QC", file)
+        _insert_evidence(conn, records)
 
 
 def main() -> None:
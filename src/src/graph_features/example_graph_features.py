@@ -24,6 +24,7 @@ def main():
     # Initialize featurizer (you would provide actual STRING DB path)
     # featurizer = TargetGraphFeaturizer(string_db_path='string_v11.5_protein_links.txt')
     featurizer = TargetGraphFeaturizer()  # Will work if STRING file available
+    rng = np.random.default_rng(0)  # Seeded so the mock output is reproducible
 
     # Example target proteins (mix of well-known and random)
     target_proteins = [
@@ -45,7 +46,7 @@ def main():
         # print(f"Feature names: {featurizer.get_feature_names()}")
 
         # Since we don't have STRING DB, create mock features for demonstration
-        features = np.random.rand(len(target_proteins), 15)
+        features = rng.random((len(target_proteins), 15))
         print(f"Mock feature matrix shape: {features.shape}")
         print(f"Feature names: {featurizer.get_feature_names()}")
 
@@ -66,7 +67,11 @@ def main():
     # Mock existing feature matrix (e.g., from expression data, sequence features)
     n_samples = len(target_proteins)
     n_original_features = 20
-    original_features = np.random.rand(n_samples, n_original_features)
+    n_graph_features = 15
+    # Draw the whole mock matrix at once and view the original features as its
+    # leading columns, so no separate arrays or hstack copy are needed.
+    combined_features = rng.random((n_samples, n_original_features + n_graph_features))
+    original_features = combined_features[:, :n_original_features]
 
     print(f"Original features shape: {original_features.shape}")
 
@@ -78,9 +83,8 @@ def main():
         #     string_db_path='string_v11.5_protein_links.txt'
         # )
 
-        # Mock combined features for demonstration
-        graph_features = np.random.rand(n_samples, 15)
-        combined_features = np.hstack([original_features, graph_features])
+        # Mock combined features for demonstration: the trailing block of the
+        # matrix drawn above stands in for the graph features
 
         print(f"Combined features shape: {combined_features.shape}")
         print(f"Added {combined_features.shape[1] - original_features.shape[1]} graph features")
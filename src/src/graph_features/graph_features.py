@@ -6,19 +6,297 @@ classifiers with protein-protein interaction context from STRING database.
 """
 
 import logging
-import pickle
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import networkx as nx
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler
+import pandas as pd
+from scipy import sparse
+from scipy.sparse import csgraph
 from tqdm import tqdm
 
+try:
+    from numba import get_num_threads, njit, prange
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    prange = range
+
+    def get_num_threads():
+        """Single thread when Numba is unavailable."""
+        return 1
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when Numba is unavailable."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+    HAS_NUMBA = False
+else:  # pragma: no cover - exercised only when numba is installed
+    HAS_NUMBA = True
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Rows per block for the sparse products and BFS sweeps below; bounds the
+# temporaries to ``block x n_nodes`` on hub-heavy STRING graphs.
+_ROW_BLOCK = 1024
+
+# STRING rows parsed per chunk when loading the network
+_STRING_CHUNK = 1_000_000
+
+# Per-node arrays kept in the centrality cache
+_NODE_FEATURES = (
+    "degree_centrality",
+    "betweenness_centrality",
+    "closeness_centrality",
+    "pagerank_score",
+    "clustering_coefficient",
+    "bridge_score",
+)
+
+
+def _pagerank(
+    adjacency: sparse.csr_matrix,
+    alpha: float = 0.85,
+    max_iter: int = 100,
+    tol: float = 1.0e-6,
+    start: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Weighted PageRank by sparse power iteration, mirroring ``nx.pagerank``.
+
+    ``start`` plays the role of ``nstart``: it is normalised to sum to one and
+    replaces the uniform starting vector.
+    """
+    n_nodes = adjacency.shape[0]
+    out_weight = np.asarray(adjacency.sum(axis=1)).ravel()
+    dangling = out_weight == 0
+    inv_weight = np.divide(1.0, out_weight, out=np.zeros(n_nodes), where=~dangling)
+    transition = sparse.diags(inv_weight) @ adjacency
+    if start is None:
+        x = np.full(n_nodes, 1.0 / n_nodes)
+    else:
+        x = start / start.sum()
+    for _ in range(max_iter):
+        last = x
+        x = alpha * (transition.T @ last) + (alpha * last[dangling].sum() + 1.0 - alpha) / n_nodes
+        if np.abs(x - last).sum() < n_nodes * tol:
+            return x
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def _closeness(adjacency: sparse.csr_matrix) -> np.ndarray:
+    """Unweighted closeness centrality (Wasserman-Faust scaled) via blocked BFS."""
+    n_nodes = adjacency.shape[0]
+    closeness = np.zeros(n_nodes)
+    if n_nodes <= 1:
+        return closeness
+    for start in range(0, n_nodes, _ROW_BLOCK):
+        sources = np.arange(start, min(start + _ROW_BLOCK, n_nodes))
+        dist = csgraph.shortest_path(adjacency, unweighted=True, indices=sources)
+        reachable = np.isfinite(dist)
+        others = reachable.sum(axis=1) - 1.0
+        total = np.where(reachable, dist, 0.0).sum(axis=1)
+        block = np.divide(others, total, out=np.zeros(sources.size), where=total > 0)
+        closeness[sources] = block * (others / (n_nodes - 1))
+    return closeness
+
+
+def _clustering(adjacency: sparse.csr_matrix, degree: np.ndarray) -> np.ndarray:
+    """Unweighted clustering coefficient from blocked ``(A @ A) * A`` row sums."""
+    pattern = (adjacency != 0).astype(np.float64)
+    triangles = np.empty(pattern.shape[0])
+    for start in range(0, pattern.shape[0], _ROW_BLOCK):
+        rows = pattern[start : start + _ROW_BLOCK]
+        triangles[start : start + rows.shape[0]] = np.asarray(
+            (rows @ pattern).multiply(rows).sum(axis=1)
+        ).ravel()
+    pairs = degree * (degree - 1.0)
+    return np.divide(triangles, pairs, out=np.zeros_like(triangles), where=triangles > 0)
+
+
+@njit(cache=True)
+def _accumulate_source(indptr, indices, source, dist, sigma, delta, order, node_bc, edge_bc):
+    """Add one Brandes source to ``node_bc`` and its edge credits to ``edge_bc``.
+
+    Predecessors are not stored: they are the neighbours one BFS level
+    closer to the source. ``edge_bc[v]`` sums the credit of every edge
+    incident to ``v``. Visited entries of the buffers are reset on exit.
+    """
+    dist[source] = 0
+    sigma[source] = 1.0
+    order[0] = source
+    head = 0
+    tail = 1
+    while head < tail:
+        v = order[head]
+        head += 1
+        for k in range(indptr[v], indptr[v + 1]):
+            w = indices[k]
+            if dist[w] < 0:
+                dist[w] = dist[v] + 1
+                order[tail] = w
+                tail += 1
+            if dist[w] == dist[v] + 1:
+                sigma[w] += sigma[v]
+
+    for j in range(tail - 1, 0, -1):
+        w = order[j]
+        coeff = (1.0 + delta[w]) / sigma[w]
+        for k in range(indptr[w], indptr[w + 1]):
+            v = indices[k]
+            if dist[v] == dist[w] - 1:
+                credit = sigma[v] * coeff
+                delta[v] += credit
+                edge_bc[v] += credit
+                edge_bc[w] += credit
+        node_bc[w] += delta[w]
+
+    for j in range(tail):
+        w = order[j]
+        dist[w] = -1
+        sigma[w] = 0.0
+        delta[w] = 0.0
+
+
+@njit(parallel=True, cache=True)
+def _brandes_sample(indptr, indices, sources, n_chunks):
+    """Unscaled node and incident-edge betweenness summed over ``sources``.
+
+    Sources are dealt round-robin to ``n_chunks`` threads, each with its
+    own BFS buffers and partial sums.
+    """
+    n = indptr.shape[0] - 1
+    node_partial = np.zeros((n_chunks, n))
+    edge_partial = np.zeros((n_chunks, n))
+    for c in prange(n_chunks):
+        dist = np.full(n, -1, dtype=np.int64)
+        sigma = np.zeros(n)
+        delta = np.zeros(n)
+        order = np.empty(n, dtype=np.int64)
+        for j in range(c, sources.shape[0], n_chunks):
+            _accumulate_source(
+                indptr,
+                indices,
+                sources[j],
+                dist,
+                sigma,
+                delta,
+                order,
+                node_partial[c],
+                edge_partial[c],
+            )
+    return node_partial.sum(axis=0), edge_partial.sum(axis=0)
+
+
+def _sampled_betweenness(
+    graph: Optional[nx.Graph], adjacency: sparse.csr_matrix, k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Sampled betweenness and mean incident-edge betweenness per node.
+
+    Both come from one Brandes pass over ``k`` random sources and are scaled
+    like ``nx.betweenness_centrality`` and ``nx.edge_betweenness_centrality``
+    with ``normalized=True``. Without Numba the two NetworkX calls are made on
+    ``graph``, which is otherwise unused.
+    """
+    n_nodes = adjacency.shape[0]
+    degree = np.diff(adjacency.indptr)
+    if not HAS_NUMBA:
+        nodes = list(graph)
+        node_bc = nx.betweenness_centrality(graph, k=k)
+        edge_bc = nx.edge_betweenness_centrality(graph, k=k)
+        incident = dict.fromkeys(nodes, 0.0)
+        for (u, v), value in edge_bc.items():
+            incident[u] += value
+            incident[v] += value
+        betweenness = np.fromiter((node_bc[n] for n in nodes), dtype=np.float64, count=n_nodes)
+        incident_sum = np.fromiter((incident[n] for n in nodes), dtype=np.float64, count=n_nodes)
+    else:
+        sampled = k < n_nodes
+        if sampled:
+            sources = np.random.default_rng().choice(n_nodes, size=k, replace=False)
+        else:
+            sources = np.arange(n_nodes)
+        betweenness, incident_sum = _brandes_sample(
+            adjacency.indptr.astype(np.int64),
+            adjacency.indices.astype(np.int64),
+            sources.astype(np.int64),
+            get_num_threads(),
+        )
+        # Same rescaling as NetworkX: sampled sources cannot count themselves
+        if n_nodes > 2:
+            if sampled:
+                scale = np.full(n_nodes, 1.0 / (k * (n_nodes - 2)))
+                scale[sources] = 1.0 / ((k - 1) * (n_nodes - 2)) if k > 1 else np.nan
+            else:
+                scale = 1.0 / ((n_nodes - 1) * (n_nodes - 2))
+            betweenness *= scale
+        if n_nodes > 1:
+            incident_sum *= 1.0 / ((k if sampled else n_nodes) * (n_nodes - 1))
+    bridge = np.divide(incident_sum, degree, out=np.zeros(n_nodes), where=degree > 0)
+    return betweenness, bridge
+
+
+# Per-target columns filled by ``_neighbourhood_block``
+_NEIGHBOURHOOD_COLUMNS = (
+    "n_neighbors_2hop",
+    "avg_neighbor_degree",
+    "max_neighbor_degree",
+    "pathway_participation_score",
+    "hub_proximity_score",
+    "disease_gene_proximity_1hop",
+    "disease_gene_proximity_2hop",
+    "drugged_target_proximity_1hop",
+)
+
+
+@njit(parallel=True, cache=True)
+def _neighbourhood_block(indptr, indices, nodes, degree, pagerank, is_disease, is_drugged, out):
+    """Fill ``out[j]`` with the ``_NEIGHBOURHOOD_COLUMNS`` of ``nodes[j]``.
+
+    The 1-hop neighbourhood is a CSR slice and the 2-hop one is gathered
+    from the neighbours' slices, so every feature of a target is computed
+    while its neighbourhood is in cache. Targets are independent and are
+    spread across threads.
+    """
+    for j in prange(nodes.shape[0]):
+        node = nodes[j]
+        neighbors_1hop = indices[indptr[node] : indptr[node + 1]]
+        n_1hop = neighbors_1hop.shape[0]
+        if n_1hop == 0:
+            out[j, :] = 0.0
+            continue
+
+        # 2-hop neighbors, excluding 1-hop neighbors and self
+        candidates = np.empty(degree[neighbors_1hop].sum(), dtype=indices.dtype)
+        filled = 0
+        for neighbor in neighbors_1hop:
+            stop = filled + indptr[neighbor + 1] - indptr[neighbor]
+            candidates[filled:stop] = indices[indptr[neighbor] : indptr[neighbor + 1]]
+            filled = stop
+        candidates = np.unique(candidates)
+        sorted_1hop = np.sort(neighbors_1hop)
+        position = np.minimum(np.searchsorted(sorted_1hop, candidates), n_1hop - 1)
+        neighbors_2hop = candidates[(sorted_1hop[position] != candidates) & (candidates != node)]
+
+        # Neighbor degree statistics and high-degree (pathway) neighbors
+        neighbor_degrees = degree[neighbors_1hop]
+        threshold = np.percentile(neighbor_degrees, 75)
+
+        out[j, 0] = neighbors_2hop.shape[0]
+        out[j, 1] = neighbor_degrees.mean()
+        out[j, 2] = neighbor_degrees.max()
+        out[j, 3] = np.count_nonzero(neighbor_degrees > threshold) / n_1hop
+        out[j, 4] = pagerank[neighbors_1hop].mean()
+        out[j, 5] = np.count_nonzero(is_disease[neighbors_1hop])
+        out[j, 6] = np.count_nonzero(is_disease[neighbors_2hop])
+        out[j, 7] = np.count_nonzero(is_drugged[neighbors_1hop])
+
 
 class TargetGraphFeaturizer:
     """
@@ -97,7 +375,13 @@ class TargetGraphFeaturizer:
         """
         self.string_db_path = string_db_path
         self.confidence_threshold = confidence_threshold
-        self.graph = None
+        self._graph = None
+        self._adjacency = None
+        self._nodes: List[str] = []
+        self._node_index: Dict[str, int] = {}
+        self._is_disease_gene = None
+        self._is_drugged_target = None
+        self._centralities = None
         self.feature_names = [
             "degree_centrality",
             "betweenness_centrality",
@@ -115,8 +399,8 @@ class TargetGraphFeaturizer:
             "disease_gene_proximity_2hop",
             "drugged_target_proximity_1hop",
         ]
-        self.scaler = MinMaxScaler()
         self._cache_file = None
+        self._centrality_cache_file = None
 
         # Load disease genes and drug targets from files if they exist
         self._load_reference_sets()
@@ -145,6 +429,31 @@ class TargetGraphFeaturizer:
             except Exception as e:
                 logger.warning(f"Could not load drug targets file: {e}")
 
+    @property
+    def graph(self) -> Optional[nx.Graph]:
+        """NetworkX view of the network, built from the CSR adjacency on first access."""
+        if self._graph is None and self._adjacency is not None:
+            upper = sparse.triu(self._adjacency, format="coo")
+            nodes = self._nodes
+            graph = nx.Graph()
+            graph.add_nodes_from(nodes)
+            graph.add_weighted_edges_from(
+                (nodes[i], nodes[j], w)
+                for i, j, w in zip(upper.row.tolist(), upper.col.tolist(), upper.data.tolist())
+            )
+            self._graph = graph
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph: Optional[nx.Graph]) -> None:
+        self._graph = graph
+        self._adjacency = None
+        # The centrality cache describes the loaded STRING network, not this graph
+        self._centrality_cache_file = None
+
+    def _network_loaded(self) -> bool:
+        return self._adjacency is not None or self._graph is not None
+
     def load_string_network(self, organism_id: int = 9606) -> nx.Graph:
         """
         Load STRING protein interaction network.
@@ -155,6 +464,11 @@ class TargetGraphFeaturizer:
         Returns:
             NetworkX graph object
         """
+        self._load_network(organism_id)
+        return self.graph
+
+    def _load_network(self, organism_id: int = 9606) -> None:
+        """Load the network into the CSR adjacency, reading or filling the on-disk cache."""
         if self.string_db_path is None:
             raise ValueError("STRING database path not provided")
 
@@ -162,20 +476,34 @@ class TargetGraphFeaturizer:
         cache_dir = Path(".cache")
         cache_dir.mkdir(exist_ok=True)
         self._cache_file = (
-            cache_dir / f"string_network_{organism_id}_{self.confidence_threshold}.pkl"
+            cache_dir / f"string_network_{organism_id}_{self.confidence_threshold}.npz"
+        )
+        self._centrality_cache_file = (
+            cache_dir / f"centralities_{organism_id}_{self.confidence_threshold}.npz"
         )
 
-        # Try to load from cache first
-        if self._cache_file.exists():
-            logger.info("Loading network from cache...")
+        # Try to load from cache first; a network cached for the same organism
+        # at a lower threshold only needs its weaker edges dropped
+        cache_file = self._find_network_cache(cache_dir, organism_id)
+        if cache_file is not None:
+            logger.info(f"Loading network from cache {cache_file}...")
             try:
-                with open(self._cache_file, "rb") as f:
-                    self.graph = pickle.load(f)
+                with np.load(cache_file) as stored:
+                    nodes = stored["nodes"]
+                    source, target, score = stored["source"], stored["target"], stored["score"]
+                keep = score >= self.confidence_threshold
+                if not keep.all():
+                    source, target, score = source[keep], target[keep], score[keep]
+                    used, codes = np.unique(np.concatenate([source, target]), return_inverse=True)
+                    nodes = nodes[used]
+                    source, target = codes[: len(score)], codes[len(score) :]
+                self._set_network(nodes.tolist(), source, target, score / 1000.0)
                 logger.info(
-                    f"Loaded cached network: {self.graph.number_of_nodes()} nodes, "
-                    f"{self.graph.number_of_edges()} edges"
+                    f"Loaded cached network: {len(self._nodes)} nodes, {self._n_edges()} edges"
                 )
-                return self.graph
+                if cache_file != self._cache_file:
+                    self._save_network()
+                return
             except Exception as e:
                 logger.warning(f"Could not load cache: {e}. Loading from STRING file...")
 
@@ -185,89 +513,256 @@ class TargetGraphFeaturizer:
         if not Path(self.string_db_path).exists():
             raise FileNotFoundError(f"STRING database file not found: {self.string_db_path}")
 
-        # Create graph
-        self.graph = nx.Graph()
-
-        # Read STRING file and build network
-        edges_added = 0
+        # Read STRING file in chunks, keeping same-organism edges above threshold
         organism_prefix = f"{organism_id}."
+        chunks = pd.read_csv(
+            self.string_db_path,
+            sep=r"\s+",
+            header=None,
+            skiprows=1,
+            usecols=[0, 1, 2],
+            names=["protein1", "protein2", "combined_score"],
+            dtype={"protein1": str, "protein2": str, "combined_score": np.int32},
+            chunksize=_STRING_CHUNK,
+        )
+        kept = []
+        for chunk in tqdm(chunks, desc="Loading STRING interactions", unit="chunk"):
+            mask = (
+                chunk["protein1"].str.startswith(organism_prefix)
+                & chunk["protein2"].str.startswith(organism_prefix)
+                & (chunk["combined_score"] >= self.confidence_threshold)
+            )
+            kept.append(chunk[mask])
+        edges = pd.concat(kept, ignore_index=True)
+
+        # Remove organism prefix for cleaner IDs; nodes are numbered in order of
+        # first appearance, protein1 before protein2 on each line
+        names = np.column_stack(
+            [
+                edges["protein1"].str.slice(len(organism_prefix)).to_numpy(),
+                edges["protein2"].str.slice(len(organism_prefix)).to_numpy(),
+            ]
+        )
+        codes, nodes = pd.factorize(names.ravel())
+        codes = codes.reshape(-1, 2)
+        self._set_network(
+            list(nodes), codes[:, 0], codes[:, 1], edges["combined_score"].to_numpy() / 1000.0
+        )
 
-        with open(self.string_db_path) as f:
-            for line_num, line in enumerate(tqdm(f, desc="Loading STRING interactions")):
-                if line_num == 0:  # Skip header
-                    continue
+        logger.info(f"Built network: {len(self._nodes)} nodes, {self._n_edges()} edges")
+        self._save_network()
 
-                parts = line.strip().split()
-                if len(parts) < 3:
-                    continue
+    def _find_network_cache(self, cache_dir: Path, organism_id: int) -> Optional[Path]:
+        """Return this network's cache file, else the closest lower-threshold one, if any."""
+        if self._cache_file.exists():
+            return self._cache_file
+        lower = []
+        for path in cache_dir.glob(f"string_network_{organism_id}_*.npz"):
+            try:
+                threshold = int(path.stem.rsplit("_", 1)[1])
+            except ValueError:
+                continue
+            if threshold < self.confidence_threshold:
+                lower.append((threshold, path))
+        return max(lower)[1] if lower else None
 
-                protein1, protein2, combined_score = parts[0], parts[1], int(parts[2])
+    def _save_network(self) -> None:
+        """Cache the network as its upper-triangle edge list with integer STRING scores."""
+        upper = sparse.triu(self._adjacency, format="coo")
+        try:
+            np.savez_compressed(
+                self._cache_file,
+                nodes=np.array(self._nodes, dtype=str),
+                source=upper.row,
+                target=upper.col,
+                score=np.rint(upper.data * 1000).astype(np.int16),
+            )
+            logger.info("Network cached successfully")
+        except Exception as e:
+            logger.warning(f"Could not cache network: {e}")
 
-                # Filter by organism and confidence threshold
-                if (
-                    protein1.startswith(organism_prefix)
-                    and protein2.startswith(organism_prefix)
-                    and combined_score >= self.confidence_threshold
-                ):
-                    # Remove organism prefix for cleaner IDs
-                    p1 = protein1.replace(organism_prefix, "")
-                    p2 = protein2.replace(organism_prefix, "")
+    def _n_edges(self) -> int:
+        return sparse.triu(self._adjacency).nnz
 
-                    # Add edge with weight
-                    self.graph.add_edge(p1, p2, weight=combined_score / 1000.0)
-                    edges_added += 1
+    def _set_network(
+        self, nodes: List[str], source: np.ndarray, target: np.ndarray, weight: np.ndarray
+    ) -> None:
+        """
+        Install the network from an edge list over ``nodes`` indices.
 
-        logger.info(
-            f"Built network: {self.graph.number_of_nodes()} nodes, "
-            f"{self.graph.number_of_edges()} edges"
+        Repeated interactions keep the last weight seen, in either direction,
+        as ``nx.Graph.add_edge`` would.
+        """
+        n_nodes = len(nodes)
+        low = np.minimum(source, target).astype(np.int64)
+        high = np.maximum(source, target).astype(np.int64)
+        _, last = np.unique((low * n_nodes + high)[::-1], return_index=True)
+        last = len(low) - 1 - last
+        low, high, weight = low[last], high[last], weight[last]
+        off_diagonal = low != high
+        self._adjacency = sparse.csr_matrix(
+            (
+                np.concatenate([weight, weight[off_diagonal]]),
+                (
+                    np.concatenate([low, high[off_diagonal]]),
+                    np.concatenate([high, low[off_diagonal]]),
+                ),
+            ),
+            shape=(n_nodes, n_nodes),
         )
+        self._graph = None
+        self._index_nodes(nodes)
+
+    def _index_nodes(self, nodes: List[str]) -> None:
+        """Map node names to adjacency rows and mark reference gene members."""
+        self._nodes = nodes
+        self._node_index = {node: i for i, node in enumerate(nodes)}
+        self._is_disease_gene = self._membership_mask(self.DISEASE_GENES)
+        self._is_drugged_target = self._membership_mask(self.DRUGGED_TARGETS)
+        self._centralities = None
+
+    def _csr_adjacency(self) -> sparse.csr_matrix:
+        """Return the weighted CSR adjacency, deriving it from ``self.graph`` if needed."""
+        if self._adjacency is None:
+            nodes = list(self._graph)
+            self._adjacency = sparse.csr_matrix(
+                nx.to_scipy_sparse_array(self._graph, nodelist=nodes, weight="weight", format="csr")
+            )
+            self._index_nodes(nodes)
+        return self._adjacency
 
-        # Cache the graph
-        try:
-            with open(self._cache_file, "wb") as f:
-                pickle.dump(self.graph, f)
-            logger.info("Network cached successfully")
-        except Exception as e:
-            logger.warning(f"Could not cache network: {e}")
+    def _membership_mask(self, genes: set) -> np.ndarray:
+        """Boolean array over network nodes marking members of ``genes``."""
+        mask = np.zeros(len(self._nodes), dtype=bool)
+        mask[[self._node_index[g] for g in genes if g in self._node_index]] = True
+        return mask
 
-        return self.graph
+    def _node_centralities(self) -> Dict[str, np.ndarray]:
+        """
+        Return per-node centralities and bridge scores, computed once per graph.
 
-    def _compute_centrality_features(self, target_proteins: List[str]) -> Dict[str, np.ndarray]:
-        """Compute centrality-based features."""
-        if self.graph is None:
-            raise ValueError("Network not loaded. Call load_string_network() first.")
+        The graph is fully determined by organism and confidence threshold, so
+        the arrays are cached on disk under that key next to the network cache.
+        """
+        if self._centralities is not None:
+            return self._centralities
 
-        features = {}
+        adjacency = self._csr_adjacency()
+        n_nodes = adjacency.shape[0]
+        cache_file = self._centrality_cache_file
+        if cache_file is not None and cache_file.exists():
+            try:
+                with np.load(cache_file) as stored:
+                    cached_nodes = stored["nodes"].tolist()
+                    centralities = {name: stored[name] for name in _NODE_FEATURES}
+                # Same size is not enough: a rebuilt network may order its nodes differently
+                if cached_nodes == self._nodes and all(
+                    values.shape == (n_nodes,) for values in centralities.values()
+                ):
+                    logger.info("Loaded centrality measures from cache")
+                    self._centralities = centralities
+                    return centralities
+                logger.warning("Centrality cache does not match the network. Recomputing...")
+            except Exception as e:
+                logger.warning(f"Could not load centrality cache: {e}. Recomputing...")
 
         # Compute centralities for all nodes (expensive but done once)
         logger.info("Computing centrality measures...")
 
-        degree_centrality = nx.degree_centrality(self.graph)
-        betweenness_centrality = nx.betweenness_centrality(self.graph, k=min(1000, len(self.graph)))
-        closeness_centrality = nx.closeness_centrality(self.graph)
-        pagerank = nx.pagerank(self.graph, alpha=0.85)
-        clustering = nx.clustering(self.graph)
+        degree = np.diff(adjacency.indptr).astype(np.float64)
+        degree_centrality = degree * (1.0 / (n_nodes - 1.0)) if n_nodes > 1 else np.ones(n_nodes)
+        # Only the NetworkX fallback needs a graph view
+        graph = None if HAS_NUMBA else self.graph
+        betweenness, bridge = _sampled_betweenness(graph, adjacency, min(1000, n_nodes))
+        centralities = {
+            "degree_centrality": degree_centrality,
+            "betweenness_centrality": betweenness,
+            "closeness_centrality": _closeness(adjacency),
+            "pagerank_score": _pagerank(adjacency, alpha=0.85, start=self._pagerank_start()),
+            "clustering_coefficient": _clustering(adjacency, degree),
+            "bridge_score": bridge,
+        }
+
+        if cache_file is not None:
+            try:
+                np.savez_compressed(
+                    cache_file, nodes=np.array(self._nodes, dtype=str), **centralities
+                )
+                logger.info("Centrality measures cached successfully")
+            except Exception as e:
+                logger.warning(f"Could not cache centrality measures: {e}")
 
-        # Extract features for target proteins
-        n_targets = len(target_proteins)
-        features["degree_centrality"] = np.zeros(n_targets)
-        features["betweenness_centrality"] = np.zeros(n_targets)
-        features["closeness_centrality"] = np.zeros(n_targets)
-        features["pagerank_score"] = np.zeros(n_targets)
-        features["clustering_coefficient"] = np.zeros(n_targets)
-
-        for i, protein in enumerate(target_proteins):
-            if protein in self.graph:
-                features["degree_centrality"][i] = degree_centrality.get(protein, 0)
-                features["betweenness_centrality"][i] = betweenness_centrality.get(protein, 0)
-                features["closeness_centrality"][i] = closeness_centrality.get(protein, 0)
-                features["pagerank_score"][i] = pagerank.get(protein, 0)
-                features["clustering_coefficient"][i] = clustering.get(protein, 0)
+        self._centralities = centralities
+        return centralities
 
-        return features
+    def _pagerank_start(self) -> Optional[np.ndarray]:
+        """
+        PageRank starting vector taken from the centrality cache of the closest threshold.
+
+        Networks of one organism at nearby thresholds share most of their
+        nodes and edges, so a previous run's PageRank converges in a few
+        iterations. Nodes the cached network lacks start from the uniform
+        value. Returns ``None`` when no such cache exists.
+        """
+        cache_file = self._centrality_cache_file
+        if cache_file is None:
+            return None
+        prefix = cache_file.stem.rsplit("_", 1)[0]
+        candidates = []
+        for path in cache_file.parent.glob(f"{prefix}_*.npz"):
+            try:
+                threshold = int(path.stem.rsplit("_", 1)[1])
+            except ValueError:
+                continue
+            if path != cache_file:
+                candidates.append((abs(threshold - self.confidence_threshold), path))
+        if not candidates:
+            return None
+
+        try:
+            with np.load(min(candidates)[1]) as stored:
+                nodes, pagerank = stored["nodes"], stored["pagerank_score"]
+        except Exception as e:
+            logger.warning(f"Could not load PageRank warm start: {e}")
+            return None
+        index = np.fromiter(
+            (self._node_index.get(node, -1) for node in nodes.tolist()), dtype=np.int64
+        )
+        found = index >= 0
+        start = np.full(len(self._nodes), 1.0 / len(self._nodes))
+        start[index[found]] = pagerank[found]
+        return start
+
+    def _compute_centrality_features(self, target_proteins: List[str]) -> Dict[str, np.ndarray]:
+        """Compute centrality-based features."""
+        if not self._network_loaded():
+            raise ValueError("Network not loaded. Call load_string_network() first.")
+
+        centralities = self._node_centralities()
+        n_nodes = self._adjacency.shape[0]
+
+        # Gather features for target proteins; proteins outside the network stay zero
+        index = np.array([self._node_index.get(p, -1) for p in target_proteins], dtype=np.int64)
+        found = index >= 0
+        return {
+            name: np.where(found, centralities[name][index], 0.0)
+            if n_nodes
+            else np.zeros(index.size)
+            for name in _NODE_FEATURES[:5]
+        }
 
     def _compute_neighborhood_features(self, target_proteins: List[str]) -> Dict[str, np.ndarray]:
-        """Compute neighborhood-based features."""
+        """
+        Compute neighborhood-based and proximity features.
+
+        Both groups need each target's 1-hop and 2-hop neighbourhoods, so they
+        are filled by one compiled pass over the CSR adjacency for each
+        distinct target node.
+        """
+        adjacency = self._csr_adjacency()
+        indptr, indices = adjacency.indptr, adjacency.indices
+        degree = np.diff(indptr)
+
         features = {}
         n_targets = len(target_proteins)
 
@@ -278,92 +773,41 @@ class TargetGraphFeaturizer:
         features["pathway_participation_score"] = np.zeros(n_targets)
         features["hub_proximity_score"] = np.zeros(n_targets)
         features["bridge_score"] = np.zeros(n_targets)
-
-        # Precompute PageRank for hub proximity
-        pagerank = nx.pagerank(self.graph, alpha=0.85)
-
-        for i, protein in enumerate(target_proteins):
-            if protein not in self.graph:
-                continue
-
-            # 1-hop neighbors
-            neighbors_1hop = set(self.graph.neighbors(protein))
-            features["n_neighbors_1hop"][i] = len(neighbors_1hop)
-
-            # 2-hop neighbors
-            neighbors_2hop = set()
-            for neighbor in neighbors_1hop:
-                neighbors_2hop.update(self.graph.neighbors(neighbor))
-            neighbors_2hop -= neighbors_1hop  # Remove 1-hop neighbors
-            neighbors_2hop.discard(protein)  # Remove self
-            features["n_neighbors_2hop"][i] = len(neighbors_2hop)
-
-            if neighbors_1hop:
-                # Neighbor degree statistics
-                neighbor_degrees = [self.graph.degree(n) for n in neighbors_1hop]
-                features["avg_neighbor_degree"][i] = np.mean(neighbor_degrees)
-                features["max_neighbor_degree"][i] = np.max(neighbor_degrees)
-
-                # Pathway participation (based on high-degree neighbors)
-                high_degree_neighbors = sum(
-                    1 for d in neighbor_degrees if d > np.percentile(neighbor_degrees, 75)
-                )
-                features["pathway_participation_score"][i] = high_degree_neighbors / len(
-                    neighbors_1hop
-                )
-
-                # Hub proximity (average PageRank of neighbors)
-                neighbor_pageranks = [pagerank.get(n, 0) for n in neighbors_1hop]
-                features["hub_proximity_score"][i] = np.mean(neighbor_pageranks)
-
-                # Bridge score (connects different clusters)
-                # Simplified: measure of edge betweenness of protein's edges
-                protein_edges = [(protein, neighbor) for neighbor in neighbors_1hop]
-                edge_betweenness = nx.edge_betweenness_centrality_subset(
-                    self.graph,
-                    sources=[protein],
-                    targets=list(neighbors_1hop),
-                    k=min(100, len(self.graph)),
-                )
-                if protein_edges:
-                    bridge_scores = [edge_betweenness.get(edge, 0) for edge in protein_edges]
-                    features["bridge_score"][i] = np.mean(bridge_scores)
-
-        return features
-
-    def _compute_proximity_features(self, target_proteins: List[str]) -> Dict[str, np.ndarray]:
-        """Compute proximity to disease genes and drugged targets."""
-        features = {}
-        n_targets = len(target_proteins)
-
         features["disease_gene_proximity_1hop"] = np.zeros(n_targets)
         features["disease_gene_proximity_2hop"] = np.zeros(n_targets)
         features["drugged_target_proximity_1hop"] = np.zeros(n_targets)
 
-        for i, protein in enumerate(target_proteins):
-            if protein not in self.graph:
-                continue
-
-            # 1-hop neighbors
-            neighbors_1hop = set(self.graph.neighbors(protein))
-
-            # Disease gene proximity
-            disease_genes_1hop = neighbors_1hop.intersection(self.DISEASE_GENES)
-            features["disease_gene_proximity_1hop"][i] = len(disease_genes_1hop)
-
-            # 2-hop neighbors for disease genes
-            neighbors_2hop = set()
-            for neighbor in neighbors_1hop:
-                neighbors_2hop.update(self.graph.neighbors(neighbor))
-            neighbors_2hop -= neighbors_1hop
-            neighbors_2hop.discard(protein)
+        # Map targets to node indices once; repeated targets share one pass
+        target_idx = np.fromiter(
+            (self._node_index.get(p, -1) for p in target_proteins), dtype=np.int32, count=n_targets
+        )
+        found = np.flatnonzero(target_idx >= 0)
+        nodes, inverse = np.unique(target_idx[found], return_inverse=True)
+
+        # PageRank for hub proximity is shared with the centrality features
+        centralities = self._node_centralities()
+
+        block = np.empty((len(nodes), len(_NEIGHBOURHOOD_COLUMNS)))
+        _neighbourhood_block(
+            indptr,
+            indices,
+            nodes,
+            degree,
+            centralities["pagerank_score"],
+            self._is_disease_gene,
+            self._is_drugged_target,
+            block,
+        )
+        values = dict(zip(_NEIGHBOURHOOD_COLUMNS, block.T))
+        values["n_neighbors_1hop"] = degree[nodes].astype(float)
 
-            disease_genes_2hop = neighbors_2hop.intersection(self.DISEASE_GENES)
-            features["disease_gene_proximity_2hop"][i] = len(disease_genes_2hop)
+        # Bridge score (connects different clusters)
+        # Simplified: mean sampled edge betweenness of protein's edges
+        values["bridge_score"] = centralities["bridge_score"][nodes]
 
-            # Drugged target proximity
-            drugged_targets_1hop = neighbors_1hop.intersection(self.DRUGGED_TARGETS)
-            features["drugged_target_proximity_1hop"][i] = len(drugged_targets_1hop)
+        # Scatter per-node values back to every target that maps to the node
+        for name, column in features.items():
+            column[found] = values[name][inverse]
 
         return features
 
@@ -375,17 +819,18 @@ class TargetGraphFeaturizer:
             target_proteins: List of protein IDs (Ensembl or gene symbols)
 
         Returns:
-            numpy array of shape (n_targets, 15) with network features
+            float32 numpy array of shape (n_targets, 15) with network features
         """
-        if self.graph is None:
+        if not self._network_loaded():
             if self.string_db_path is None:
                 raise ValueError("Network not loaded and no STRING database path provided")
-            self.load_string_network()
+            self._load_network()
 
         logger.info(f"Extracting features for {len(target_proteins)} proteins...")
 
         # Find proteins not in network
-        proteins_in_network = [p for p in target_proteins if p in self.graph]
+        self._csr_adjacency()
+        proteins_in_network = [p for p in target_proteins if p in self._node_index]
         proteins_not_found = set(target_proteins) - set(proteins_in_network)
 
         if proteins_not_found:
@@ -401,21 +846,21 @@ class TargetGraphFeaturizer:
         centrality_features = self._compute_centrality_features(target_proteins)
         all_features.update(centrality_features)
 
-        # Neighborhood features
+        # Neighborhood and proximity features
         neighborhood_features = self._compute_neighborhood_features(target_proteins)
         all_features.update(neighborhood_features)
 
-        # Proximity features
-        proximity_features = self._compute_proximity_features(target_proteins)
-        all_features.update(proximity_features)
-
         # Combine into feature matrix
-        feature_matrix = np.column_stack(
-            [all_features[feature_name] for feature_name in self.feature_names]
-        )
-
-        # Normalize features to [0,1] range
-        feature_matrix = self.scaler.fit_transform(feature_matrix)
+        feature_matrix = np.empty((len(target_proteins), len(self.feature_names)), np.float32)
+        for column, feature_name in enumerate(self.feature_names):
+            feature_matrix[:, column] = all_features[feature_name]
+
+        # Normalize features to [0,1] range in place; constant columns map to 0
+        feature_min = feature_matrix.min(axis=0)
+        feature_range = feature_matrix.max(axis=0) - feature_min
+        feature_range[feature_range == 0] = 1.0
+        np.subtract(feature_matrix, feature_min, out=feature_matrix)
+        np.divide(feature_matrix, feature_range, out=feature_matrix)
 
         logger.info(
             f"Extracted {feature_matrix.shape[1]} features for {feature_matrix.shape[0]} proteins"
@@ -16,42 +16,45 @@ def call_rate(genotypes: np.ndarray) -> np.ndarray:
 
 
 def minor_allele_frequency(genotypes: np.ndarray) -> np.ndarray:
-    """Estimate minor allele frequency per SNP."""
+    """Estimate minor allele frequency per SNP.
 
-    geno = genotypes.copy().astype(float)
-    geno[geno < 0] = np.nan
-    allele_sum = np.nansum(geno, axis=0)
-    n_called = np.sum(~np.isnan(geno), axis=0)
-    maf = allele_sum / (2 * n_called)
+    Works on the integer genotype codes directly (missing calls are negative),
+    so an ``int8`` matrix is never widened to a float copy.
+    """
+
+    called = genotypes >= 0
+    allele_sum = np.where(called, genotypes, 0).sum(axis=0, dtype=np.int64)
+    n_called = np.count_nonzero(called, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        maf = allele_sum / (2 * n_called)
     return np.minimum(maf, 1 - maf)
 
 
 def hardy_weinberg_p(genotypes: np.ndarray) -> np.ndarray:
-    """Exact test approximation for Hardy-Weinberg equilibrium."""
-
-    counts = []
-    for snp in genotypes.T:
-        snp = snp[snp >= 0]
-        obs_hom_ref = np.sum(snp == 0)
-        obs_het = np.sum(snp == 1)
-        obs_hom_alt = np.sum(snp == 2)
-        n = obs_hom_ref + obs_het + obs_hom_alt
-        if n == 0:
-            counts.append(1.0)
-            continue
+    """Exact test approximation for Hardy-Weinberg equilibrium.
+
+    Genotype counts for all SNPs are taken in three column-wise passes and the
+    chi-square statistic is evaluated on the resulting ``(3, n_snps)`` arrays.
+    SNPs with no called genotypes get ``p = 1``.
+    """
+
+    obs_hom_ref = np.count_nonzero(genotypes == 0, axis=0)
+    obs_het = np.count_nonzero(genotypes == 1, axis=0)
+    obs_hom_alt = np.count_nonzero(genotypes == 2, axis=0)
+    n = obs_hom_ref + obs_het + obs_hom_alt
+    with np.errstate(divide="ignore", invalid="ignore"):
         p = (2 * obs_hom_alt + obs_het) / (2 * n)
-        expected = np.array(
-            [
-                (1 - p) ** 2 * n,
-                2 * p * (1 - p) * n,
-                p**2 * n,
-            ]
-        )
-        observed = np.array([obs_hom_ref, obs_het, obs_hom_alt])
-        chi2 = np.sum((observed - expected) ** 2 / (expected + 1e-8))
-        p_val = 1 - _chi2_cdf(chi2, 1)
-        counts.append(p_val)
-    return np.asarray(counts)
+    expected = np.stack(
+        [
+            (1 - p) ** 2 * n,
+            2 * p * (1 - p) * n,
+            p**2 * n,
+        ]
+    )
+    observed = np.stack([obs_hom_ref, obs_het, obs_hom_alt])
+    chi2 = np.sum((observed - expected) ** 2 / (expected + 1e-8), axis=0)
+    p_val = 1 - _chi2_cdf(chi2, 1)
+    return np.where(n > 0, p_val, 1.0)
 
 
 def qc_filter(
@@ -60,12 +63,16 @@ def qc_filter(
     maf_threshold: float = 0.01,
     hwe_threshold: float = 1e-6,
 ) -> np.ndarray:
-    """Return boolean mask of SNPs passing QC."""
+    """Return boolean mask of SNPs passing QC.
+
+    The filters are chained: MAF is only computed for SNPs passing the call
+    rate filter, and the HWE test only for SNPs passing both.
+    """
 
-    cr = call_rate(genotypes)
-    maf = minor_allele_frequency(genotypes)
-    hwe = hardy_weinberg_p(genotypes)
-    return (cr >= call_rate_threshold) & (maf >= maf_threshold) & (hwe >= hwe_threshold)
+    mask = call_rate(genotypes) >= call_rate_threshold
+    mask[mask] = minor_allele_frequency(genotypes[:, mask]) >= maf_threshold
+    mask[mask] = hardy_weinberg_p(genotypes[:, mask]) >= hwe_threshold
+    return mask
 
 
 def lambda_gc(p_values: np.ndarray) -> float:
@@ -76,12 +83,11 @@ def lambda_gc(p_values: np.ndarray) -> float:
 
 
 def _chi2_from_p(p_values: np.ndarray) -> np.ndarray:
-    return -2 * np.log(np.clip(p_values, 1e-300, 1.0))
+    # Clipping keeps p = 0 from turning into an infinite statistic
+    return -2 * np.log(np.clip(np.asarray(p_values, dtype=float), 1e-300, 1.0))
 
 
-def _chi2_cdf(x: float, df: int) -> float:
-    from math import erf
+def _chi2_cdf(x: np.ndarray, df: int) -> np.ndarray:
+    from scipy.special import chdtr
 
-    if df != 1:
-        raise NotImplementedError("Only df=1 implemented")
-    return erf(np.sqrt(x / 2))
+    return chdtr(df, x)
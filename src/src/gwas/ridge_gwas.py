@@ -8,16 +8,18 @@ from typing import Dict
 
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
 import yaml
-from scipy import stats
+from scipy import special, stats
 from sklearn.linear_model import Ridge
 
 from src.gwas import qc
 from src.utils import io
-from src.utils.stats import benjamini_hochberg
+from src.utils.stats import benjamini_hochberg, logistic_fit
 from src.utils.viz import manhattan_plot, qq_plot
 
+# SNP columns residualised per batch in the association scans
+_SNP_BLOCK = 4096
+
 
 def run(config_path: Path) -> pd.DataFrame:
     config = yaml.safe_load(config_path.read_text())
@@ -56,9 +58,7 @@ def run(config_path: Path) -> pd.DataFrame:
     results = pd.merge(results, snp_info, left_on="snp_index", right_index=True)
     results["p_adj"] = benjamini_hochberg(results["p_value"].to_numpy())
 
-    out_path = Path(paths["gwas"]["results"])
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    results.to_csv(out_path, index=False)
+    io.save_dataframe(results, Path(paths["gwas"]["results"]))
 
     for trait, group in results.groupby("trait"):
         manhattan_plot(
@@ -76,62 +76,96 @@ def run(config_path: Path) -> pd.DataFrame:
 
 
 def _linear_scan(geno: np.ndarray, trait: np.ndarray, cov: np.ndarray) -> pd.DataFrame:
+    """Per-SNP OLS of the covariate-adjusted trait, solved a block of SNPs at a time.
+
+    The covariate design is factorised once, ``design = QR``, and both the
+    trait and each block of genotype columns are residualised by projecting
+    out ``Q``. The per-SNP slope, standard error and p-value then follow from
+    column-wise reductions. SNPs with no variation left after adjustment are
+    dropped.
+    """
     n_snps = geno.shape[1]
     design = np.column_stack([np.ones(len(trait)), cov])
-    beta_cov = np.linalg.lstsq(design, trait, rcond=None)[0]
-    trait_resid = trait - design @ beta_cov
-
-    rows = []
-    for idx in range(n_snps):
-        snp = geno[:, idx].astype(float)
-        snp_design = np.linalg.lstsq(design, snp, rcond=None)[0]
-        snp_resid = snp - design @ snp_design
-        denom = np.sum(snp_resid**2)
-        if denom == 0:
-            continue
-        beta = np.dot(snp_resid, trait_resid) / denom
-        resid = trait_resid - beta * snp_resid
-        dof = len(trait) - design.shape[1] - 1
-        sigma2 = np.sum(resid**2) / dof
-        se = np.sqrt(sigma2 / denom)
-        z = beta / se
-        p_val = 2 * (1 - stats.norm.cdf(abs(z)))
-        rows.append(
-            {
-                "snp_index": idx,
-                "beta": beta,
-                "se": se,
-                "p_value": p_val,
-            }
-        )
-    return pd.DataFrame(rows)
+    q, _ = np.linalg.qr(design)
+    trait_resid = trait - q @ (q.T @ trait)
+    dof = len(trait) - design.shape[1] - 1
+
+    beta = np.empty(n_snps)
+    se = np.empty(n_snps)
+    denom = np.empty(n_snps)
+    for start in range(0, n_snps, _SNP_BLOCK):
+        block = slice(start, start + _SNP_BLOCK)
+        snps = geno[:, block].astype(float)
+        snp_resid = snps - q @ (q.T @ snps)
+        denom[block] = np.einsum("ij,ij->j", snp_resid, snp_resid)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            beta[block] = (trait_resid @ snp_resid) / denom[block]
+            resid = trait_resid[:, None] - beta[block] * snp_resid
+            sigma2 = np.einsum("ij,ij->j", resid, resid) / dof
+            se[block] = np.sqrt(sigma2 / denom[block])
+
+    keep = denom != 0
+    z = beta[keep] / se[keep]
+    p_val = 2 * (1 - stats.norm.cdf(np.abs(z)))
+    return pd.DataFrame(
+        {
+            "snp_index": np.flatnonzero(keep),
+            "beta": beta[keep],
+            "se": se[keep],
+            "p_value": p_val,
+        },
+        copy=False,
+    )
 
 
 def _logistic_scan(geno: np.ndarray, trait: np.ndarray, cov: np.ndarray) -> pd.DataFrame:
-    rows = []
-    base = sm.add_constant(cov)
-    for idx in range(geno.shape[1]):
-        X = np.column_stack([base, geno[:, idx]])
-        try:
-            model = sm.GLM(trait, X, family=sm.families.Binomial())
-            res = model.fit(maxiter=50, disp=0)
-            beta = res.params[-1]
-            se = res.bse[-1]
-            z = beta / se
-            p_val = 2 * (1 - stats.norm.cdf(abs(z)))
-        except Exception:  # pragma: no cover - convergence fallback
-            beta = np.nan
-            se = np.nan
-            p_val = 1.0
-        rows.append(
-            {
-                "snp_index": idx,
-                "beta": beta,
-                "se": se,
-                "p_value": p_val,
-            }
-        )
-    return pd.DataFrame(rows)
+    """Per-SNP logistic association by score test against the covariate-only model.
+
+    The null model is fitted once; each SNP then needs only its score
+    ``U = g' (y - pi0)`` and information ``V``, the weighted variance of ``g``
+    left after adjusting for the covariates. ``beta`` and ``se`` are the
+    one-step estimates ``U / V`` and ``1 / sqrt(V)``, so ``z = U / sqrt(V)``.
+    SNPs without residual variance (monomorphic, or collinear with the
+    covariates) get ``beta = se = nan`` and ``p = 1``.
+    """
+    base = np.empty((cov.shape[0], cov.shape[1] + 1))
+    base[:, 0] = 1.0
+    base[:, 1:] = cov
+    null_beta, _, _ = logistic_fit(base, trait, max_iter=50)
+    fitted = special.expit(base @ null_beta)
+    trait_resid = trait - fitted
+    sqrt_w = np.sqrt(fitted * (1 - fitted))
+    q, _ = np.linalg.qr(sqrt_w[:, None] * base)
+
+    n_snps = geno.shape[1]
+    score = np.empty(n_snps)
+    info = np.empty(n_snps)
+    total = np.empty(n_snps)
+    for start in range(0, n_snps, _SNP_BLOCK):
+        block = slice(start, start + _SNP_BLOCK)
+        snps = geno[:, block].astype(float)
+        score[block] = trait_resid @ snps
+        weighted = sqrt_w[:, None] * snps
+        total[block] = np.einsum("ij,ij->j", weighted, weighted)
+        weighted -= q @ (q.T @ weighted)
+        info[block] = np.einsum("ij,ij->j", weighted, weighted)
+
+    # Information at rounding level means the SNP is collinear with the covariates
+    valid = info > 1e-10 * total
+    with np.errstate(divide="ignore", invalid="ignore"):
+        beta = np.where(valid, score / info, np.nan)
+        se = np.where(valid, 1 / np.sqrt(info), np.nan)
+    p_val = np.ones(n_snps)
+    p_val[valid] = 2 * (1 - stats.norm.cdf(np.abs(beta[valid] / se[valid])))
+    return pd.DataFrame(
+        {
+            "snp_index": np.arange(n_snps),
+            "beta": beta,
+            "se": se,
+            "p_value": p_val,
+        },
+        copy=False,
+    )
 
 
 def main() -> None:
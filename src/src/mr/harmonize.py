@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 
 
@@ -21,35 +22,17 @@ def harmonize_sumstats(
 
     outcome = outcome.set_index("snp").loc[exposure["snp"]].reset_index()
 
-    palindromic = {
-        frozenset({"A", "T"}),
-        frozenset({"C", "G"}),
-    }
-
     if {"effect_allele", "other_allele"}.issubset(exposure.columns) and {
         "effect_allele",
         "other_allele",
     }.issubset(outcome.columns):
-        aligned_beta = []
-        aligned_se = []
-        for _, exp_row, out_row in zip(
-            range(len(exposure)), exposure.itertuples(), outcome.itertuples()
-        ):
-            exp_effect = getattr(exp_row, "effect_allele", None)
-            out_effect = getattr(out_row, "effect_allele", None)
-            if exp_effect == out_effect:
-                aligned_beta.append(out_row.beta_outcome)
-                aligned_se.append(out_row.se_outcome)
-            elif getattr(out_row, "other_allele", None) == exp_effect:
-                aligned_beta.append(-out_row.beta_outcome)
-                aligned_se.append(out_row.se_outcome)
-            elif frozenset({exp_effect, out_effect}) in palindromic:
-                aligned_beta.append(out_row.beta_outcome)
-                aligned_se.append(out_row.se_outcome)
-            else:
-                aligned_beta.append(out_row.beta_outcome)
-                aligned_se.append(out_row.se_outcome)
-        outcome["beta_outcome"] = aligned_beta
-        outcome["se_outcome"] = aligned_se
+        # Flip the outcome effect where its alleles are swapped relative to the
+        # exposure; matching, palindromic and unmatched SNPs keep their sign
+        exp_effect = exposure["effect_allele"].to_numpy()
+        flipped = (outcome["effect_allele"].to_numpy() != exp_effect) & (
+            outcome["other_allele"].to_numpy() == exp_effect
+        )
+        beta = outcome["beta_outcome"].to_numpy(dtype=float)
+        outcome["beta_outcome"] = np.where(flipped, -beta, beta)
 
     return exposure, outcome
@@ -8,10 +8,10 @@ from typing import Dict
 
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
 import yaml
 
 from src.utils import io
+from src.utils.stats import logistic_fit, ols_fit
 
 
 def run(config_path: Path) -> pd.DataFrame:
@@ -29,23 +29,23 @@ def run(config_path: Path) -> pd.DataFrame:
     merged = cohort.phenotypes.merge(cohort.covariates, on="sample_id")
     merged["cnv_burden"] = merged["sample_id"].map(burden).fillna(0)
 
-    cov = merged[["sex", "PC1", "PC2", "PC3"]].to_numpy()
-    cov = (cov - cov.mean(axis=0)) / (cov.std(axis=0) + 1e-8)
-
-    disease = merged["disease_status"].to_numpy()
-    design = sm.add_constant(np.column_stack([cov, merged["cnv_burden"].to_numpy()]))
-    model = sm.GLM(disease, design, family=sm.families.Binomial())
-    res = model.fit(maxiter=50, disp=0)
-    cnv_beta = res.params[-1]
-    cnv_se = res.bse[-1]
-    p_value = res.pvalues[-1]
-
-    quant = merged["quant_trait"].to_numpy()
-    model_lm = sm.OLS(quant, design)
-    res_lm = model_lm.fit()
-    beta_quant = res_lm.params[-1]
-    se_quant = res_lm.bse[-1]
-    p_quant = res_lm.pvalues[-1]
+    # Design columns: intercept, standardised covariates, CNV burden
+    covariates = ["sex", "PC1", "PC2", "PC3"]
+    design = np.empty((len(merged), len(covariates) + 2))
+    design[:, 0] = 1.0
+    cov = design[:, 1:-1]
+    cov[:] = merged[covariates].to_numpy(dtype=np.float64)
+    cov -= cov.mean(axis=0)
+    cov /= cov.std(axis=0) + 1e-8
+    design[:, -1] = merged["cnv_burden"].to_numpy(dtype=np.float64)
+
+    disease = merged["disease_status"].to_numpy(dtype=np.float64)
+    beta, se, p = logistic_fit(design, disease, max_iter=50)
+    cnv_beta, cnv_se, p_value = beta[-1], se[-1], p[-1]
+
+    quant = merged["quant_trait"].to_numpy(dtype=np.float64)
+    beta, se, p = ols_fit(design, quant)
+    beta_quant, se_quant, p_quant = beta[-1], se[-1], p[-1]
 
     out = pd.DataFrame(
         {
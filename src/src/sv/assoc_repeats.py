@@ -6,11 +6,12 @@ import argparse
 from pathlib import Path
 from typing import Dict
 
+import numpy as np
 import pandas as pd
-import statsmodels.api as sm
 import yaml
 
 from src.utils import io
+from src.utils.stats import logistic_fit, ols_fit
 
 
 def run(config_path: Path) -> pd.DataFrame:
@@ -33,24 +34,28 @@ def run(config_path: Path) -> pd.DataFrame:
     cov = merged[["sex", "PC1", "PC2", "PC3"]]
     cov = (cov - cov.mean()) / (cov.std() + 1e-8)
 
-    design = sm.add_constant(pd.concat([cov, merged[["repeat_mean"]]], axis=1))
+    design = np.column_stack(
+        [np.ones(len(merged)), cov.to_numpy(), merged["repeat_mean"].to_numpy()]
+    ).astype(np.float64)
 
-    quant_model = sm.OLS(merged["quant_trait"], design).fit()
-    disease_model = sm.GLM(merged["disease_status"], design, family=sm.families.Binomial()).fit()
+    quant_beta, quant_se, quant_p = ols_fit(design, merged["quant_trait"].to_numpy(np.float64))
+    disease_beta, disease_se, disease_p = logistic_fit(
+        design, merged["disease_status"].to_numpy(np.float64), max_iter=100
+    )
 
     out = pd.DataFrame(
         [
             {
                 "trait": "quant_trait",
-                "beta": quant_model.params["repeat_mean"],
-                "se": quant_model.bse["repeat_mean"],
-                "p_value": quant_model.pvalues["repeat_mean"],
+                "beta": quant_beta[-1],
+                "se": quant_se[-1],
+                "p_value": quant_p[-1],
             },
             {
                 "trait": "disease_status",
-                "beta": disease_model.params["repeat_mean"],
-                "se": disease_model.bse["repeat_mean"],
-                "p_value": disease_model.pvalues["repeat_mean"],
+                "beta": disease_beta[-1],
+                "se": disease_se[-1],
+                "p_value": disease_p[-1],
             },
         ]
     )
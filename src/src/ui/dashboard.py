@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 from pathlib import Path
 
 import pandas as pd
@@ -11,21 +12,50 @@ import streamlit as st
 DB_PATH = Path("artifacts/targetdb.sqlite")
 PLOTS_DIR = Path("artifacts")
 
+# Streamlit reruns the script on every interaction; query results are
+# refreshed at most this often so a rebuilt database is picked up
+CACHE_TTL_SECONDS = 3600
 
+
+# sqlite3 connections are not safe for concurrent use; sessions share this one
+_CONNECTION_LOCK = threading.Lock()
+
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS)
+def _connection() -> sqlite3.Connection:
+    # One read-only connection shared across reruns and sessions, reopened
+    # on the same schedule as the query caches
+    return sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True, check_same_thread=False)
+
+
+def _query(sql: str, params: tuple = ()) -> pd.DataFrame:
+    with _CONNECTION_LOCK:
+        return pd.read_sql_query(sql, _connection(), params=params)
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS)
 def load_targets() -> pd.DataFrame:
-    with sqlite3.connect(DB_PATH) as conn:
-        targets = pd.read_sql_query("SELECT gene, description FROM targets", conn)
-    return targets
+    return _query("SELECT gene, description FROM targets")
 
 
+@st.cache_data(ttl=CACHE_TTL_SECONDS)
 def load_evidence(gene: str) -> pd.DataFrame:
-    with sqlite3.connect(DB_PATH) as conn:
-        evidence = pd.read_sql_query(
-            "SELECT gene, disease, source, effect, p_value, qc_flag, details FROM evidence WHERE gene = ?",
-            conn,
-            params=(gene,),
-        )
-    return evidence
+    return _query(
+        "SELECT gene, disease, source, effect, p_value, qc_flag, details "
+        "FROM evidence WHERE gene = ?",
+        (gene,),
+    )
+
+
+@st.cache_data
+def _image_bytes(path: str, mtime: float) -> bytes:
+    # ``mtime`` is part of the cache key so regenerated plots are re-read
+    return Path(path).read_bytes()
+
+
+def _show_image(target, path: Path, caption: str) -> None:
+    if path.exists():
+        target.image(_image_bytes(str(path), path.stat().st_mtime), caption=caption)
 
 
 def main() -> None:
@@ -51,14 +81,10 @@ def main() -> None:
     forest = PLOTS_DIR / "mr_plots" / "forest.png"
 
     cols = st.columns(2)
-    if manhattan.exists():
-        cols[0].image(str(manhattan), caption=f"GWAS Manhattan ({trait})")
-    if qq.exists():
-        cols[1].image(str(qq), caption=f"GWAS QQ ({trait})")
-    if volcano.exists():
-        st.image(str(volcano), caption=f"TWAS Volcano ({trait})")
-    if forest.exists():
-        st.image(str(forest), caption="MR Forest")
+    _show_image(cols[0], manhattan, f"GWAS Manhattan ({trait})")
+    _show_image(cols[1], qq, f"GWAS QQ ({trait})")
+    _show_image(st, volcano, f"TWAS Volcano ({trait})")
+    _show_image(st, forest, "MR Forest")
 
 
 if __name__ == "__main__":  # pragma: no cover
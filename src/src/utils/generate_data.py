@@ -87,28 +87,23 @@ def generate_all(seed: int = 42) -> None:
     phenotypes.to_csv(base_paths["phenotypes"], index=False)
 
     genes = [f"GENE{i:04d}" for i in range(1, 301)]
-    eqtl_rows = []
-    pqtl_rows = []
-    for gene in genes:
-        snp_indices = rng.choice(n_snps, size=3, replace=False)
-        weights = rng.normal(0, 0.2, size=3)
-        for idx, w in zip(snp_indices, weights):
-            eqtl_rows.append(
-                {
-                    "gene": gene,
-                    "snp_id": snp_ids.loc[idx, "snp_id"],
-                    "weight": w,
-                }
-            )
-            pqtl_rows.append(
-                {
-                    "protein": gene.replace("GENE", "PROT"),
-                    "snp_id": snp_ids.loc[idx, "snp_id"],
-                    "weight": w + rng.normal(0, 0.05),
-                }
-            )
-    pd.DataFrame(eqtl_rows).to_csv(base_paths["eqtl"], index=False)
-    pd.DataFrame(pqtl_rows).to_csv(base_paths["pqtl"], index=False)
+    n_per_gene = 3
+    # Three distinct SNPs per gene: the positions of each row's smallest keys
+    keys = rng.random((len(genes), n_snps))
+    snp_indices = np.argpartition(keys, n_per_gene, axis=1)[:, :n_per_gene].ravel()
+    weights = rng.normal(0, 0.2, size=len(snp_indices))
+    gene_col = np.repeat(genes, n_per_gene)
+    snp_col = snp_ids["snp_id"].to_numpy()[snp_indices]
+    pd.DataFrame({"gene": gene_col, "snp_id": snp_col, "weight": weights}).to_csv(
+        base_paths["eqtl"], index=False
+    )
+    pd.DataFrame(
+        {
+            "protein": np.char.replace(gene_col, "GENE", "PROT"),
+            "snp_id": snp_col,
+            "weight": weights + rng.normal(0, 0.05, size=len(weights)),
+        }
+    ).to_csv(base_paths["pqtl"], index=False)
 
     instruments = snp_ids.sample(n=10, random_state=seed).copy()
     instruments["beta_exposure"] = rng.normal(0.1, 0.02, size=len(instruments))
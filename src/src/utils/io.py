@@ -9,6 +9,12 @@ from typing import Tuple
 import numpy as np
 import pandas as pd
 
+try:
+    from pyarrow import Table
+    from pyarrow import csv as arrow_csv
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    arrow_csv = None
+
 
 @dataclass
 class CohortData:
@@ -23,7 +29,11 @@ def load_cohort(
 ) -> CohortData:
     """Load cohort data from disk."""
 
-    genotypes = np.load(genotype_path)
+    # Map the genotype matrix instead of reading it; int8 holds every call code
+    genotypes = np.load(genotype_path, mmap_mode="r")
+    if genotypes.dtype != np.int8:
+        # Casting would truncate dosages, scramble NaN calls and read the whole file
+        raise ValueError(f"Genotypes must be int8 call codes, got {genotypes.dtype}")
     snp_info = pd.read_csv(snp_path)
     covariates = pd.read_csv(covariate_path)
     phenotypes = pd.read_csv(phenotype_path)
@@ -33,12 +43,32 @@ def load_cohort(
     return CohortData(genotypes, snp_info, covariates, phenotypes)
 
 
+def load_phenotypes(phenotype_path: Path) -> pd.DataFrame:
+    """Load only the phenotype table, for steps that need no genotypes."""
+
+    return pd.read_csv(phenotype_path)
+
+
 def load_sumstats(exposure_path: Path, outcome_path: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
     exposure = pd.read_csv(exposure_path)
     outcome = pd.read_csv(outcome_path)
     return exposure, outcome
 
 
-def save_dataframe(df: pd.DataFrame, path: Path) -> None:
+def save_dataframe(df: pd.DataFrame, path: Path, arrow_csv_writer: bool = False) -> None:
+    """Write ``df`` without its index as Parquet or CSV, chosen by the path suffix.
+
+    CSV is written by ``DataFrame.to_csv`` unless ``arrow_csv_writer`` is set
+    and PyArrow is installed, in which case PyArrow's multithreaded writer is
+    used. Its files read back identically with pandas but are not byte-equal:
+    headers and strings are quoted and booleans are written ``true``/``false``.
+    Opt in only for tables whose consumers read them with a CSV parser.
+    """
+
     path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(path, index=False)
+    if path.suffix == ".parquet":
+        df.to_parquet(path, index=False)
+    elif arrow_csv_writer and arrow_csv is not None:
+        arrow_csv.write_csv(Table.from_pandas(df, preserve_index=False), str(path))
+    else:
+        df.to_csv(path, index=False)
@@ -7,6 +7,21 @@ from dataclasses import dataclass
 from typing import List, Tuple
 
 import numpy as np
+from scipy import linalg, special
+
+try:
+    from numba import njit
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when Numba is unavailable."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
 
 
 @dataclass
@@ -23,13 +38,9 @@ def benjamini_hochberg(p_values: Iterable[float]) -> np.ndarray:
     n = len(p)
     order = np.argsort(p)
     ranked = p[order]
-    adj = np.empty_like(ranked)
-    cumulative = 0.0
-    for i in range(n - 1, -1, -1):
-        rank = i + 1
-        val = ranked[i] * n / rank
-        cumulative = min(cumulative if cumulative > 0 else val, val)
-        adj[i] = min(cumulative, 1.0)
+    # Running minimum from the largest p-value down; fmin skips NaN entries
+    raw = ranked * n / np.arange(1, n + 1)
+    adj = np.minimum(np.fmin.accumulate(raw[::-1])[::-1], 1.0)
     adjusted = np.empty_like(adj)
     adjusted[order] = adj
     return adjusted
@@ -91,20 +102,78 @@ def cochran_q(beta_exposure: np.ndarray, beta_outcome: np.ndarray, se_outcome: n
     return float(q)
 
 
+def ols_fit(design: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Ordinary least squares returning coefficients, standard errors and t-test p-values.
+
+    Matches ``sm.OLS(y, design).fit()`` for a full-rank design that already
+    contains its intercept column.
+    """
+
+    n, k = design.shape
+    beta = linalg.lstsq(design, y)[0]
+    resid = y - design @ beta
+    dof = n - k
+    sigma2 = (resid @ resid) / dof
+    se = np.sqrt(sigma2 * np.diag(linalg.inv(design.T @ design)))
+    p = 2 * special.stdtr(dof, -np.abs(beta / se))
+    return beta, se, p
+
+
+def logistic_fit(
+    design: np.ndarray, y: np.ndarray, max_iter: int = 25, tol: float = 1e-8
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Logistic regression by IRLS returning coefficients, standard errors and Wald p-values.
+
+    Each iteration solves the weighted normal equations for the working
+    response; as in statsmodels, iteration stops once the deviance changes by
+    at most ``tol``. Matches ``sm.GLM(y, design, family=Binomial()).fit()``.
+    """
+
+    beta = np.zeros(design.shape[1])
+    deviance = np.inf
+    for _ in range(max_iter):
+        eta = design @ beta
+        mu = special.expit(eta)
+        w = mu * (1 - mu)
+        xtw = design.T * w
+        beta = linalg.solve(xtw @ design, xtw @ (eta + (y - mu) / w), assume_a="pos")
+        mu = special.expit(design @ beta)
+        previous = deviance
+        deviance = -2 * np.sum(special.xlogy(y, mu) + special.xlogy(1 - y, 1 - mu))
+        if abs(deviance - previous) <= tol:
+            break
+
+    mu = special.expit(design @ beta)
+    info = (design.T * (mu * (1 - mu))) @ design
+    se = np.sqrt(np.diag(linalg.inv(info)))
+    p = 2 * special.ndtr(-np.abs(beta / se))
+    return beta, se, p
+
+
 def ld_prune(corr_matrix: np.ndarray, threshold: float = 0.2) -> List[int]:
     """Simple LD pruning returning retained SNP indices."""
 
-    n = corr_matrix.shape[0]
-    keep: List[int] = []
+    corr = np.ascontiguousarray(corr_matrix, dtype=np.float64)
+    return _ld_prune_kernel(corr, float(threshold)).tolist()
+
+
+@njit(cache=True)
+def _ld_prune_kernel(corr: np.ndarray, threshold: float) -> np.ndarray:
+    """Greedy pruning loop of ``ld_prune``, compiled when Numba is available."""
+
+    n = corr.shape[0]
+    keep = np.empty(n, dtype=np.int64)
+    n_keep = 0
     for idx in range(n):
         correlated = False
-        for kept in keep:
-            if abs(corr_matrix[idx, kept]) > threshold:
+        for k in range(n_keep):
+            if abs(corr[idx, keep[k]]) > threshold:
                 correlated = True
                 break
         if not correlated:
-            keep.append(idx)
-    return keep
+            keep[n_keep] = idx
+            n_keep += 1
+    return keep[:n_keep]
 
 
 def _weighted_ls(X: np.ndarray, y: np.ndarray, w: np.ndarray) -> np.ndarray:
@@ -22,6 +22,7 @@ from .api import (  # noqa: E402 - re-export public API
     n_one_sample_prop,
     n_paired,
     n_two_prop,
+    n_two_prop_batch,
     power_logrank_from_n,
     required_events_cox,
     required_events_logrank,
@@ -34,6 +35,7 @@ __all__ = [
     "ZorT",
     "NIType",
     "n_two_prop",
+    "n_two_prop_batch",
     "n_mean",
     "n_paired",
     "n_one_sample_mean",
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from .endpoints.anova import n_anova as _n_anova
 from .endpoints.design_effects import (
@@ -32,6 +32,9 @@ from .endpoints.proportions import (
 from .endpoints.proportions import (
     n_two_prop as _n_two_prop,
 )
+from .endpoints.proportions import (
+    n_two_prop_batch as _n_two_prop_batch,
+)
 from .endpoints.survival import (
     events_to_n_exponential as _events_to_n_exponential,
 )
@@ -47,6 +50,12 @@ from .endpoints.survival import (
 from .multiplicity import alpha_adjust as _alpha_adjust
 from .multiplicity import bh_thresholds as _bh_thresholds
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike, NDArray
+
+    from .endpoints.design_effects import FloatOrArray, IntOrArray
+
 Tail = Literal["two-sided", "greater", "less"]
 ZorT = Literal["z", "t"]
 NIType = Literal["noninferiority", "equivalence"]
@@ -79,6 +88,24 @@ def n_two_prop(
     )
 
 
+def n_two_prop_batch(
+    p1: ArrayLike,
+    p2: ArrayLike,
+    alpha: ArrayLike = 0.05,
+    power: ArrayLike = 0.80,
+    ratio: ArrayLike = 1.0,
+    tail: Tail = "two-sided",
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    return _n_two_prop_batch(
+        p1=p1,
+        p2=p2,
+        alpha=alpha,
+        power=power,
+        ratio=ratio,
+        tail=tail,
+    )
+
+
 def n_mean(
     mu1: float,
     mu2: float,
@@ -265,19 +292,21 @@ def power_logrank_from_n(
     )
 
 
-def design_effect_cluster_equal(m: float, icc: float) -> float:
+def design_effect_cluster_equal(m: float | ArrayLike, icc: float | ArrayLike) -> FloatOrArray:
     return _design_effect_cluster_equal(m=m, icc=icc)
 
 
-def design_effect_cluster_unequal(mbar: float, icc: float, cv: float) -> float:
+def design_effect_cluster_unequal(
+    mbar: float | ArrayLike, icc: float | ArrayLike, cv: float | ArrayLike
+) -> FloatOrArray:
     return _design_effect_cluster_unequal(mbar=mbar, icc=icc, cv=cv)
 
 
-def design_effect_repeated_cs(k: int, icc: float) -> float:
+def design_effect_repeated_cs(k: int | ArrayLike, icc: float | ArrayLike) -> FloatOrArray:
     return _design_effect_repeated_cs(k=k, icc=icc)
 
 
-def inflate_n_by_de(n_individuals: int, de: float) -> int:
+def inflate_n_by_de(n_individuals: int | ArrayLike, de: float | ArrayLike) -> IntOrArray:
     return _inflate_n_by_de(n_individuals=n_individuals, de=de)
 
 
@@ -297,6 +326,7 @@ __all__ = [
     "NIType",
     "EntryDistribution",
     "n_two_prop",
+    "n_two_prop_batch",
     "n_mean",
     "n_paired",
     "n_one_sample_mean",
@@ -4,8 +4,7 @@ from __future__ import annotations
 
 import json
 import sys
-from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Callable, NamedTuple, cast
 
 try:  # Import Typer lazily so the library install stays lightweight.
     import typer
@@ -18,23 +17,32 @@ except ModuleNotFoundError:  # pragma: no cover - exercised only when CLI extra
         )
         return 1
 else:
-    from functools import wraps
+    import importlib
+    from collections.abc import Iterator
+    from contextlib import contextmanager
+    from functools import cache
 
     from typer import Exit
 
-    try:  # Optional rich pretty tables for TTY output
-        from rich.console import Console
-        from rich.table import Table
-    except ModuleNotFoundError:  # pragma: no cover - optional styling
-        Console = None  # type: ignore
-        Table = None  # type: ignore
+    from . import api
 
-    try:
-        from tabulate import tabulate
-    except ModuleNotFoundError:  # pragma: no cover - optional fallback
-        tabulate = None  # type: ignore
+    @cache
+    def _rich_backend() -> tuple[Any, Any] | None:
+        """Import Rich on first table render so JSON-only runs skip its import cost."""
+        try:  # Optional rich pretty tables for TTY output
+            console = importlib.import_module("rich.console")
+            table = importlib.import_module("rich.table")
+        except ModuleNotFoundError:  # pragma: no cover - optional styling
+            return None
+        return console.Console, table.Table
 
-    from . import api
+    @cache
+    def _tabulate_backend() -> Callable[..., str] | None:
+        try:
+            module = importlib.import_module("tabulate")
+        except ModuleNotFoundError:  # pragma: no cover - optional fallback
+            return None
+        return cast(Callable[..., str], module.tabulate)
 
     app = typer.Typer(
         add_completion=False,
@@ -48,19 +56,32 @@ else:
         ),
     )
 
-    @dataclass
-    class OutputSettings:
+    class OutputSettings(NamedTuple):
+        """Output preferences, normalised once in ``_configure``."""
+
         json: bool = True
         table: bool = False
 
-        def normalize(self) -> None:
-            if not self.json and not self.table:
-                self.json = True
-
     _SETTINGS = OutputSettings()
 
+    try:  # Optional faster JSON serialisation for scripted CLI loops
+        import orjson
+    except ModuleNotFoundError:  # pragma: no cover - optional speedup
+        orjson = None  # type: ignore
+
+    if orjson is not None:
+
+        def _dumps(payload: dict[str, Any]) -> str:
+            return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode()
+
+    else:
+        # Build the encoder once; payloads are plain nested dicts, never circular
+        _dumps = json.JSONEncoder(
+            sort_keys=True, separators=(",", ":"), check_circular=False
+        ).encode
+
     def _emit_json(payload: dict[str, Any]) -> None:
-        typer.echo(json.dumps(payload, sort_keys=True, separators=(",", ":")))
+        typer.echo(_dumps(payload))
 
     def _stdout_isatty() -> bool:
         isatty = getattr(sys.stdout, "isatty", None)
@@ -71,25 +92,46 @@ else:
                 return False
         return False
 
+    def _format_float(value: float) -> str:
+        return f"{value:.6g}"
+
+    def _format_sequence(value: list[Any] | tuple[Any, ...]) -> str:
+        return ", ".join(map(_format_value, value))
+
+    # Exact-type dispatch for the common payload types; subclasses fall through
+    _FORMATTERS: dict[type, Callable[[Any], str]] = {
+        float: _format_float,
+        int: str,
+        str: str,
+        list: _format_sequence,
+        tuple: _format_sequence,
+    }
+
     def _format_value(value: Any) -> str:
+        formatter = _FORMATTERS.get(type(value))
+        if formatter is not None:
+            return formatter(value)
         if isinstance(value, float):
-            return f"{value:.6g}"
+            return _format_float(value)
         if isinstance(value, (list, tuple)):
-            return ", ".join(_format_value(item) for item in value)
+            return _format_sequence(value)
         return str(value)
 
     def _emit_table(payload: dict[str, Any]) -> None:
         if not payload:
             return
-        if Console is not None and Table is not None and _stdout_isatty():
-            console = Console()
-            table = Table(show_edge=True)
+        rich = _rich_backend() if _stdout_isatty() else None
+        if rich is not None:
+            console_cls, table_cls = rich
+            console = console_cls()
+            table = table_cls(show_edge=True)
             table.add_column("key", justify="right")
             table.add_column("value", justify="left")
             for key, value in payload.items():
                 table.add_row(str(key), _format_value(value))
             console.print(table)
             return
+        tabulate = _tabulate_backend()
         if tabulate is not None:
             headers = ["key", "value"]
             rows = [(str(k), _format_value(v)) for k, v in payload.items()]
@@ -98,42 +140,52 @@ else:
         for key, value in payload.items():
             typer.echo(f"{key}: {_format_value(value)}")
 
-    def _emit(payload: dict[str, Any]) -> None:
-        _SETTINGS.normalize()
-        if _SETTINGS.json:
-            _emit_json(payload)
-        if _SETTINGS.table:
-            _emit_table(payload)
+    def _emit_both(payload: dict[str, Any]) -> None:
+        _emit_json(payload)
+        _emit_table(payload)
+
+    def _select_emitter(settings: OutputSettings) -> Callable[[dict[str, Any]], None]:
+        """Resolve output settings to one emitter so commands never re-check flags."""
+        if settings.table:
+            return _emit_both if settings.json else _emit_table
+        return _emit_json
+
+    _EMIT = _select_emitter(_SETTINGS)
 
     def _fail(message: str, code: int = 2) -> None:
         typer.echo(message, err=True)
         raise Exit(code)
 
+    def _parse_weight(item: str) -> float:
+        try:
+            value = float(item)  # float() already tolerates surrounding whitespace
+        except ValueError as exc:  # pragma: no cover
+            raise ValueError(f"invalid allocation weight: {item.strip()}") from exc
+        if value <= 0:
+            raise ValueError("allocation weights must be positive")
+        return value
+
     def _parse_allocation(allocation: str | None) -> list[float] | None:
         if allocation is None:
             return None
-        parts = [part.strip() for part in allocation.split(",") if part.strip()]
-        if not parts:
+        weights = [_parse_weight(part) for part in allocation.split(",") if part.strip()]
+        if not weights:
             raise ValueError("allocation must contain at least one positive weight")
-        weights: list[float] = []
-        for item in parts:
-            try:
-                value = float(item)
-            except ValueError as exc:  # pragma: no cover
-                raise ValueError(f"invalid allocation weight: {item}") from exc
-            if value <= 0:
-                raise ValueError("allocation weights must be positive")
-            weights.append(value)
         return weights
 
     _ALLOWED_TAILS = ("two-sided", "greater", "less")
     _ALLOWED_TESTS = ("z", "t")
     _ALLOWED_NI_TYPES = ("noninferiority", "equivalence")
     _ALLOWED_METHODS = ("bonferroni", "bh")
+    # Tuples keep the documented order for error messages; membership uses sets
+    _ALLOWED_SETS: dict[tuple[str, ...], frozenset[str]] = {
+        allowed: frozenset(allowed)
+        for allowed in (_ALLOWED_TAILS, _ALLOWED_TESTS, _ALLOWED_NI_TYPES, _ALLOWED_METHODS)
+    }
 
     def _normalize_choice(value: str, allowed: tuple[str, ...], name: str) -> str:
         normalized = value.replace("_", "-").lower()
-        if normalized not in allowed:
+        if normalized not in _ALLOWED_SETS[allowed]:
             raise ValueError(f"{name} must be one of {', '.join(allowed)}")
         return normalized
 
@@ -187,27 +239,22 @@ else:
             typer.echo(f"statdesign {__version__}")
             raise Exit(0)
 
-        global _SETTINGS
-        settings = OutputSettings(json=json_output, table=table_output)
-        settings.normalize()
-        _SETTINGS = settings
+        global _SETTINGS, _EMIT
+        # Fall back to JSON when every output format has been switched off
+        _SETTINGS = OutputSettings(json=json_output or not table_output, table=table_output)
+        _EMIT = _select_emitter(_SETTINGS)
 
-    def _handle_errors(func: Callable[..., dict[str, Any]]) -> Callable[..., None]:
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> None:
-            try:
-                payload = func(*args, **kwargs)
-            except ValueError as exc:
-                _fail(str(exc))
-            except (NotImplementedError, RuntimeError) as exc:
-                _fail(str(exc), code=3)
-            else:
-                _emit(payload)
-
-        return wrapper
+    @contextmanager
+    def _errors_as_exit() -> Iterator[None]:
+        """Translate calculation errors into CLI exit codes (2: invalid input, 3: unsupported)."""
+        try:
+            yield
+        except ValueError as exc:
+            _fail(str(exc))
+        except (NotImplementedError, RuntimeError) as exc:
+            _fail(str(exc), code=3)
 
     @app.command(name="n_two_prop")
-    @_handle_errors
     def n_two_prop(
         p1: float = typer.Option(..., min=0.0, max=1.0, help="Proportion for group 1."),
         p2: float = typer.Option(..., min=0.0, max=1.0, help="Proportion for group 2."),
@@ -230,7 +277,7 @@ else:
         ci: bool = typer.Option(
             False, "--ci", help="Include confidence interval assumptions in output."
         ),
-    ) -> dict[str, Any]:
+    ) -> None:
         """
         Sample size for two independent proportions.
 
@@ -239,48 +286,45 @@ else:
           statdesign n_two_prop --p1 0.3 --p2 0.4 --ratio 2.0 --tail greater
         """
 
-        from . import api  # Import api types locally
-
-        # Validate inputs
-        _validate_probability(p1, "p1")
-        _validate_probability(p2, "p2")
-        _validate_probability(alpha, "alpha")
-        _validate_probability(power, "power")
-        _validate_positive(ratio, "ratio")
-
-        test_norm = _normalize_choice(test, _ALLOWED_TESTS, "test")
-        tail_norm = _normalize_choice(tail, _ALLOWED_TAILS, "tail")
-        ni_type_norm = _normalize_optional(ni_type, _ALLOWED_NI_TYPES, "ni_type")
-
-        n1, n2 = api.n_two_prop(
-            p1=p1,
-            p2=p2,
-            alpha=alpha,
-            power=power,
-            ratio=ratio,
-            test=test_norm,  # type: ignore
-            tail=tail_norm,  # type: ignore
-            ni_margin=ni_margin,
-            ni_type=ni_type_norm,  # type: ignore
-            exact=exact,
-        )
-
-        result = {"n1": n1, "n2": n2}
-
-        if ci:
-            result["assumptions"] = {
-                "test": test_norm,
-                "tail": tail_norm,
-                "alpha": alpha,
-                "power": power,
-                "exact": exact,
-                "effect_size": abs(p1 - p2),
-            }
-
-        return result
+        with _errors_as_exit():
+            # Validate inputs
+            _validate_probability(p1, "p1")
+            _validate_probability(p2, "p2")
+            _validate_probability(alpha, "alpha")
+            _validate_probability(power, "power")
+            _validate_positive(ratio, "ratio")
+
+            test_norm = _normalize_choice(test, _ALLOWED_TESTS, "test")
+            tail_norm = _normalize_choice(tail, _ALLOWED_TAILS, "tail")
+            ni_type_norm = _normalize_optional(ni_type, _ALLOWED_NI_TYPES, "ni_type")
+
+            n1, n2 = api.n_two_prop(
+                p1=p1,
+                p2=p2,
+                alpha=alpha,
+                power=power,
+                ratio=ratio,
+                test=test_norm,  # type: ignore
+                tail=tail_norm,  # type: ignore
+                ni_margin=ni_margin,
+                ni_type=ni_type_norm,  # type: ignore
+                exact=exact,
+            )
+
+            payload: dict[str, Any] = {"n1": n1, "n2": n2}
+
+            if ci:
+                payload["assumptions"] = {
+                    "test": test_norm,
+                    "tail": tail_norm,
+                    "alpha": alpha,
+                    "power": power,
+                    "exact": exact,
+                    "effect_size": abs(p1 - p2),
+                }
+            _EMIT(payload)
 
     @app.command(name="n_one_sample_prop")
-    @_handle_errors
     def n_one_sample_prop(
         p: float = typer.Option(..., min=0.0, max=1.0, help="Observed proportion."),
         p0: float = typer.Option(..., min=0.0, max=1.0, help="Null hypothesis proportion."),
@@ -290,25 +334,26 @@ else:
         exact: bool = typer.Option(False, help="Use exact binomial enumeration."),
         ni_margin: float | None = typer.Option(None, help="Non-inferiority/equivalence margin."),
         ni_type: str | None = typer.Option(None, help="Margin type."),
-    ) -> dict[str, Any]:
+    ) -> None:
         """Sample size for a one-sample proportion test."""
 
-        tail_norm = _normalize_choice(tail, _ALLOWED_TAILS, "tail")
-        ni_type_norm = _normalize_optional(ni_type, _ALLOWED_NI_TYPES, "ni_type")
-        n = api.n_one_sample_prop(
-            p=p,
-            p0=p0,
-            alpha=alpha,
-            power=power,
-            tail=tail_norm,
-            exact=exact,
-            ni_margin=ni_margin,
-            ni_type=ni_type_norm,
-        )
-        return {"n": n}
+        with _errors_as_exit():
+            tail_norm = _normalize_choice(tail, _ALLOWED_TAILS, "tail")
+            ni_type_norm = _normalize_optional(ni_type, _ALLOWED_NI_TYPES, "ni_type")
+            n = api.n_one_sample_prop(
+                p=p,
+                p0=p0,
+                alpha=alpha,
+                power=power,
+                tail=tail_norm,
+                exact=exact,
+                ni_margin=ni_margin,
+                ni_type=ni_type_norm,
+            )
+            payload = {"n": n}
+            _EMIT(payload)
 
     @app.command(name="n_mean")
-    @_handle_errors
     def n_mean(
         mu1: float = typer.Option(..., help="Mean for arm 1."),
         mu2: float = typer.Option(..., help="Mean for arm 2."),
@@ -320,28 +365,29 @@ else:
         tail: str = typer.Option("two-sided", help="Alternative hypothesis tail."),
         ni_margin: float | None = typer.Option(None, help="Non-inferiority/equivalence margin."),
         ni_type: str | None = typer.Option(None, help="Margin type."),
-    ) -> dict[str, Any]:
+    ) -> None:
         """Sample size for two independent means with shared variance."""
 
-        test_norm = _normalize_choice(test, _ALLOWED_TESTS, "test")
-        tail_norm = _normalize_choice(tail, _ALLOWED_TAILS, "tail")
-        ni_type_norm = _normalize_optional(ni_type, _ALLOWED_NI_TYPES, "ni_type")
-        n1, n2 = api.n_mean(
-            mu1=mu1,
-            mu2=mu2,
-            sd=sd,
-            alpha=alpha,
-            power=power,
-            ratio=ratio,
-            test=test_norm,
-            tail=tail_norm,
-            ni_margin=ni_margin,
-            ni_type=ni_type_norm,
-        )
-        return {"n1": n1, "n2": n2}
+        with _errors_as_exit():
+            test_norm = _normalize_choice(test, _ALLOWED_TESTS, "test")
+            tail_norm = _normalize_choice(tail, _ALLOWED_TAILS, "tail")
+            ni_type_norm = _normalize_optional(ni_type, _ALLOWED_NI_TYPES, "ni_type")
+            n1, n2 = api.n_mean(
+                mu1=mu1,
+                mu2=mu2,
+                sd=sd,
+                alpha=alpha,
+                power=power,
+                ratio=ratio,
+                test=test_norm,
+                tail=tail_norm,
+                ni_margin=ni_margin,
+                ni_type=ni_type_norm,
+            )
+            payload = {"n1": n1, "n2": n2}
+            _EMIT(payload)
 
     @app.command(name="n_one_sample_mean")
-    @_handle_errors
     def n_one_sample_mean(
         delta: float = typer.Option(..., help="Difference from null mean."),
         sd: float = typer.Option(..., min=0.0, help="Standard deviation."),
@@ -351,26 +397,27 @@ else:
         test: str = typer.Option("t", help="Test statistic ('z' or 't')."),
         ni_margin: float | None = typer.Option(None, help="Non-inferiority/equivalence margin."),
         ni_type: str | None = typer.Option(None, help="Margin type."),
-    ) -> dict[str, Any]:
+    ) -> None:
         """Sample size for a one-sample mean test."""
 
-        tail_norm = _normalize_choice(tail, _ALLOWED_TAILS, "tail")
-        test_norm = _normalize_choice(test, _ALLOWED_TESTS, "test")
-        ni_type_norm = _normalize_optional(ni_type, _ALLOWED_NI_TYPES, "ni_type")
-        n = api.n_one_sample_mean(
-            delta=delta,
-            sd=sd,
-            alpha=alpha,
-            power=power,
-            tail=tail_norm,
-            test=test_norm,
-            ni_margin=ni_margin,
-            ni_type=ni_type_norm,
-        )
-        return {"n": n}
+        with _errors_as_exit():
+            tail_norm = _normalize_choice(tail, _ALLOWED_TAILS, "tail")
+            test_norm = _normalize_choice(test, _ALLOWED_TESTS, "test")
+            ni_type_norm = _normalize_optional(ni_type, _ALLOWED_NI_TYPES, "ni_type")
+            n = api.n_one_sample_mean(
+                delta=delta,
+                sd=sd,
+                alpha=alpha,
+                power=power,
+                tail=tail_norm,
+                test=test_norm,
+                ni_margin=ni_margin,
+                ni_type=ni_type_norm,
+            )
+            payload = {"n": n}
+            _EMIT(payload)
 
     @app.command(name="n_paired")
-    @_handle_errors
     def n_paired(
         delta: float = typer.Option(..., help="Mean paired difference."),
         sd_diff: float = typer.Option(..., min=0.0, help="SD of paired differences."),
@@ -379,24 +426,25 @@ else:
         tail: str = typer.Option("two-sided", help="Alternative hypothesis tail."),
         ni_margin: float | None = typer.Option(None, help="Non-inferiority/equivalence margin."),
         ni_type: str | None = typer.Option(None, help="Margin type."),
-    ) -> dict[str, Any]:
+    ) -> None:
         """Sample size for paired mean comparisons."""
 
-        tail_norm = _normalize_choice(tail, _ALLOWED_TAILS, "tail")
-        ni_type_norm = _normalize_optional(ni_type, _ALLOWED_NI_TYPES, "ni_type")
-        n = api.n_paired(
-            delta=delta,
-            sd_diff=sd_diff,
-            alpha=alpha,
-            power=power,
-            tail=tail_norm,
-            ni_margin=ni_margin,
-            ni_type=ni_type_norm,
-        )
-        return {"n": n}
+        with _errors_as_exit():
+            tail_norm = _normalize_choice(tail, _ALLOWED_TAILS, "tail")
+            ni_type_norm = _normalize_optional(ni_type, _ALLOWED_NI_TYPES, "ni_type")
+            n = api.n_paired(
+                delta=delta,
+                sd_diff=sd_diff,
+                alpha=alpha,
+                power=power,
+                tail=tail_norm,
+                ni_margin=ni_margin,
+                ni_type=ni_type_norm,
+            )
+            payload = {"n": n}
+            _EMIT(payload)
 
     @app.command(name="n_anova")
-    @_handle_errors
     def n_anova(
         k_groups: int = typer.Option(..., min=2, help="Number of groups."),
         effect_f: float = typer.Option(..., min=0.0, help="Cohen's f effect size."),
@@ -406,24 +454,24 @@ else:
             None,
             help="Comma separated allocation weights (defaults to equal).",
         ),
-    ) -> dict[str, Any]:
+    ) -> None:
         """Total sample size for fixed-effects one-way ANOVA."""
 
-        weights = _parse_allocation(allocation)
-        n_total = api.n_anova(
-            k_groups=k_groups,
-            effect_f=effect_f,
-            alpha=alpha,
-            power=power,
-            allocation=weights,
-        )
-        payload: dict[str, Any] = {"n_total": n_total}
-        if weights is not None:
-            payload["allocation"] = weights
-        return payload
+        with _errors_as_exit():
+            weights = _parse_allocation(allocation)
+            n_total = api.n_anova(
+                k_groups=k_groups,
+                effect_f=effect_f,
+                alpha=alpha,
+                power=power,
+                allocation=weights,
+            )
+            payload: dict[str, Any] = {"n_total": n_total}
+            if weights is not None:
+                payload["allocation"] = weights
+            _EMIT(payload)
 
     @app.command(name="alpha_adjust")
-    @_handle_errors
     def alpha_adjust(
         m: int = typer.Option(..., min=1, help="Number of hypotheses."),
         alpha: float = typer.Option(0.05, min=0.0, max=1.0),
@@ -431,26 +479,30 @@ else:
             "bonferroni",
             help="Adjustment method ('bonferroni' or 'bh').",
         ),
-    ) -> dict[str, Any]:
+    ) -> None:
         """Compute family-wise error rate adjustments."""
 
-        method_norm = _normalize_choice(method, _ALLOWED_METHODS, "method")
-        if method_norm == "bonferroni":
-            value = api.alpha_adjust(m=m, alpha=alpha, method="bonferroni")
-            return {"alpha": value}
-        thresholds = api.bh_thresholds(m=m, alpha=alpha)
-        return {"thresholds": thresholds}
+        with _errors_as_exit():
+            method_norm = _normalize_choice(method, _ALLOWED_METHODS, "method")
+            if method_norm == "bonferroni":
+                value = api.alpha_adjust(m=m, alpha=alpha, method="bonferroni")
+                payload: dict[str, Any] = {"alpha": value}
+            else:
+                thresholds = api.bh_thresholds(m=m, alpha=alpha)
+                payload = {"thresholds": thresholds}
+            _EMIT(payload)
 
     @app.command(name="bh_thresholds")
-    @_handle_errors
     def bh_thresholds(
         m: int = typer.Option(..., min=1, help="Number of hypotheses."),
         alpha: float = typer.Option(0.05, min=0.0, max=1.0),
-    ) -> dict[str, Any]:
+    ) -> None:
         """Benjamini–Hochberg critical values."""
 
-        thresholds = api.bh_thresholds(m=m, alpha=alpha)
-        return {"thresholds": thresholds}
+        with _errors_as_exit():
+            thresholds = api.bh_thresholds(m=m, alpha=alpha)
+            payload = {"thresholds": thresholds}
+            _EMIT(payload)
 
     def generate_cli_schema() -> dict[str, Any]:
         """Generate JSON schema for CLI output validation."""
@@ -533,14 +585,15 @@ else:
         }
 
     @app.command(name="cli-schema")
-    @_handle_errors
     def cli_schema(
         version: str = typer.Option("v1", help="Schema version to output.")
-    ) -> dict[str, Any]:
+    ) -> None:
         """Output JSON schema for CLI validation."""
-        if version != "v1":
-            raise ValueError(f"Unsupported schema version: {version}")
-        return generate_cli_schema()
+        with _errors_as_exit():
+            if version != "v1":
+                raise ValueError(f"Unsupported schema version: {version}")
+            payload = generate_cli_schema()
+            _EMIT(payload)
 
     @app.command(name="validate")
     def validate_output(
@@ -556,7 +609,6 @@ else:
         
         # Read input
         if input_file == "-":
-            import sys
             content = sys.stdin.read()
         else:
             try:
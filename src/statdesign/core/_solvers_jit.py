@@ -0,0 +1,225 @@
+"""Closure-free solver kernels for the two-proportion normal approximation.
+
+The generic :func:`statdesign.core.solve.solve_monotone_int` dispatches a Python
+callable on every probe. For the two-proportion ``z`` path the power function is
+plain arithmetic plus ``erf``, so the search and the power formula are fused
+here into a single kernel. When Numba is installed (``pip install
+'statdesign[jit]'``) the kernels are compiled with ``@njit(cache=True)``;
+otherwise they run as ordinary Python with identical results.
+
+Normal quantiles are computed by the caller and passed in as ``crit`` so the
+kernels only need the CDF, which matches :class:`statistics.NormalDist`
+bit-for-bit.
+
+Each kernel carries an explicit Numba signature, so compilation happens eagerly
+when the module is imported. Together with ``cache=True`` the machine code is
+written to ``__pycache__`` on the first import and loaded from there afterwards.
+The first solve therefore never pays JIT latency, which would otherwise
+dominate a short CLI run.
+
+Numba cannot call back into the Python solver, so :func:`solve_two_prop_z` and
+:func:`_guess_two_prop_z` are deliberate copies of
+:func:`statdesign.core.solve.solve_monotone_int` and
+``proportions._two_prop_guess``. ``tests/test_solvers_jit.py`` pins each pair
+against the other over a grid of designs; change them together. The Python
+solver's fallback for non-finite probes has no counterpart here because the
+normal power below is finite for every valid design.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+try:
+    from numba import njit, prange
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    prange = range  # type: ignore[misc]
+
+    def njit(*args: Any, **kwargs: Any) -> Any:  # type: ignore[no-redef]
+        """Fallback no-op decorator used when Numba is unavailable."""
+
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Any) -> Any:
+            return func
+
+        return decorator
+
+    HAS_NUMBA = False
+else:  # pragma: no cover - exercised only when numba is installed
+    HAS_NUMBA = True
+
+TAIL_CODES = {"two-sided": 0, "greater": 1, "less": 2}
+
+_SQRT2 = math.sqrt(2.0)
+
+
+@njit("float64(float64)", cache=True)
+def _cdf(x: float) -> float:
+    return 0.5 * (1.0 + math.erf(x / _SQRT2))
+
+
+@njit("float64(int64, float64, float64, float64, float64, int64)", cache=True)
+def power_two_prop_z(
+    n1: int, p1: float, p2: float, ratio: float, crit: float, tail_code: int
+) -> float:
+    """Two-proportion power for ``n1`` mirroring the corrected normal evaluator."""
+
+    n1 = max(n1, 2)
+    n2 = max(1, int(math.ceil(n1 * ratio)))
+    delta = p1 - p2
+    if n1 != n2:
+        pooled = (p1 * n1 + p2 * n2) / (n1 + n2)
+        se = math.sqrt(pooled * (1.0 - pooled) * (1.0 / n1 + 1.0 / n2))
+        effect = delta / se
+        if tail_code == 0:
+            return (1.0 - _cdf(crit - effect)) + _cdf(-crit - effect)
+        if tail_code == 1:
+            return 1.0 - _cdf(crit - effect)
+        return _cdf(crit - effect)
+
+    p_pooled = (p1 + p2) / 2.0
+    se_null = math.sqrt(2.0 * p_pooled * (1.0 - p_pooled) / n1)
+    se_alt = math.sqrt((p1 * (1.0 - p1) + p2 * (1.0 - p2)) / n1)
+    boundary = crit * se_null
+    if tail_code == 0:
+        abs_delta = abs(delta)
+        upper = 1.0 - _cdf((boundary - abs_delta) / se_alt)
+        return upper + _cdf((-boundary - abs_delta) / se_alt)
+    if tail_code == 1:
+        return 1.0 - _cdf((boundary - delta) / se_alt)
+    return _cdf((boundary - delta) / se_alt)
+
+
+@njit(
+    "int64(float64, float64, float64, float64, int64, float64, int64, int64, int64)",
+    cache=True,
+)
+def solve_two_prop_z(
+    p1: float,
+    p2: float,
+    ratio: float,
+    crit: float,
+    tail_code: int,
+    target: float,
+    lower: int,
+    guess: int,
+    max_value: int,
+) -> int:
+    """Minimal ``n1`` reaching ``target`` power; ``-1`` if no bracket exists.
+
+    Follows the same probe sequence as ``solve_monotone_int`` (seeded by
+    ``guess`` when positive) so both paths return the same ``n1``.
+    """
+
+    low = lower
+    upper = -1
+    if guess > 0:
+        guess = min(max(guess, lower), max_value)
+        if power_two_prop_z(guess, p1, p2, ratio, crit, tail_code) >= target:
+            if guess == lower or (
+                power_two_prop_z(guess - 1, p1, p2, ratio, crit, tail_code) < target
+            ):
+                return guess
+            upper = guess - 1
+            step = 1
+            while upper > low:
+                probe = max(low, upper - step)
+                if power_two_prop_z(probe, p1, p2, ratio, crit, tail_code) < target:
+                    low = probe + 1
+                    break
+                upper = probe
+                step *= 2
+        else:
+            step = 1
+            while True:
+                if guess >= max_value:
+                    return -1
+                low = guess + 1
+                guess = min(max_value, guess + step)
+                if power_two_prop_z(guess, p1, p2, ratio, crit, tail_code) >= target:
+                    upper = guess
+                    break
+                step *= 2
+
+    if upper < 0:
+        upper = max(low, 2)
+        while power_two_prop_z(upper, p1, p2, ratio, crit, tail_code) < target:
+            if upper >= max_value:
+                return -1
+            upper = min(max_value, upper * 2)
+
+    high = upper
+    while low < high:
+        mid = (low + high) >> 1
+        if power_two_prop_z(mid, p1, p2, ratio, crit, tail_code) >= target:
+            high = mid
+        else:
+            low = mid + 1
+    return max(low, lower)
+
+
+@njit("int64(float64, float64, float64, float64, float64)", cache=True)
+def _guess_two_prop_z(p1: float, p2: float, ratio: float, z_alpha: float, z_beta: float) -> int:
+    """Closed-form seed matching ``proportions._two_prop_guess``; ``0`` when undefined."""
+
+    if ratio == 1.0:
+        p_bar = (p1 + p2) / 2.0
+        scale_null = math.sqrt(2.0 * p_bar * (1.0 - p_bar))
+        scale_alt = math.sqrt(p1 * (1.0 - p1) + p2 * (1.0 - p2))
+    else:
+        pooled = (p1 + p2 * ratio) / (1.0 + ratio)
+        scale_null = math.sqrt(pooled * (1.0 - pooled) * (1.0 + 1.0 / ratio))
+        scale_alt = scale_null
+    effect = p1 - p2
+    if effect == 0.0 or scale_null <= 0.0 or scale_alt <= 0.0:
+        return 0
+    n = ((z_alpha * scale_null + z_beta * scale_alt) / effect) ** 2
+    if not math.isfinite(n):
+        return 0
+    return max(1, int(math.ceil(n)))
+
+
+@njit(
+    "void(float64[:], float64[:], float64[:], float64[:], float64[:], float64[:], float64[:],"
+    " int64, int64[:])",
+    parallel=True,
+    cache=True,
+)
+def solve_two_prop_z_batch(
+    p1: NDArray[np.float64],
+    p2: NDArray[np.float64],
+    ratio: NDArray[np.float64],
+    crit: NDArray[np.float64],
+    z_alpha: NDArray[np.float64],
+    z_beta: NDArray[np.float64],
+    target: NDArray[np.float64],
+    tail_code: int,
+    out: NDArray[np.int64],
+) -> None:
+    """Fill ``out`` with the minimal ``n1`` for every design; ``-1`` where unbracketed.
+
+    All inputs are 1-D arrays of equal length except ``tail_code``. Designs are
+    independent, so the loop runs across threads under Numba.
+    """
+
+    for i in prange(p1.shape[0]):
+        guess = _guess_two_prop_z(p1[i], p2[i], ratio[i], z_alpha[i], z_beta[i])
+        out[i] = solve_two_prop_z(
+            p1[i], p2[i], ratio[i], crit[i], tail_code, target[i], 2, guess, 1_000_000
+        )
+
+
+__all__ = [
+    "HAS_NUMBA",
+    "TAIL_CODES",
+    "power_two_prop_z",
+    "solve_two_prop_z",
+    "solve_two_prop_z_batch",
+]
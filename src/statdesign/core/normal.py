@@ -2,18 +2,33 @@
 
 from __future__ import annotations
 
+import math
 from statistics import NormalDist
 
 _NORMAL = NormalDist()
+_SQRT2 = math.sqrt(2.0)
+
+# Quantiles are requested for a handful of recurring levels (1 - alpha/2,
+# power, ...), so memoise them; the cap keeps long parameter sweeps bounded.
+_PPF_CACHE: dict[float, float] = {}
+_PPF_CACHE_MAX = 1024
 
 
 def ppf(p: float) -> float:
-    return float(_NORMAL.inv_cdf(p))
+    value = _PPF_CACHE.get(p)
+    if value is None:
+        value = float(_NORMAL.inv_cdf(p))
+        if len(_PPF_CACHE) >= _PPF_CACHE_MAX:
+            _PPF_CACHE.clear()
+        _PPF_CACHE[p] = value
+    return value
 
 
+# Same expression as NormalDist().cdf for mu=0, sigma=1, minus the method
+# dispatch and the (x - mu) / sigma rescaling.
 def cdf(x: float) -> float:
-    return float(_NORMAL.cdf(x))
+    return 0.5 * (1.0 + math.erf(x / _SQRT2))
 
 
 def sf(x: float) -> float:
-    return float(1.0 - _NORMAL.cdf(x))
+    return 1.0 - 0.5 * (1.0 + math.erf(x / _SQRT2))
@@ -3,9 +3,85 @@
 from __future__ import annotations
 
 import math
-from typing import Callable
+from collections.abc import Callable, Sequence
 
 PowerFn = Callable[[int], float]
+BatchPowerFn = Callable[[Sequence[int]], Sequence[float]]
+
+
+def normal_approx_n(
+    effect: float,
+    z_alpha: float,
+    z_beta: float,
+    scale_null: float = 1.0,
+    scale_alt: float | None = None,
+) -> int | None:
+    """Closed-form normal-approximation sample size used to seed the solver.
+
+    Solves ``z_alpha * scale_null + z_beta * scale_alt = |effect| * sqrt(n)``
+    for ``n`` (``scale_alt`` defaults to ``scale_null``). Returns ``None`` when
+    the effect is zero or the inputs are degenerate so callers can fall back to
+    plain bracketing.
+    """
+
+    if scale_alt is None:
+        scale_alt = scale_null
+    if effect == 0.0 or scale_null <= 0.0 or scale_alt <= 0.0:
+        return None
+    n = ((z_alpha * scale_null + z_beta * scale_alt) / effect) ** 2
+    if not math.isfinite(n):
+        return None
+    return max(1, int(math.ceil(n)))
+
+
+class _NonFiniteProbe(Exception):
+    """Raised internally when the evaluator returns NaN or an infinity."""
+
+
+def _bracket_from_guess(
+    evaluator: PowerFn, target: float, lower: int, guess: int, max_value: int
+) -> tuple[int, int] | None:
+    """Gallop outwards from ``guess`` to a ``(low, high)`` bracket of the answer.
+
+    Returns ``None`` when a probe is not finite (e.g. a NaN from SciPy's
+    noncentral ``t``), since such a probe cannot be ordered against the target
+    and the caller must fall back to plain bracketing.
+    """
+
+    def reaches(n: int) -> bool:
+        value = evaluator(n)
+        if not math.isfinite(value):
+            raise _NonFiniteProbe
+        return value >= target
+
+    low = lower
+    guess = min(max(guess, lower), max_value)
+    try:
+        if reaches(guess):
+            if guess == lower or not reaches(guess - 1):
+                return guess, guess
+            # Gallop downwards from the guess to tighten the bracket
+            upper = guess - 1
+            step = 1
+            while upper > low:
+                probe = max(low, upper - step)
+                if not reaches(probe):
+                    return probe + 1, upper
+                upper = probe
+                step *= 2
+            return low, upper
+        # Gallop upwards so a near miss costs a handful of evaluations
+        step = 1
+        while True:
+            if guess >= max_value:
+                raise RuntimeError("Failed to bracket solution before reaching max sample size")
+            low = guess + 1
+            guess = min(max_value, guess + step)
+            if reaches(guess):
+                return low, guess
+            step *= 2
+    except _NonFiniteProbe:
+        return None
 
 
 def solve_monotone_int(
@@ -15,12 +91,24 @@ def solve_monotone_int(
     upper: int | None = None,
     max_iterations: int = 64,
     max_value: int = 1_000_000,
+    initial_guess: int | None = None,
+    upper_hint: int | None = None,
 ) -> int:
     """Return the minimal integer n >= lower such that evaluator(n) >= target.
 
     The callable must be non-decreasing in n. The function expands the upper
     bracket exponentially until the target is exceeded or the configured
     maximum is hit, then performs integer bisection.
+
+    When ``initial_guess`` is supplied (typically a closed-form normal
+    approximation) the guess and its predecessor are checked first; if they
+    straddle the target the guess is returned after two evaluations, otherwise
+    the bracket is grown outwards from the guess before bisecting. A non-finite
+    probe during that gallop discards the guess in favour of plain bracketing.
+
+    ``upper_hint`` is a cheaper alternative for evaluators without a reliable
+    closed-form guess: a single evaluation at the hint replaces most of the
+    doubling expansion when the hint already exceeds the target.
     """
 
     if not 0 < target < 1:
@@ -28,8 +116,21 @@ def solve_monotone_int(
     if lower < 1:
         raise ValueError("lower bound must be >= 1")
 
+    low = lower
+    if upper is None and initial_guess is not None:
+        bracket = _bracket_from_guess(evaluator, target, lower, initial_guess, max_value)
+        if bracket is not None:
+            low, upper = bracket
+
+    if upper is None and upper_hint is not None:
+        hint = min(max(upper_hint, low), max_value)
+        if evaluator(hint) >= target:
+            upper = hint
+        else:
+            low = hint + 1
+
     if upper is None:
-        upper = max(lower, 2)
+        upper = max(low, 2)
         value = evaluator(upper)
         # Expand until we exceed target or hit max_value
         while value < target:
@@ -37,16 +138,11 @@ def solve_monotone_int(
                 raise RuntimeError("Failed to bracket solution before reaching max sample size")
             upper = min(max_value, int(math.ceil(upper * 2)))
             value = evaluator(upper)
-    else:
-        value = evaluator(upper)
 
-    low = lower
     high = upper
 
     while low < high:
-        mid = (low + high) // 2
-        if mid == high:
-            break
+        mid = (low + high) >> 1  # low < high guarantees mid < high
         val = evaluator(mid)
         if val >= target:
             high = mid
@@ -54,3 +150,34 @@ def solve_monotone_int(
             low = mid + 1
 
     return max(low, lower)
+
+
+def solve_monotone_band(
+    evaluator: BatchPowerFn,
+    target: float,
+    guess: int,
+    lower: int = 2,
+    width: int = 16,
+    max_value: int = 1_000_000,
+) -> int | None:
+    """Read the minimal n off one batched evaluation of ``width`` candidates.
+
+    The band is centred on ``guess``. Returns ``None`` when the crossing is not
+    inside the band, cannot be confirmed minimal, or the band contains a NaN
+    (which breaks monotonicity), so callers can fall back to
+    :func:`solve_monotone_int`, which gives the same answer.
+    """
+
+    if not 0 < target < 1:
+        raise ValueError("target power must be in (0, 1)")
+    start = min(max(guess - width // 2, lower), max_value)
+    candidates = list(range(start, min(start + width, max_value + 1)))
+    values = evaluator(candidates)
+    if any(math.isnan(value) for value in values):
+        return None
+    for index, value in enumerate(values):
+        if value >= target:
+            if index == 0 and start > lower:
+                return None
+            return candidates[index]
+    return None
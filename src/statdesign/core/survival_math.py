@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import math
 from typing import Literal
 
@@ -15,6 +16,7 @@ def _validate_tail(tail: Tail) -> None:
         raise ValueError(f"unsupported tail specification: {tail}")
 
 
+@functools.lru_cache(maxsize=64)
 def _z_alpha(alpha: float, tail: Tail) -> float:
     if not 0 < alpha < 1:
         raise ValueError("alpha must be in (0, 1)")
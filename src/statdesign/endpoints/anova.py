@@ -9,9 +9,10 @@ slightly conservative near the detection boundary.
 
 from __future__ import annotations
 
+import math
 from collections.abc import Iterable
 
-from ..core import alloc, ncf, solve
+from ..core import alloc, ncf, normal, solve
 
 
 def _validate_inputs(k_groups: int, effect_f: float, alpha: float, power: float) -> None:
@@ -36,6 +37,15 @@ def _normalize_allocation(k_groups: int, allocation: Iterable[float] | None) ->
     return weights
 
 
+def _upper_hint(k_groups: int, effect_f: float, alpha: float, power: float) -> int:
+    """Generous bracket from a chi-square approximation of the required noncentrality."""
+
+    df_num = k_groups - 1
+    crit = ncf._chi2_ppf(1.0 - alpha, df_num)
+    lambda_ = (math.sqrt(crit) + normal.ppf(power)) ** 2
+    return int(math.ceil(4.0 * lambda_ / effect_f**2))
+
+
 def n_anova(
     k_groups: int,
     effect_f: float,
@@ -69,7 +79,10 @@ def n_anova(
         return ncf.power_noncentral_f(lambda_, df_num, df_den, alpha)
 
     lower = k_groups * 2
-    n_total = solve.solve_monotone_int(evaluator, power, lower=lower)
+    # Rounding weighted allocations makes power slightly non-monotone in the
+    # total, so only the equal-allocation curve may be bracketed early.
+    hint = _upper_hint(k_groups, effect_f, alpha, power) if allocation is None else None
+    n_total = solve.solve_monotone_int(evaluator, power, lower=lower, upper_hint=hint)
     return max(n_total, lower)
 
 
@@ -1,53 +1,120 @@
-"""Design effect utilities for clustered and repeated measures designs."""
+"""Design effect utilities for clustered and repeated measures designs.
+
+Every function accepts plain floats as well as NumPy array-likes. Scalar inputs
+stay on a pure-Python path; array inputs (e.g. an ICC x cluster-size grid for a
+sensitivity sweep) are broadcast in a single vectorised expression. NumPy is
+only imported when an array is actually passed.
+"""
 
 from __future__ import annotations
 
+import importlib
 import math
+import numbers
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike, NDArray
+
+    FloatOrArray = float | NDArray[np.float64]
+    IntOrArray = int | NDArray[np.int64]
+
+
+def _numpy() -> Any:
+    try:
+        return importlib.import_module("numpy")
+    except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError(
+            "array inputs to design effect helpers require numpy; install "
+            "statdesign[scipy] or add numpy to your environment."
+        ) from exc
+
 
+def _coerce(*values: Any) -> tuple[Any, ...]:
+    """Return ``values`` untouched when all are scalars, else as float arrays."""
 
-def _validate_positive(value: float, name: str) -> None:
-    if value <= 0:
+    if all(isinstance(value, numbers.Real) for value in values):
+        return values
+    np = _numpy()
+    return tuple(np.asarray(value, dtype=float) for value in values)
+
+
+def _any(condition: Any) -> bool:
+    if hasattr(condition, "any"):
+        return bool(condition.any())
+    return bool(condition)
+
+
+def _validate_positive(value: Any, name: str) -> None:
+    if _any(value <= 0):
         raise ValueError(f"{name} must be positive")
 
 
-def design_effect_cluster_equal(m: float, icc: float) -> float:
+def _validate_icc(icc: Any) -> None:
+    if hasattr(icc, "all"):
+        valid = bool(((icc >= 0) & (icc < 1)).all())
+    else:
+        valid = 0 <= icc < 1
+    if not valid:
+        raise ValueError("icc must be in [0, 1)")
+
+
+def _validate_repeated(k: Any, icc: Any) -> None:
+    """Check ``k >= 1`` and ``icc`` in [0, 1) in one pass; diagnose only on failure."""
+
+    if hasattr(k, "all"):
+        valid = bool(((k >= 1) & (icc >= 0) & (icc < 1)).all())
+    else:
+        valid = k >= 1 and 0 <= icc < 1
+    if valid:
+        return
+    if _any(k < 1):
+        raise ValueError("k must be at least 1")
+    _validate_icc(icc)
+
+
+def design_effect_cluster_equal(m: float | ArrayLike, icc: float | ArrayLike) -> FloatOrArray:
     """Return design effect for equal cluster sizes."""
 
-    _validate_positive(m, "m")
-    if not 0 <= icc < 1:
-        raise ValueError("icc must be in [0, 1)")
-    return 1.0 + (m - 1.0) * icc
+    m_, icc_ = _coerce(m, icc)
+    _validate_positive(m_, "m")
+    _validate_icc(icc_)
+    return cast("FloatOrArray", 1.0 + (m_ - 1.0) * icc_)
 
 
-def design_effect_cluster_unequal(mbar: float, icc: float, cv: float) -> float:
+def design_effect_cluster_unequal(
+    mbar: float | ArrayLike, icc: float | ArrayLike, cv: float | ArrayLike
+) -> FloatOrArray:
     """Return design effect for unequal cluster sizes."""
 
-    _validate_positive(mbar, "mbar")
-    if not 0 <= icc < 1:
-        raise ValueError("icc must be in [0, 1)")
-    if cv < 0:
+    mbar_, icc_, cv_ = _coerce(mbar, icc, cv)
+    _validate_positive(mbar_, "mbar")
+    _validate_icc(icc_)
+    if _any(cv_ < 0):
         raise ValueError("cv must be non-negative")
-    return 1.0 + icc * (mbar - 1.0 + cv**2)
+    return cast("FloatOrArray", 1.0 + icc_ * (mbar_ - 1.0 + cv_ * cv_))
 
 
-def design_effect_repeated_cs(k: int, icc: float) -> float:
+def design_effect_repeated_cs(k: int | ArrayLike, icc: float | ArrayLike) -> FloatOrArray:
     """Variance inflation under compound symmetry for repeated measures."""
 
-    if k < 1:
-        raise ValueError("k must be at least 1")
-    if not 0 <= icc < 1:
-        raise ValueError("icc must be in [0, 1)")
-    return 1.0 + (k - 1.0) * icc
+    k_, icc_ = _coerce(k, icc)
+    _validate_repeated(k_, icc_)
+    return cast("FloatOrArray", 1.0 + (k_ - 1.0) * icc_)
 
 
-def inflate_n_by_de(n_individuals: int, de: float) -> int:
+def inflate_n_by_de(n_individuals: int | ArrayLike, de: float | ArrayLike) -> IntOrArray:
     """Inflate an individual-level sample size by a design effect."""
 
-    if n_individuals < 0:
+    n_, de_ = _coerce(n_individuals, de)
+    if _any(n_ < 0):
         raise ValueError("n_individuals must be non-negative")
-    if de <= 0:
-        raise ValueError("de must be positive")
-    return int(math.ceil(n_individuals * de))
+    _validate_positive(de_, "de")
+    inflated = n_ * de_
+    if isinstance(inflated, numbers.Real):
+        return int(math.ceil(inflated))
+    return cast("IntOrArray", _numpy().ceil(inflated).astype("int64"))
 
 
 __all__ = [
@@ -9,9 +9,12 @@ noncentral ``t`` behaviour should opt into SciPy support.
 
 from __future__ import annotations
 
+import functools
 import math
+from collections.abc import Callable, Sequence
 from typing import Literal
 
+from .._scipy_backend import has_scipy
 from ..core import alloc, ncf, normal, solve
 
 Tail = Literal["two-sided", "greater", "less"]
@@ -38,6 +41,20 @@ def _validate_margin(ni_margin: float | None, ni_type: NIType | None) -> None:
             raise ValueError("ni_margin must be positive")
 
 
+@functools.lru_cache(maxsize=256)
+def _tost_quantile(alpha: float, df: float | None, scipy_active: bool) -> float:
+    """One-sided TOST critical value; ``df=None`` selects the normal quantile.
+
+    ``alpha`` is fixed for a solve and ``df`` only changes with the probed ``n``,
+    so the cache absorbs repeated quantile evaluations. ``scipy_active`` is part
+    of the key because the ``t`` quantile depends on the backend.
+    """
+
+    if df is None:
+        return normal.ppf(1.0 - alpha)
+    return ncf.t_ppf(1.0 - alpha, df)
+
+
 def _tost_bounds(
     alpha: float, margin: float, se: float, test: ZorT, df: float | None
 ) -> tuple[float, float]:
@@ -46,11 +63,9 @@ def _tost_bounds(
     if test == "t":
         if df is None:
             raise ValueError("df required for t-test")
-        q = ncf.t_ppf(1.0 - alpha, df)
-    elif test == "z":
-        q = normal.ppf(1.0 - alpha)
-    else:
+    elif test != "z":
         raise ValueError(f"unsupported test type: {test}")
+    q = _tost_quantile(alpha, df if test == "t" else None, has_scipy())
     lower = q - margin / se
     upper = -q + margin / se
     if lower >= upper:
@@ -59,14 +74,86 @@ def _tost_bounds(
     return lower, upper
 
 
-def _power_location(effect: float, alpha: float, tail: Tail, test: ZorT, df: float | None) -> float:
-    if test == "t":
-        if df is None:
-            raise ValueError("df required for t distribution")
-        return ncf.power_noncentral_t(effect, df, alpha, tail)
-    if test == "z":
-        return ncf.power_normal(effect, alpha, tail)
-    raise ValueError(f"unsupported test: {test}")
+def _initial_guess(
+    delta: float,
+    scale: float,
+    alpha: float,
+    power: float,
+    tail: Tail,
+    ni_margin: float | None,
+    ni_type: NIType | None,
+    t_correction: float = 0.0,
+) -> int | None:
+    """Closed-form z-approximation used to seed the integer solver.
+
+    ``t_correction`` applies Guenther's adjustment for the exact noncentral
+    ``t`` path: ``t_correction * z_alpha**2`` extra observations (1/4 per group
+    for two samples, 1/2 for one sample) bring the seed within an observation
+    or so of the exact answer.
+    """
+
+    if ni_type == "equivalence":
+        assert ni_margin is not None
+        if ni_margin <= abs(delta):
+            return None
+        # Both one-sided tests bind when delta == 0, otherwise only the nearer one
+        z_beta = normal.ppf(1.0 - (1.0 - power) / 2.0) if delta == 0 else normal.ppf(power)
+        return solve.normal_approx_n(ni_margin - abs(delta), normal.ppf(1.0 - alpha), z_beta, scale)
+    if ni_type == "noninferiority":
+        assert ni_margin is not None
+        delta = delta + ni_margin if tail == "greater" else delta - ni_margin
+    z_alpha = normal.ppf(1.0 - alpha / 2.0) if tail == "two-sided" else normal.ppf(1.0 - alpha)
+    n = solve.normal_approx_n(delta, z_alpha, normal.ppf(power), scale)
+    if n is None or not t_correction:
+        return n
+    return n + math.ceil(t_correction * z_alpha * z_alpha)
+
+
+def _t_correction(test: ZorT, per_sample: float) -> float:
+    """Guenther factor when the exact ``t`` evaluator is in play, else zero."""
+
+    return per_sample if test == "t" and has_scipy() else 0.0
+
+
+def _shifted(delta: float, ni_margin: float | None, ni_type: NIType | None, tail: Tail) -> float:
+    """Mean difference tested against zero, shifted by the non-inferiority margin."""
+
+    if ni_type != "noninferiority":
+        return delta
+    assert ni_margin is not None
+    return delta + ni_margin if tail == "greater" else delta - ni_margin
+
+
+def _solve_t_band(
+    location: Callable[[int], tuple[float, float] | None],
+    alpha: float,
+    power: float,
+    tail: Tail,
+    lower: int,
+    guess: int | None,
+) -> int | None:
+    """Solve a noncentral ``t`` design with one vectorised SciPy call, if possible.
+
+    ``location(n)`` returns ``(effect, df)`` or ``None`` when ``n`` is too small
+    to test (power 0). Returns ``None`` whenever the scalar solver is needed.
+    """
+
+    if guess is None or not has_scipy():
+        return None
+
+    def batch(candidates: Sequence[int]) -> list[float]:
+        points = [location(n) for n in candidates]
+        valid = [point for point in points if point is not None]
+        powers = iter(
+            ncf.power_noncentral_t_vec(
+                [point[0] for point in valid], [point[1] for point in valid], alpha, tail
+            )
+            if valid
+            else []
+        )
+        return [0.0 if point is None else next(powers) for point in points]
+
+    return solve.solve_monotone_band(batch, power, guess, lower=lower)
 
 
 def _power_equivalence(
@@ -83,7 +170,7 @@ def _power_equivalence(
         lower, upper = _tost_bounds(alpha, margin, se, test, df)
         if lower >= upper:
             return 0.0
-        return ncf.nct_cdf(upper, df, effect) - ncf.nct_cdf(lower, df, effect)
+        return ncf.nct_cdf_interval(lower, upper, df, effect)
     if test == "z":
         lower, upper = _tost_bounds(alpha, margin, se, test, None)
         if lower >= upper:
@@ -127,42 +214,68 @@ def n_mean(
         raise ValueError("noninferiority tests must specify one-sided tail")
 
     delta = mu2 - mu1
-
-    def evaluator(n1: int) -> float:
-        n1i = max(n1, 2 if test == "t" else 1)
-        n1i, n2i = alloc.groups_from_n1(n1i, ratio)
-        if test == "t" and (n1i < 2 or n2i < 2):
-            return 0.0
+    # Branches that are fixed for the whole solve are resolved here, once, so
+    # each evaluator is straight-line arithmetic plus one power call.
+    shift = _shifted(delta, ni_margin, ni_type, tail)
+
+    def location(n1: int) -> tuple[float, float] | None:
+        n1i, n2i = alloc.groups_from_n1(max(n1, 2), ratio)
+        if n1i < 2 or n2i < 2:
+            return None
         se = sd * math.sqrt(1.0 / n1i + 1.0 / n2i)
-        df = n1i + n2i - 2 if test == "t" else None
-        if ni_type is None:
-            effect = delta / se
-            return _power_location(effect, alpha, tail, test, df)
-        if ni_type == "noninferiority":
-            assert ni_margin is not None
-            if tail == "greater":
-                effect = (delta + ni_margin) / se
-            else:  # tail == "less"
-                effect = (delta - ni_margin) / se
-            return _power_location(effect, alpha, tail, test, df)
-        # equivalence
+        return shift / se, n1i + n2i - 2
+
+    evaluator: solve.PowerFn
+    if ni_type == "equivalence":
         assert ni_margin is not None
-        effect = delta / se
-        return _power_equivalence(effect, se, alpha, test, df, ni_margin)
+        margin = ni_margin
 
-    n1_final = solve.solve_monotone_int(evaluator, power, lower=2 if test == "t" else 1)
+        def evaluator(n1: int) -> float:
+            n1i, n2i = alloc.groups_from_n1(max(n1, 2 if test == "t" else 1), ratio)
+            if test == "t" and (n1i < 2 or n2i < 2):
+                return 0.0
+            se = sd * math.sqrt(1.0 / n1i + 1.0 / n2i)
+            df = n1i + n2i - 2 if test == "t" else None
+            return _power_equivalence(delta / se, se, alpha, test, df, margin)
+
+    elif test == "t":
+
+        def evaluator(n1: int) -> float:
+            point = location(n1)
+            if point is None:
+                return 0.0
+            return ncf.power_noncentral_t(point[0], point[1], alpha, tail)
+
+    else:
+
+        def evaluator(n1: int) -> float:
+            n1i, n2i = alloc.groups_from_n1(max(n1, 1), ratio)
+            return ncf.power_normal(shift / (sd * math.sqrt(1.0 / n1i + 1.0 / n2i)), alpha, tail)
+
+    guess = _initial_guess(
+        delta,
+        sd * math.sqrt(1.0 + 1.0 / ratio),
+        alpha,
+        power,
+        tail,
+        ni_margin,
+        ni_type,
+        _t_correction(test, 0.25),
+    )
+    n1_final = None
+    if test == "t" and ni_type != "equivalence":
+        n1_final = _solve_t_band(location, alpha, power, tail, 2, guess)
+    if n1_final is None:
+        n1_final = solve.solve_monotone_int(
+            evaluator, power, lower=2 if test == "t" else 1, initial_guess=guess
+        )
     n1_final, n2_final = alloc.groups_from_n1(n1_final, ratio)
     if test == "t":
         n1_final = max(n1_final, 2)
         n2_final = max(n2_final, 2)
-        if not ncf.has_scipy():
-            boost = 1
-            while True:
-                candidate = alloc.groups_from_n1(n1_final + boost, ratio)
-                if candidate[0] > n1_final or candidate[1] > n2_final:
-                    n1_final, n2_final = candidate
-                    break
-                boost += 1
+        if not has_scipy():
+            # Conservative cushion: one more observation in the first group
+            n1_final, n2_final = alloc.groups_from_n1(n1_final + 1, ratio)
     return n1_final, n2_final
 
 
@@ -191,27 +304,38 @@ def n_paired(
     if ni_type == "noninferiority" and tail == "two-sided":
         raise ValueError("noninferiority requires one-sided tail")
 
-    def evaluator(n: int) -> float:
+    shift = _shifted(delta, ni_margin, ni_type, tail)
+
+    def location(n: int) -> tuple[float, float]:
         n_i = max(n, 2)
-        se = sd_diff / math.sqrt(n_i)
-        df = n_i - 1
-        if ni_type is None:
-            effect = delta / se
-            return _power_location(effect, alpha, tail, "t", df)
-        if ni_type == "noninferiority":
-            assert ni_margin is not None
-            if tail == "greater":
-                effect = (delta + ni_margin) / se
-            else:
-                effect = (delta - ni_margin) / se
-            return _power_location(effect, alpha, tail, "t", df)
+        return shift / (sd_diff / math.sqrt(n_i)), n_i - 1
+
+    evaluator: solve.PowerFn
+    if ni_type == "equivalence":
         assert ni_margin is not None
-        effect = delta / se
-        return _power_equivalence(effect, se, alpha, "t", df, ni_margin)
+        margin = ni_margin
+
+        def evaluator(n: int) -> float:
+            n_i = max(n, 2)
+            se = sd_diff / math.sqrt(n_i)
+            return _power_equivalence(delta / se, se, alpha, "t", n_i - 1, margin)
+
+    else:
 
-    n_final = solve.solve_monotone_int(evaluator, power, lower=2)
+        def evaluator(n: int) -> float:
+            effect, df = location(n)
+            return ncf.power_noncentral_t(effect, df, alpha, tail)
+
+    guess = _initial_guess(
+        delta, sd_diff, alpha, power, tail, ni_margin, ni_type, _t_correction("t", 0.5)
+    )
+    n_final = None
+    if ni_type != "equivalence":
+        n_final = _solve_t_band(location, alpha, power, tail, 2, guess)
+    if n_final is None:
+        n_final = solve.solve_monotone_int(evaluator, power, lower=2, initial_guess=guess)
     n_final = max(n_final, 2)
-    if not ncf.has_scipy():
+    if not has_scipy():
         n_final += 2
     return n_final
 
@@ -245,28 +369,45 @@ def n_one_sample_mean(
     if ni_type == "noninferiority" and tail == "two-sided":
         raise ValueError("noninferiority requires one-sided tail")
 
-    def evaluator(n: int) -> float:
-        n_i = max(n, 2 if test == "t" else 1)
-        se = sd / math.sqrt(n_i)
-        df = n_i - 1 if test == "t" else None
-        if ni_type is None:
-            effect = delta / se
-            return _power_location(effect, alpha, tail, test, df)
-        if ni_type == "noninferiority":
-            assert ni_margin is not None
-            if tail == "greater":
-                effect = (delta + ni_margin) / se
-            else:
-                effect = (delta - ni_margin) / se
-            return _power_location(effect, alpha, tail, test, df)
+    shift = _shifted(delta, ni_margin, ni_type, tail)
+
+    def location(n: int) -> tuple[float, float]:
+        n_i = max(n, 2)
+        return shift / (sd / math.sqrt(n_i)), n_i - 1
+
+    evaluator: solve.PowerFn
+    if ni_type == "equivalence":
         assert ni_margin is not None
-        effect = delta / se
-        return _power_equivalence(effect, se, alpha, test, df, ni_margin)
+        margin = ni_margin
+
+        def evaluator(n: int) -> float:
+            n_i = max(n, 2 if test == "t" else 1)
+            se = sd / math.sqrt(n_i)
+            df = n_i - 1 if test == "t" else None
+            return _power_equivalence(delta / se, se, alpha, test, df, margin)
+
+    elif test == "t":
+
+        def evaluator(n: int) -> float:
+            effect, df = location(n)
+            return ncf.power_noncentral_t(effect, df, alpha, tail)
+
+    else:
+
+        def evaluator(n: int) -> float:
+            return ncf.power_normal(shift / (sd / math.sqrt(max(n, 1))), alpha, tail)
 
     lower = 2 if test == "t" else 1
-    n_final = solve.solve_monotone_int(evaluator, power, lower=lower)
+    guess = _initial_guess(
+        delta, sd, alpha, power, tail, ni_margin, ni_type, _t_correction(test, 0.5)
+    )
+    n_final = None
+    if test == "t" and ni_type != "equivalence":
+        n_final = _solve_t_band(location, alpha, power, tail, lower, guess)
+    if n_final is None:
+        n_final = solve.solve_monotone_int(evaluator, power, lower=lower, initial_guess=guess)
     n_final = max(n_final, lower)
-    if test == "t" and not ncf.has_scipy():
+    if test == "t" and not has_scipy():
         n_final += 2
     return n_final
 
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import importlib
 import math
 import warnings
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from ..core import alloc, ncf, normal, solve
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike, NDArray
+
 Tail = Literal["two-sided", "greater", "less"]
 ZorT = Literal["z", "t"]
 NIType = Literal["noninferiority", "equivalence"]
@@ -294,12 +299,71 @@ def _z_alpha(alpha: float, two_sided: bool) -> float:
     return normal.ppf(1.0 - a)
 
 
+def _tail_critical(alpha: float, tail: Tail) -> float:
+    """Critical value as used by :func:`ncf.power_normal` for ``tail``."""
+    if tail == "two-sided":
+        return normal.ppf(1.0 - alpha / 2.0)
+    if tail == "greater":
+        return normal.ppf(1.0 - alpha)
+    return normal.ppf(alpha)
+
+
 def _z_beta(power: float) -> float:
     """Get z-value for power (1-beta)."""
     beta = 1.0 - power
     return normal.ppf(1.0 - beta)
 
 
+def _initial_guess(
+    delta: float,
+    scale_null: float,
+    scale_alt: float,
+    alpha: float,
+    power: float,
+    tail: Tail,
+    ni_margin: float | None,
+    ni_type: NIType | None,
+) -> int | None:
+    """Closed-form normal approximation used to seed the integer solver."""
+
+    if ni_type == "equivalence":
+        assert ni_margin is not None
+        if ni_margin <= abs(delta):
+            return None
+        # Both one-sided tests bind when delta == 0, otherwise only the nearer one
+        z_beta = _z_alpha(1.0 - power, two_sided=True) if delta == 0 else _z_beta(power)
+        return solve.normal_approx_n(
+            ni_margin - abs(delta), _z_alpha(alpha, False), z_beta, scale_null, scale_alt
+        )
+    if ni_type == "noninferiority":
+        assert ni_margin is not None
+        delta += ni_margin if tail == "greater" else -ni_margin
+    z_alpha = _z_alpha(alpha, tail == "two-sided")
+    return solve.normal_approx_n(delta, z_alpha, _z_beta(power), scale_null, scale_alt)
+
+
+def _two_prop_guess(
+    p1: float,
+    p2: float,
+    alpha: float,
+    power: float,
+    ratio: float,
+    tail: Tail,
+    ni_margin: float | None,
+    ni_type: NIType | None,
+) -> int | None:
+    """Seed for :func:`n_two_prop`, with the variance split the evaluator uses."""
+
+    if ni_type is None and ratio == 1.0:
+        p_bar = (p1 + p2) / 2.0
+        scale_null = math.sqrt(2.0 * p_bar * (1.0 - p_bar))
+        scale_alt = math.sqrt(p1 * (1.0 - p1) + p2 * (1.0 - p2))
+    else:
+        pooled = (p1 + p2 * ratio) / (1.0 + ratio)
+        scale_null = scale_alt = math.sqrt(pooled * (1.0 - pooled) * (1.0 + 1.0 / ratio))
+    return _initial_guess(p1 - p2, scale_null, scale_alt, alpha, power, tail, ni_margin, ni_type)
+
+
 def _round_up_even(x: float) -> int:
     """Round up to nearest integer, preserving library's rounding policy."""
     return int(math.ceil(x))
@@ -396,7 +460,11 @@ def n_one_sample_prop(
             return _power_score(delta + shift, se_null, alpha, tail)
         return _equivalence_power(delta, se_null, alpha, ni_margin)
 
-    n_final = solve.solve_monotone_int(evaluator, power, lower=2)
+    guess = None
+    if not exact:
+        scale = math.sqrt(p0 * (1.0 - p0))
+        guess = _initial_guess(p - p0, scale, scale, alpha, power, tail, ni_margin, ni_type)
+    n_final = solve.solve_monotone_int(evaluator, power, lower=2, initial_guess=guess)
     
     # Add warning for dubious normal approximation if not using exact method
     if not exact:
@@ -456,7 +524,29 @@ def n_two_prop(
             return _power_score(delta + shift, se, alpha, tail)
         return _equivalence_power(delta, se, alpha, ni_margin)
 
-    n1_final = solve.solve_monotone_int(evaluator, power, lower=2)
+    guess = None
+    if not exact:
+        guess = _two_prop_guess(p1, p2, alpha, power, ratio, tail, ni_margin, ni_type)
+    if not exact and ni_type is None:
+        # Fused kernel: same probes as solve_monotone_int without callable dispatch.
+        # Imported here so ``import statdesign`` does not load or compile Numba.
+        from ..core import _solvers_jit
+
+        n1_final = _solvers_jit.solve_two_prop_z(
+            p1,
+            p2,
+            float(ratio),
+            _tail_critical(alpha, tail),
+            _solvers_jit.TAIL_CODES[tail],
+            power,
+            2,
+            guess or 0,
+            1_000_000,
+        )
+        if n1_final < 0:
+            raise RuntimeError("Failed to bracket solution before reaching max sample size")
+    else:
+        n1_final = solve.solve_monotone_int(evaluator, power, lower=2, initial_guess=guess)
     n1_final, n2_final = alloc.groups_from_n1(n1_final, ratio)
     
     # Add warnings for dubious normal approximation if not using exact method
@@ -464,3 +554,66 @@ def n_two_prop(
         _check_normal_approximation_validity(p1, p2, n1_final, n2_final)
     
     return max(n1_final, 2), max(n2_final, 2)
+
+
+def n_two_prop_batch(
+    p1: ArrayLike,
+    p2: ArrayLike,
+    alpha: ArrayLike = 0.05,
+    power: ArrayLike = 0.80,
+    ratio: ArrayLike = 1.0,
+    tail: Tail = "two-sided",
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Vectorised :func:`n_two_prop` for many designs at once.
+
+    Inputs broadcast against each other and every element is solved exactly as
+    ``n_two_prop(..., test="z", exact=False)`` would, through one call into the
+    fused solver kernel (multi-threaded when Numba is installed). Margin-based
+    and exact designs are not supported, and the per-design normal
+    approximation warnings are not emitted. Requires NumPy.
+    """
+
+    try:
+        np = importlib.import_module("numpy")
+    except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError(
+            "n_two_prop_batch requires numpy; install statdesign[scipy] or add numpy\n"
+            "to your environment."
+        ) from exc
+
+    if tail not in {"two-sided", "greater", "less"}:
+        raise ValueError(f"unsupported tail: {tail}")
+    arrays = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for value in (p1, p2, alpha, power, ratio))
+    )
+    p1_a, p2_a, alpha_a, power_a, ratio_a = (np.ascontiguousarray(a).ravel() for a in arrays)
+    shape = arrays[0].shape
+    for values, name in ((p1_a, "p1"), (p2_a, "p2")):
+        if not ((values > 0) & (values < 1)).all():
+            raise ValueError(f"{name} must be in (0, 1)")
+    if not ((alpha_a > 0) & (alpha_a < 1)).all():
+        raise ValueError("alpha must be in (0, 1)")
+    if not ((power_a > 0) & (power_a < 1)).all():
+        raise ValueError("power must be in (0, 1)")
+    if not (ratio_a > 0).all():
+        raise ValueError("ratio must be positive")
+
+    # Quantiles are evaluated once per distinct alpha/power, as the scalar path would
+    two_sided = tail == "two-sided"
+    crit_of = {a: _tail_critical(a, tail) for a in set(alpha_a.tolist())}
+    z_alpha_of = {a: _z_alpha(a, two_sided) for a in crit_of}
+    z_beta_of = {p: _z_beta(p) for p in set(power_a.tolist())}
+    crit = np.array([crit_of[a] for a in alpha_a.tolist()])
+    z_alpha = np.array([z_alpha_of[a] for a in alpha_a.tolist()])
+    z_beta = np.array([z_beta_of[p] for p in power_a.tolist()])
+
+    from ..core import _solvers_jit
+
+    n1 = np.empty(p1_a.shape[0], dtype=np.int64)
+    _solvers_jit.solve_two_prop_z_batch(
+        p1_a, p2_a, ratio_a, crit, z_alpha, z_beta, power_a, _solvers_jit.TAIL_CODES[tail], n1
+    )
+    if (n1 < 0).any():
+        raise RuntimeError("Failed to bracket solution before reaching max sample size")
+    n2 = np.maximum(np.ceil(n1 * ratio_a).astype(np.int64), 1)
+    return np.maximum(n1, 2).reshape(shape), np.maximum(n2, 2).reshape(shape)
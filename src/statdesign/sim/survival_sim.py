@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import math
+import functools
 from dataclasses import dataclass
 from typing import Literal
 
@@ -16,12 +16,13 @@ except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
 
 
 from ..core import normal
+from ._logrank_jit import HAS_NUMBA, logrank_rows
 
 Tail = Literal["two-sided", "greater", "less"]
 EntryDistribution = Literal["uniform", "instant"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SurvivalDesign:
     n_exp: int
     n_ctrl: int
@@ -35,74 +36,137 @@ class SurvivalDesign:
     tail: Tail = "two-sided"
 
 
-def _sample_entry(rng: np.random.Generator, design: SurvivalDesign, size: int) -> np.ndarray:
-    if design.entry_distribution == "instant":
-        return np.zeros(size)
-    if design.accrual_years <= 0:
+Shape = tuple[int, ...]
+
+# Upper bound on simulated subjects (reps x arm size) held in memory at once.
+_BLOCK_SUBJECTS = 1 << 20
+
+
+def _sample_entry(rng: np.random.Generator, accrual_years: float, size: Shape) -> np.ndarray:
+    if accrual_years <= 0:
         raise ValueError("uniform entry requires accrual_years > 0")
-    return rng.uniform(0.0, design.accrual_years, size=size)
+    return rng.uniform(0.0, accrual_years, size=size)
 
 
-def _sample_wait(rng: np.random.Generator, hazard: float, size: int) -> np.ndarray:
+def _sample_wait(rng: np.random.Generator, hazard: float, out: np.ndarray) -> np.ndarray:
+    """Fill ``out`` with exponential waits; same draws as ``rng.exponential(1 / hazard)``."""
+
     if hazard == 0.0:
-        return np.full(size, np.inf)
-    return rng.exponential(1.0 / hazard, size=size)
+        out.fill(np.inf)
+        return out
+    rng.standard_exponential(out=out)
+    out *= 1.0 / hazard
+    return out
 
 
 def _simulate_arm(
     rng: np.random.Generator,
-    n: int,
     hazard: float,
-    design: SurvivalDesign,
-) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    entry = _sample_entry(rng, design, n)
-    study_end = design.accrual_years + design.followup_years
-    follow_time = np.clip(study_end - entry, a_min=0.0, a_max=None)
-
-    event_wait = _sample_wait(rng, hazard, n)
-    dropout_wait = _sample_wait(rng, design.dropout_hazard, n)
-    observed_wait = np.minimum(np.minimum(event_wait, dropout_wait), follow_time)
-    event_indicator = (event_wait <= dropout_wait) & (event_wait <= follow_time)
-
-    calendar_time = entry + observed_wait
-    return calendar_time, event_indicator.astype(float), entry
+    accrual_years: float,
+    study_end: float,
+    dropout_hazard: float,
+    entry_uniform: bool,
+    event_buffer: np.ndarray,
+    dropout_buffer: np.ndarray,
+    out_times: np.ndarray,
+    out_events: np.ndarray,
+) -> None:
+    """Simulate one arm, writing observed times and event flags into ``out_*``."""
+
+    size = event_buffer.shape
+    if entry_uniform:
+        entry: np.ndarray | float = _sample_entry(rng, accrual_years, size)
+        follow_time: np.ndarray | float = np.clip(study_end - entry, a_min=0.0, a_max=None)
+    else:
+        # Everyone enters at time zero, so follow-up is the same scalar for all
+        entry = 0.0
+        follow_time = max(study_end, 0.0)
+
+    event_wait = _sample_wait(rng, hazard, event_buffer)
+    np.minimum(event_wait, follow_time, out=out_times)
+    if dropout_hazard != 0.0:
+        dropout_wait = _sample_wait(rng, dropout_hazard, dropout_buffer)
+        np.minimum(out_times, dropout_wait, out=out_times)
+
+    # The event is observed iff it comes no later than dropout and end of
+    # follow-up, i.e. iff it is the minimum.
+    np.less_equal(event_wait, out_times, out=out_events)
+    out_times += entry
+
+
+def _row_searchsorted(rows: np.ndarray, values: np.ndarray, side: str) -> np.ndarray:
+    """``np.searchsorted`` applied row by row to a 2-D array of sorted rows."""
+
+    width = rows.shape[1]
+    lo = np.zeros(values.shape, dtype=np.intp)
+    hi = np.full(values.shape, width, dtype=np.intp)
+    for _ in range(width.bit_length()):
+        mid = (lo + hi) >> 1
+        probe = np.take_along_axis(rows, np.minimum(mid, width - 1), axis=1)
+        go_right = probe < values if side == "left" else probe <= values
+        active = lo < hi
+        lo = np.where(active & go_right, mid + 1, lo)
+        hi = np.where(active & ~go_right, mid, hi)
+    return lo
+
+
+def _prefix(values: np.ndarray) -> np.ndarray:
+    """Row-wise counts of 0/1 ``values`` before each position, as exact integers."""
+
+    out = np.zeros((values.shape[0], values.shape[1] + 1), dtype=np.int64)
+    np.cumsum(values, axis=1, out=out[:, 1:])
+    return out
+
+
+def _logrank_stat_batched(times: np.ndarray, events: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """Log-rank ``z`` for every row of ``(reps, n)`` times/events; ``groups`` is ``(n,)``.
+
+    ``events`` and ``groups`` hold 0/1 flags and may be boolean or numeric.
+    """
+
+    order = np.argsort(times, axis=1)
+    times_sorted = np.take_along_axis(times, order, axis=1)
+    events_sorted = np.take_along_axis(events.astype(bool, copy=False), order, axis=1)
+    groups_sorted = groups.astype(np.uint8, copy=False)[order]
+
+    # Prefix sums over each sorted row turn every per-time count into a
+    # difference of two lookups, so all event times are handled at once.
+    cum_exp = _prefix(groups_sorted)
+    cum_events = _prefix(events_sorted)
+    cum_exp_events = _prefix(groups_sorted * events_sorted)
+
+    first_at_risk = _row_searchsorted(times_sorted, times_sorted - 1e-12, "left")
+    tie_start = _row_searchsorted(times_sorted, times_sorted - 1e-12, "right")
+    tie_end = _row_searchsorted(times_sorted, times_sorted + 1e-12, "left")
+    first_equal = _row_searchsorted(times_sorted, times_sorted, "left")
+
+    def lookup(cum: np.ndarray, index: np.ndarray) -> np.ndarray:
+        return np.take_along_axis(cum, index, axis=1)
+
+    # Each distinct event time is represented by its first event in the row
+    distinct = events_sorted & (lookup(cum_events, first_equal) == cum_events[:, :-1])
+    n_total = times_sorted.shape[1] - first_at_risk
+    n_exp = cum_exp[:, -1:] - lookup(cum_exp, first_at_risk)
+    d_total = lookup(cum_events, tie_end) - lookup(cum_events, tie_start)
+    d_exp = lookup(cum_exp_events, tie_end) - lookup(cum_exp_events, tie_start)
+
+    keep = distinct & (n_total > 1) & (d_total > 0)
+    n_total = np.where(keep, n_total, 2).astype(float)
+    frac = n_exp / n_total
+    expected = d_total * frac
+    variance = d_total * frac * (1.0 - frac) * (n_total - d_total) / (n_total - 1.0)
+
+    obs_minus_exp = np.where(keep, d_exp - expected, 0.0).sum(axis=1)
+    var_sum = np.where(keep, variance, 0.0).sum(axis=1)
+    positive = var_sum > 0
+    return np.where(positive, obs_minus_exp / np.sqrt(np.where(positive, var_sum, 1.0)), 0.0)
 
 
 def _logrank_stat(times: np.ndarray, events: np.ndarray, groups: np.ndarray) -> float:
-    order = np.argsort(times)
-    times_sorted = times[order]
-    events_sorted = events[order]
-    groups_sorted = groups[order]
-
-    event_times = times_sorted[events_sorted == 1.0]
-    if event_times.size == 0:
-        return 0.0
-    unique_times = np.unique(event_times)
-
-    obs_minus_exp = 0.0
-    var_sum = 0.0
-    for t in unique_times:
-        at_risk = times_sorted >= (t - 1e-12)
-        n_total = at_risk.sum()
-        if n_total <= 1:
-            continue
-        n_exp = np.count_nonzero(groups_sorted[at_risk])
-        events_at_t = (np.abs(times_sorted - t) < 1e-12) & (events_sorted == 1.0)
-        d_total = events_at_t.sum()
-        if d_total == 0:
-            continue
-        d_exp = np.count_nonzero(groups_sorted[events_at_t])
-        frac = n_exp / n_total
-        expected = d_total * frac
-        variance = d_total * frac * (1.0 - frac)
-        variance *= (n_total - d_total) / (n_total - 1.0)
-        obs_minus_exp += d_exp - expected
-        var_sum += variance
-    if var_sum <= 0:
-        return 0.0
-    return float(obs_minus_exp / math.sqrt(var_sum))
+    return float(_logrank_stat_batched(times[np.newaxis], events[np.newaxis], groups)[0])
 
 
+@functools.lru_cache(maxsize=64)
 def _z_alpha(alpha: float, tail: Tail) -> float:
     if not 0 < alpha < 1:
         raise ValueError("alpha must be in (0, 1)")
@@ -125,7 +189,12 @@ def simulate_logrank_power(
     reps: int = 2000,
     seed: int | None = 12345,
 ) -> float:
-    """Monte Carlo estimate of log-rank power under exponential hazards."""
+    """Monte Carlo estimate of log-rank power under exponential hazards.
+
+    Seeded runs are deterministic, so their results are memoised per
+    ``(design, reps, seed)``; repeated calls while sweeping or plotting return
+    immediately. ``seed=None`` always draws a fresh simulation.
+    """
 
     if reps <= 0:
         raise ValueError("reps must be positive")
@@ -142,34 +211,86 @@ def simulate_logrank_power(
 
     _check_tail_hr(design.hr, design.tail)
 
+    if seed is None:
+        return _simulate(design, reps, None)
+    return _simulate_seeded(design, reps, seed)
+
+
+def _simulate(design: SurvivalDesign, reps: int, seed: int | None) -> float:
     rng = np.random.default_rng(seed)
     hazard_ctrl = design.base_hazard_ctrl
     hazard_exp = design.base_hazard_ctrl * design.hr
     z_crit = _z_alpha(design.alpha, design.tail)
 
-    rejections = 0
     total = design.n_exp + design.n_ctrl
     if total == 0:
         return 0.0
 
-    for _ in range(reps):
-        times_exp, events_exp, _ = _simulate_arm(rng, design.n_exp, hazard_exp, design)
-        times_ctrl, events_ctrl, _ = _simulate_arm(rng, design.n_ctrl, hazard_ctrl, design)
-
-        times = np.concatenate([times_exp, times_ctrl])
-        events = np.concatenate([events_exp, events_ctrl])
-        groups = np.concatenate([np.ones(design.n_exp), np.zeros(design.n_ctrl)])
+    # Bind design fields once; the block loop only sees locals
+    n_exp = design.n_exp
+    n_ctrl = design.n_ctrl
+    accrual = design.accrual_years
+    study_end = design.accrual_years + design.followup_years
+    dropout = design.dropout_hazard
+    entry_uniform = design.entry_distribution == "uniform"
+
+    groups = np.concatenate([np.ones(n_exp, dtype=np.uint8), np.zeros(n_ctrl, dtype=np.uint8)])
+    block = min(reps, max(1, _BLOCK_SUBJECTS // total))
+    # Exponential draws are generated into reusable scratch space shared by
+    # both arms and all blocks instead of fresh arrays per call.
+    scratch = np.empty((2, block * max(n_exp, n_ctrl)))
+    # Each arm writes straight into its columns of the per-block outputs, so
+    # no per-block concatenation is needed.
+    times_block = np.empty((block, total))
+    events_block = np.empty((block, total), dtype=bool)
+
+    def buffers(rows: int, n: int) -> tuple[np.ndarray, np.ndarray]:
+        return scratch[0, : rows * n].reshape(rows, n), scratch[1, : rows * n].reshape(rows, n)
 
-        z = _logrank_stat(times, events, groups)
+    rejections = 0
+    for start in range(0, reps, block):
+        rows = min(block, reps - start)
+        times = times_block[:rows]
+        events = events_block[:rows]
+        _simulate_arm(
+            rng,
+            hazard_exp,
+            accrual,
+            study_end,
+            dropout,
+            entry_uniform,
+            *buffers(rows, n_exp),
+            times[:, :n_exp],
+            events[:, :n_exp],
+        )
+        _simulate_arm(
+            rng,
+            hazard_ctrl,
+            accrual,
+            study_end,
+            dropout,
+            entry_uniform,
+            *buffers(rows, n_ctrl),
+            times[:, n_exp:],
+            events[:, n_exp:],
+        )
+
+        if HAS_NUMBA:
+            z = logrank_rows(times, events, groups)
+        else:
+            z = _logrank_stat_batched(times, events, groups)
         if design.tail == "two-sided":
-            reject = abs(z) > z_crit
+            reject = np.abs(z) > z_crit
         elif design.tail == "greater":
             reject = z < -z_crit
         else:  # tail == "less"
             reject = z > z_crit
-        rejections += int(reject)
+        rejections += int(np.count_nonzero(reject))
 
     return rejections / reps
 
 
+_simulate_seeded = functools.lru_cache(maxsize=1024)(_simulate)
+
+
 __all__ = ["SurvivalDesign", "simulate_logrank_power"]
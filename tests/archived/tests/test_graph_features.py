@@ -8,8 +8,9 @@ without requiring an actual STRING database file.
 
 import os
 import tempfile
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
+import networkx as nx
 import numpy as np
 import pytest
 from graph_features import TargetGraphFeaturizer, augment_features_with_graph
@@ -79,20 +80,13 @@ class TestTargetGraphFeaturizer:
         with pytest.raises(ValueError, match="Network not loaded"):
             featurizer.extract_features(target_proteins)
 
-    @patch("networkx.Graph")
     @patch("builtins.open")
-    def test_mock_feature_extraction(self, mock_open, mock_graph):
-        """Test feature extraction with mocked network."""
-        # Create a mock graph
-        mock_graph_instance = MagicMock()
-        mock_graph.return_value = mock_graph_instance
-
-        # Mock graph properties
-        mock_graph_instance.number_of_nodes.return_value = 100
-        mock_graph_instance.number_of_edges.return_value = 500
-        mock_graph_instance.__contains__ = lambda self, protein: protein in ["TP53", "EGFR"]
-        mock_graph_instance.neighbors = lambda protein: ["NEIGHBOR1", "NEIGHBOR2"]
-        mock_graph_instance.degree = lambda protein: 10
+    def test_mock_feature_extraction(self, mock_open):
+        """Test feature extraction with mocked feature computations."""
+        # Small network standing in for STRING
+        graph = nx.Graph()
+        graph.add_edge("TP53", "EGFR", weight=0.9)
+        graph.add_edge("EGFR", "BRCA1", weight=0.85)
 
         # Mock file content
         mock_file_content = """protein1 protein2 combined_score
@@ -108,7 +102,6 @@ class TestTargetGraphFeaturizer:
         with (
             patch.object(featurizer, "_compute_centrality_features") as mock_centrality,
             patch.object(featurizer, "_compute_neighborhood_features") as mock_neighborhood,
-            patch.object(featurizer, "_compute_proximity_features") as mock_proximity,
         ):
             # Set up mock returns
             n_proteins = 3
@@ -128,9 +121,6 @@ class TestTargetGraphFeaturizer:
                 "pathway_participation_score": np.array([0.3, 0.4, 0]),
                 "hub_proximity_score": np.array([0.25, 0.35, 0]),
                 "bridge_score": np.array([0.1, 0.2, 0]),
-            }
-
-            mock_proximity.return_value = {
                 "disease_gene_proximity_1hop": np.array([2, 3, 0]),
                 "disease_gene_proximity_2hop": np.array([5, 7, 0]),
                 "drugged_target_proximity_1hop": np.array([1, 2, 0]),
@@ -140,7 +130,7 @@ class TestTargetGraphFeaturizer:
             target_proteins = ["TP53", "EGFR", "UNKNOWN"]
 
             # Mock the graph loading
-            featurizer.graph = mock_graph_instance
+            featurizer.graph = graph
 
             features = featurizer.extract_features(target_proteins)
 
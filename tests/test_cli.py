@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from io import StringIO
 
 import pytest
@@ -81,6 +81,21 @@ def test_cli_invalid_probability() -> None:
     assert "0.0<=x<=1.0" in err
 
 
+@pytest.mark.usefixtures("reset_cli_state")
+def test_cli_emit_errors_use_exit_codes(monkeypatch: pytest.MonkeyPatch) -> None:
+    def failing_emitter(settings: cli.OutputSettings) -> Callable[[dict[str, object]], None]:
+        def emit(payload: dict[str, object]) -> None:
+            raise ValueError("payload could not be serialised")
+
+        return emit
+
+    monkeypatch.setattr(cli, "_select_emitter", failing_emitter)
+    code, out, err = run_cli(["bh_thresholds", "--m", "3"])
+    assert code == 2
+    assert out == ""
+    assert "payload could not be serialised" in err
+
+
 @pytest.mark.usefixtures("reset_cli_state")
 def test_cli_mean_fallback_conservative(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.delenv("STATDESIGN_AUTO_SCIPY", raising=False)
@@ -114,3 +129,4 @@ def reset_cli_state(monkeypatch: pytest.MonkeyPatch) -> None:
 
     monkeypatch.delenv("STATDESIGN_AUTO_SCIPY", raising=False)
     monkeypatch.setattr(cli, "_SETTINGS", cli.OutputSettings(), raising=False)
+    monkeypatch.setattr(cli, "_EMIT", cli._emit_json, raising=False)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+
 import pytest
 
 from statdesign import api, multiplicity
@@ -61,6 +63,27 @@ class TestNormalModule:
         result_mid = normal.ppf(0.5)
         assert abs(result_mid) < 0.01
 
+    def test_normal_ppf_cache(self) -> None:
+        """Test that cached quantiles match the uncached computation."""
+        from statistics import NormalDist, StatisticsError
+
+        normal._PPF_CACHE.clear()
+        first = normal.ppf(0.975)
+        assert 0.975 in normal._PPF_CACHE
+        assert normal.ppf(0.975) == first == NormalDist().inv_cdf(0.975)
+        with pytest.raises(StatisticsError):
+            normal.ppf(1.5)
+        assert 1.5 not in normal._PPF_CACHE
+
+    def test_normal_cdf_matches_normaldist(self) -> None:
+        """Test that the inlined CDF is bit-identical to NormalDist."""
+        from statistics import NormalDist
+
+        reference = NormalDist()
+        for x in (-38.5, -7.0, -1.96, -0.3, 0.0, 1e-300, 0.84, 2.5, 9.0):
+            assert normal.cdf(x) == reference.cdf(x)
+            assert normal.sf(x) == 1.0 - reference.cdf(x)
+
     def test_normal_cdf_edge_cases(self) -> None:
         """Test normal cumulative distribution function."""
         # Test extreme values
@@ -120,6 +143,60 @@ class TestSolveModule:
         result_high = solve.solve_monotone_int(high_func, 0.8, lower=1)
         assert result_high == 2
 
+    def test_solve_initial_guess(self) -> None:
+        """Test that seeding the solver does not change the minimal n."""
+
+        def step_func(n: int) -> float:
+            return n / 1000.0
+
+        expected = solve.solve_monotone_int(step_func, 0.5, lower=1)
+        for guess in (1, 2, 499, 500, 501, 700, 5000):
+            result = solve.solve_monotone_int(step_func, 0.5, lower=1, initial_guess=guess)
+            assert result == expected
+
+        with pytest.raises(RuntimeError):
+            solve.solve_monotone_int(lambda n: 0.1, 0.5, initial_guess=10, max_value=100)
+
+    def test_solve_initial_guess_nan_probe(self) -> None:
+        """Test that a NaN probe near the guess does not skip past the answer."""
+
+        def gappy_func(n: int) -> float:
+            return math.nan if n == 6 else n / 10.0
+
+        for guess in (4, 6, 7):
+            assert solve.solve_monotone_int(gappy_func, 0.5, lower=2, initial_guess=guess) == 5
+
+    def test_solve_upper_hint(self) -> None:
+        """Test that an upper hint on either side of the answer is harmless."""
+
+        def step_func(n: int) -> float:
+            return n / 1000.0
+
+        for hint in (1, 100, 500, 501, 4000):
+            assert solve.solve_monotone_int(step_func, 0.5, lower=1, upper_hint=hint) == 500
+
+    def test_normal_approx_n(self) -> None:
+        """Test the closed-form seed for the solver."""
+        z = normal.ppf(0.975) + normal.ppf(0.8)
+        assert solve.normal_approx_n(0.5, normal.ppf(0.975), normal.ppf(0.8)) == math.ceil(
+            (z / 0.5) ** 2
+        )
+        assert solve.normal_approx_n(0.0, 1.96, 0.84) is None
+
+    def test_solve_monotone_band(self) -> None:
+        """Test reading the answer off a batched band evaluation."""
+
+        def batch(ns: list[int]) -> list[float]:
+            return [n / 1000.0 for n in ns]
+
+        assert solve.solve_monotone_band(batch, 0.5, guess=503) == 500
+        assert solve.solve_monotone_band(batch, 0.5, guess=497) == 500
+        # Crossing outside the band, or at its unconfirmed first element
+        assert solve.solve_monotone_band(batch, 0.5, guess=300) is None
+        assert solve.solve_monotone_band(batch, 0.5, guess=520) is None
+        assert solve.solve_monotone_band(batch, 0.5, guess=3, lower=600) == 600
+        assert solve.solve_monotone_band(lambda ns: [math.nan] * len(ns), 0.5, guess=10) is None
+
     def test_solve_validation(self) -> None:
         """Test solver input validation."""
 
@@ -284,3 +284,44 @@ class TestIntegration:
         # With high ICC and many measurements, should have substantial inflation
         assert de > 2.0  # Should be > 1 + (6-1)*0.4 = 3.0
         assert n_total > 2 * n_individual
+
+
+class TestArrayInputs:
+    """Tests for vectorised design effect evaluation."""
+
+    def test_cluster_equal_grid_matches_scalar(self) -> None:
+        """Test that broadcasting over an m x ICC grid matches scalar calls."""
+        np = pytest.importorskip("numpy")
+        m = np.array([[2.0], [10.0], [25.0]])
+        icc = np.array([0.0, 0.05, 0.2])
+        result = design_effects.design_effect_cluster_equal(m=m, icc=icc)
+        assert result.shape == (3, 3)
+        for i, m_i in enumerate(m[:, 0]):
+            for j, icc_j in enumerate(icc):
+                expected = design_effects.design_effect_cluster_equal(float(m_i), float(icc_j))
+                assert result[i, j] == pytest.approx(expected)
+
+    def test_unequal_and_repeated_accept_lists(self) -> None:
+        """Test that plain sequences are treated as arrays."""
+        np = pytest.importorskip("numpy")
+        unequal = design_effects.design_effect_cluster_unequal(mbar=[10.0, 20.0], icc=0.05, cv=0.4)
+        repeated = design_effects.design_effect_repeated_cs(k=[1, 4], icc=0.3)
+        np.testing.assert_allclose(unequal, [1.0 + 0.05 * (9.0 + 0.16), 1.0 + 0.05 * (19.0 + 0.16)])
+        np.testing.assert_allclose(repeated, [1.0, 1.9])
+
+    def test_inflate_returns_integer_array(self) -> None:
+        """Test that array inflation rounds up elementwise."""
+        np = pytest.importorskip("numpy")
+        result = design_effects.inflate_n_by_de([100, 200], np.array([1.45, 2.0]))
+        assert result.dtype == np.int64
+        assert result.tolist() == [145, 400]
+
+    def test_array_validation(self) -> None:
+        """Test that any invalid element rejects the whole array."""
+        np = pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="icc must be in"):
+            design_effects.design_effect_cluster_equal(m=5.0, icc=np.array([0.1, 1.0]))
+        with pytest.raises(ValueError, match="m must be positive"):
+            design_effects.design_effect_cluster_equal(m=np.array([5.0, 0.0]), icc=0.1)
+        with pytest.raises(ValueError, match="k must be at least 1"):
+            design_effects.design_effect_repeated_cs(k=[0, 2], icc=0.1)
@@ -106,4 +106,45 @@ def test_one_sample_validation():
         n_one_sample_mean(delta=0.5, sd=-1.0, alpha=0.05, power=0.8)
     
     with pytest.raises(ValueError, match="test must be"):
-        n_one_sample_mean(delta=0.5, sd=1.0, alpha=0.05, power=0.8, test="invalid")
\ No newline at end of file
+        n_one_sample_mean(delta=0.5, sd=1.0, alpha=0.05, power=0.8, test="invalid")
+
+
+def test_tost_quantile_cache():
+    """Test that repeated equivalence solves reuse cached TOST quantiles."""
+    from statdesign.endpoints import means
+
+    means._tost_quantile.cache_clear()
+    first = n_mean(mu1=0.0, mu2=0.1, sd=1.0, ni_margin=0.5, ni_type="equivalence")
+    misses = means._tost_quantile.cache_info().misses
+    assert n_mean(mu1=0.0, mu2=0.1, sd=1.0, ni_margin=0.5, ni_type="equivalence") == first
+    info = means._tost_quantile.cache_info()
+    assert info.misses == misses
+    assert info.hits >= misses
+
+
+def test_initial_guess_t_correction():
+    """Test that Guenther's correction pads the seed for the exact t path."""
+    from statdesign.endpoints import means
+
+    base = means._initial_guess(0.5, 1.0, 0.05, 0.8, "two-sided", None, None)
+    padded = means._initial_guess(0.5, 1.0, 0.05, 0.8, "two-sided", None, None, 0.5)
+    assert base is not None
+    assert padded == base + 2
+
+
+@pytest.mark.parametrize(
+    "solve",
+    [
+        lambda: n_paired(delta=3.0, sd_diff=1.0, alpha=0.01, power=0.8),
+        lambda: n_one_sample_mean(delta=3.0, sd=1.0, alpha=0.01, power=0.8),
+        lambda: n_paired(delta=0.4, sd_diff=1.0, power=0.9, tail="greater"),
+        lambda: n_mean(mu1=0.0, mu2=0.5, sd=1.0, test="t"),
+    ],
+)
+def test_initial_guess_does_not_change_n(monkeypatch, solve):
+    """Test that seeding the solver leaves the solved sample size unchanged."""
+    from statdesign.endpoints import means
+
+    seeded = solve()
+    monkeypatch.setattr(means, "_initial_guess", lambda *args: None)
+    assert solve() == seeded
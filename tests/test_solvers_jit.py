@@ -0,0 +1,124 @@
+"""Tests for the fused two-proportion solver kernels."""
+
+from __future__ import annotations
+
+import pytest
+
+from statdesign.core import _solvers_jit, alloc, solve
+from statdesign.endpoints import proportions
+
+
+@pytest.mark.parametrize("tail", ["two-sided", "greater", "less"])
+@pytest.mark.parametrize("ratio", [0.5, 1.0, 2.0])
+def test_power_kernel_matches_python_evaluator(tail: str, ratio: float) -> None:
+    """Test that the kernel reproduces the corrected normal power exactly."""
+    crit = proportions._tail_critical(0.05, tail)  # type: ignore[arg-type]
+    code = _solvers_jit.TAIL_CODES[tail]
+    for n1 in (2, 17, 150, 1200):
+        n1i, n2i = alloc.groups_from_n1(n1, ratio)
+        expected = proportions._power_two_prop_corrected(0.3, 0.45, n1i, n2i, 0.05, tail)  # type: ignore[arg-type]
+        assert _solvers_jit.power_two_prop_z(n1, 0.3, 0.45, ratio, crit, code) == expected
+
+
+@pytest.mark.parametrize("guess", [0, 1, 50, 400, 5000])
+def test_solve_kernel_matches_generic_solver(guess: int) -> None:
+    """Test that the fused search returns the generic solver's answer."""
+    crit = proportions._tail_critical(0.05, "two-sided")
+
+    def evaluator(n1: int) -> float:
+        return _solvers_jit.power_two_prop_z(n1, 0.6, 0.5, 1.0, crit, 0)
+
+    expected = solve.solve_monotone_int(evaluator, 0.8, lower=2)
+    result = _solvers_jit.solve_two_prop_z(0.6, 0.5, 1.0, crit, 0, 0.8, 2, guess, 1_000_000)
+    assert result == expected
+
+
+_GRID = [
+    (p1, p2, ratio, alpha, power)
+    for p1, p2 in ((0.3, 0.45), (0.6, 0.5), (0.05, 0.12), (0.9, 0.7), (0.5, 0.51))
+    for ratio in (0.5, 1.0, 3.0)
+    for alpha, power in ((0.05, 0.8), (0.01, 0.95), (0.1, 0.5))
+]
+
+
+@pytest.mark.parametrize("tail", ["two-sided", "greater", "less"])
+def test_kernel_copies_match_python_over_grid(tail: str) -> None:
+    """Test that the kernel seed and search stay in step with their Python originals."""
+    code = _solvers_jit.TAIL_CODES[tail]
+    for p1, p2, ratio, alpha, power in _GRID:
+        guess = proportions._two_prop_guess(p1, p2, alpha, power, ratio, tail, None, None)  # type: ignore[arg-type]
+        z_alpha = proportions._z_alpha(alpha, tail == "two-sided")
+        kernel_guess = _solvers_jit._guess_two_prop_z(
+            p1, p2, ratio, z_alpha, proportions._z_beta(power)
+        )
+        assert kernel_guess == (guess or 0)
+
+        crit = proportions._tail_critical(alpha, tail)  # type: ignore[arg-type]
+
+        def evaluator(n1: int, design: tuple[float, ...] = (p1, p2, ratio, crit)) -> float:
+            return _solvers_jit.power_two_prop_z(n1, *design, code)
+
+        try:
+            expected = solve.solve_monotone_int(evaluator, power, lower=2, initial_guess=guess)
+        except RuntimeError:
+            expected = -1
+        result = _solvers_jit.solve_two_prop_z(
+            p1, p2, ratio, crit, code, power, 2, guess or 0, 1_000_000
+        )
+        assert result == expected
+
+
+def test_solve_kernel_reports_unbracketed() -> None:
+    """Test that an unreachable target is signalled with -1."""
+    crit = proportions._tail_critical(0.05, "two-sided")
+    assert _solvers_jit.solve_two_prop_z(0.5, 0.5, 1.0, crit, 0, 0.8, 2, 0, 1000) == -1
+
+
+def test_batch_matches_scalar_api() -> None:
+    """Test that the batch entry point agrees with per-design calls."""
+    np = pytest.importorskip("numpy")
+    from statdesign import api
+
+    p1 = np.array([0.6, 0.45, 0.25, 0.8])
+    p2 = np.array([0.5, 0.3, 0.2, 0.6])
+    ratio = np.array([1.0, 2.0, 0.5, 1.0])
+    for tail, sign in (("two-sided", 1.0), ("greater", 1.0), ("less", -1.0)):
+        lo, hi = (p1, p2) if sign > 0 else (p2, p1)
+        n1, n2 = api.n_two_prop_batch(
+            lo, hi, alpha=0.05, power=[0.8, 0.9, 0.8, 0.85], ratio=ratio, tail=tail
+        )
+        for i in range(p1.size):
+            expected = api.n_two_prop(
+                float(lo[i]),
+                float(hi[i]),
+                power=[0.8, 0.9, 0.8, 0.85][i],
+                ratio=float(ratio[i]),
+                tail=tail,  # type: ignore[arg-type]
+            )
+            assert (int(n1[i]), int(n2[i])) == expected
+
+
+def test_batch_validation() -> None:
+    """Test that invalid elements and unreachable designs are rejected."""
+    pytest.importorskip("numpy")
+    from statdesign import api
+
+    with pytest.raises(ValueError, match="p1 must be in"):
+        api.n_two_prop_batch([0.5, 1.2], 0.4)
+    with pytest.raises(RuntimeError, match="Failed to bracket"):
+        api.n_two_prop_batch([0.5, 0.4], [0.4, 0.4])
+
+
+def test_import_does_not_load_kernels() -> None:
+    """Test that importing the package defers loading the compiled kernels."""
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, statdesign, statdesign.endpoints.proportions\n"
+        "assert 'statdesign.core._solvers_jit' not in sys.modules\n"
+        "assert 'numba' not in sys.modules\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)  # noqa: S603
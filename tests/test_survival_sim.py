@@ -0,0 +1,113 @@
+"""Tests for the Monte Carlo log-rank simulator."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from statdesign.sim import survival_sim  # noqa: E402
+
+
+def _reference_logrank(times, events, groups) -> float:
+    """Straightforward per-event-time log-rank statistic."""
+    obs_minus_exp = 0.0
+    var_sum = 0.0
+    for t in np.unique(times[events == 1.0]):
+        at_risk = times >= t - 1e-12
+        n_total = at_risk.sum()
+        if n_total <= 1:
+            continue
+        n_exp = groups[at_risk].sum()
+        at_t = (np.abs(times - t) < 1e-12) & (events == 1.0)
+        d_total = at_t.sum()
+        frac = n_exp / n_total
+        obs_minus_exp += groups[at_t].sum() - d_total * frac
+        var_sum += d_total * frac * (1.0 - frac) * (n_total - d_total) / (n_total - 1.0)
+    if var_sum <= 0:
+        return 0.0
+    return obs_minus_exp / math.sqrt(var_sum)
+
+
+@pytest.mark.parametrize("decimals", [None, 1])
+def test_logrank_stat_matches_reference(decimals: int | None) -> None:
+    """Test the log-rank statistic with and without tied event times."""
+    rng = np.random.default_rng(7)
+    for _ in range(20):
+        n = int(rng.integers(2, 120))
+        times = rng.exponential(1.0, n)
+        if decimals is not None:
+            times = np.round(times, decimals)
+        events = (rng.random(n) < 0.7).astype(float)
+        groups = (rng.random(n) < 0.5).astype(float)
+        expected = _reference_logrank(times, events, groups)
+        assert survival_sim._logrank_stat(times, events, groups) == pytest.approx(
+            expected, abs=1e-12
+        )
+
+
+def test_logrank_stat_batched_matches_rows() -> None:
+    """Test that the batched statistic equals the per-row statistic."""
+    rng = np.random.default_rng(11)
+    times = np.round(rng.exponential(1.0, (25, 40)), 1)
+    events = (rng.random((25, 40)) < 0.6).astype(float)
+    groups = (rng.random(40) < 0.5).astype(float)
+    z = survival_sim._logrank_stat_batched(times, events, groups)
+    for row in range(times.shape[0]):
+        expected = _reference_logrank(times[row], events[row], groups)
+        assert z[row] == pytest.approx(expected, abs=1e-12)
+
+
+def test_simulate_logrank_power_reproducible() -> None:
+    """Test that a fixed seed yields the same plausible power estimate."""
+    design = survival_sim.SurvivalDesign(
+        n_exp=100,
+        n_ctrl=100,
+        accrual_years=2.0,
+        followup_years=1.0,
+        base_hazard_ctrl=0.1,
+        hr=0.7,
+    )
+    first = survival_sim.simulate_logrank_power(design, reps=200, seed=3)
+    assert survival_sim.simulate_logrank_power(design, reps=200, seed=3) == first
+    assert 0.0 < first < 1.0
+
+
+def test_logrank_kernel_matches_numpy() -> None:
+    """Test that the compiled per-row kernel agrees with the NumPy version."""
+    from statdesign.sim import _logrank_jit
+
+    rng = np.random.default_rng(13)
+    for decimals in (None, 1):
+        times = rng.exponential(1.0, (10, 30))
+        if decimals is not None:
+            times = np.round(times, decimals)
+        events = (rng.random((10, 30)) < 0.6).astype(float)
+        groups = (rng.random(30) < 0.5).astype(float)
+        expected = survival_sim._logrank_stat_batched(times, events, groups)
+        result = _logrank_jit.logrank_rows(times, events == 1.0, groups.astype(np.uint8))
+        np.testing.assert_allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_survival_design_is_frozen() -> None:
+    """Test that designs are immutable, hashable and slot-based."""
+    import dataclasses
+
+    design = survival_sim.SurvivalDesign(10, 10, 1.0, 1.0, 0.1, 0.7)
+    assert not hasattr(design, "__dict__")
+    assert hash(design) == hash(dataclasses.replace(design))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        design.hr = 0.5  # type: ignore[misc]
+
+
+def test_seeded_simulations_are_memoised() -> None:
+    """Test that repeated seeded runs hit the cache and unseeded runs bypass it."""
+    design = survival_sim.SurvivalDesign(30, 30, 1.0, 1.0, 0.3, 0.6)
+    survival_sim._simulate_seeded.cache_clear()
+    first = survival_sim.simulate_logrank_power(design, reps=50, seed=1)
+    assert survival_sim.simulate_logrank_power(design, reps=50, seed=1) == first
+    assert survival_sim._simulate_seeded.cache_info().hits == 1
+    survival_sim.simulate_logrank_power(design, reps=50, seed=None)
+    assert survival_sim._simulate_seeded.cache_info().currsize == 1